@@ -0,0 +1,120 @@
+import argparse
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from Dough import Dough
+from GeneticAlgorithm import as_seed_sequence
+from Solvers import accepts_seed, default_biscuits, get_solver
+
+
+def iter_rolls(source):
+    '''
+    Iterate over the rolls of a batch.
+
+    Parameters:
+    - source (str or iterable): A directory of defects.csv-format files (the roll id is the file name without
+      extension), or an iterable of (roll_id, defects) where defects is a CSV path or a list of (position, class).
+
+    Returns:
+    - iterator: Tuples (roll_id, defects), produced lazily.
+    '''
+    if isinstance(source, (str, os.PathLike)):
+        for name in sorted(os.listdir(source)):
+            if name.endswith('.csv'):
+                yield os.path.splitext(name)[0], os.path.join(source, name)
+    else:
+        yield from source
+
+
+def solve_roll(roll_id, defects, length, solver, biscuits, solver_kwargs):
+    '''
+    Build the dough of one roll and solve it. Runs inside a worker process.
+
+    Parameters:
+    - roll_id: Identifier of the roll.
+    - defects (str or list): Path of a defects.csv-format file, or a list of (position, class).
+    - length (int): Length of the dough.
+    - solver (str or callable): Solver name from Solvers.SOLVERS, or a picklable solver function.
+    - biscuits (dict): Dictionary of Biscuit objects indexed by their type.
+    - solver_kwargs (dict): Optional settings forwarded to the solver.
+
+    Returns:
+    - tuple: (roll_id, placement, value, runtime), runtime being the seconds spent solving, loading excluded.
+    '''
+    if isinstance(defects, (str, os.PathLike)):
+        dough = Dough.from_csv(defects, length)
+    else:
+        positions = [position for position, _ in defects]
+        dough = Dough.from_arrays(positions, [defect_class for _, defect_class in defects], length)
+    start = time.perf_counter()
+    value, placement = get_solver(solver)(dough, biscuits, **solver_kwargs)
+    return roll_id, placement, value, time.perf_counter() - start
+
+
+def solve_batch(rolls, length, solver='dp', biscuits=None, workers=None, max_pending=None, seed=None, **solver_kwargs):
+    '''
+    Solve many dough rolls across a pool of worker processes, yielding results as they complete.
+
+    Rolls are read lazily and at most max_pending of them are in flight at any time, so memory stays
+    flat whatever the size of the batch.
+
+    Parameters:
+    - rolls (str or iterable): A directory of CSV files, or an iterable of (roll_id, defects), see iter_rolls.
+    - length (int): Length of every dough roll.
+    - solver (str or callable): Solver name from Solvers.SOLVERS, or a picklable solver function.
+    - biscuits (dict, optional): Dictionary of Biscuit objects indexed by their type. Defaults to types 0 to 3.
+    - workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+    - max_pending (int, optional): Maximum number of rolls submitted but not yet returned. Defaults to twice the workers.
+    - seed (int or np.random.SeedSequence, optional): Seed of a randomized solver such as 'ga'. Each roll gets its own
+      stream spawned from it in reading order, so results do not depend on which worker solves which roll.
+      Ignored by solvers without a seed, such as 'dp'.
+    - **solver_kwargs: Optional settings forwarded to the solver.
+
+    Returns:
+    - iterator: Tuples (roll_id, placement, value, runtime) in completion order.
+    '''
+    get_solver(solver)  # Fail fast on unknown solver names
+    biscuits = biscuits or default_biscuits()
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+
+    seed_sequence = as_seed_sequence(seed) if seed is not None and accepts_seed(solver) else None
+    rolls = iter_rolls(rolls)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        exhausted = False
+        while pending or not exhausted:
+            # Top up the pool, but never hold more than max_pending rolls in flight
+            while not exhausted and len(pending) < max_pending:
+                roll = next(rolls, None)
+                if roll is None:
+                    exhausted = True
+                    break
+                roll_id, defects = roll
+                roll_kwargs = solver_kwargs
+                if seed_sequence is not None:
+                    roll_kwargs = dict(solver_kwargs, seed=seed_sequence.spawn(1)[0])
+                pending.add(executor.submit(solve_roll, roll_id, defects, length, solver, biscuits, roll_kwargs))
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Solve a directory of defects.csv-format rolls in parallel.")
+    parser.add_argument('directory', help="Directory containing one CSV file per roll")
+    parser.add_argument('--length', type=int, required=True, help="Length of every roll")
+    parser.add_argument('--solver', default='dp', help="Solver name (cp, dp, ga, greedy, greedy_value, greedy_valength, greedy_valengthdef)")
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    # One JSON line per roll, written as soon as it is solved
+    for roll_id, placement, value, runtime in solve_batch(args.directory, args.length, args.solver, workers=args.workers):
+        print(json.dumps({'roll_id': roll_id, 'value': value, 'runtime': runtime, 'placement': placement}), flush=True)
+
+
+if __name__ == "__main__":
+    main()
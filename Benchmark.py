@@ -0,0 +1,256 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+import numpy as np
+from Biscuit import DEFECT_CLASSES, Biscuit
+from Dough import Dough
+from DPSolver import DPSolver
+from GeneticAlgorithm import GeneticAlgorithm
+from GeneticElitism import GeneticElitism
+from GeneticTournament import GeneticTournament
+from UniformCrossoverGA import UniformCrossoverGA
+
+GA_VARIANTS = {
+    'GeneticAlgorithm': GeneticAlgorithm,
+    'GeneticElitism': GeneticElitism,
+    'GeneticTournament': GeneticTournament,
+    'UniformCrossoverGA': UniformCrossoverGA,
+}
+
+DEFAULT_CLASS_MIX = {'a': 1 / 3, 'b': 1 / 3, 'c': 1 / 3}
+
+
+def generate_roll(length, defect_density, class_mix=None, seed=None):
+    '''
+    Generate a synthetic dough roll with uniformly placed defects.
+
+    Parameters:
+    - length (int): Length of the dough.
+    - defect_density (float): Average number of defects per unit of dough.
+    - class_mix (dict, optional): Probability of each defect class. Defaults to equal shares of 'a', 'b' and 'c'.
+    - seed (int, optional): Seed of the generator, the same seed always gives the same roll.
+
+    Returns:
+    - Dough: The dough with its defects.
+    '''
+    class_mix = class_mix or DEFAULT_CLASS_MIX
+    rng = np.random.default_rng(seed)
+    count = int(round(length * defect_density))
+    classes = list(class_mix)
+    weights = np.array([class_mix[cls] for cls in classes], dtype=np.float64)
+    positions = rng.uniform(0, length, size=count)
+    defect_classes = rng.choice(classes, size=count, p=weights / weights.sum())
+    known_classes = tuple(dict.fromkeys(DEFECT_CLASSES + tuple(classes)))  # class_mix may add custom classes
+    return Dough.from_arrays(positions, defect_classes.tolist(), length, known_classes)
+
+
+def run_ga(variant, dough, biscuits, generations, population_size, mutation_rate, crossover_rate, seed=None,
+           local_search=None):
+    '''
+    Run a Genetic Algorithm variant for a fixed number of generations.
+
+    Parameters:
+    - variant (type): The GeneticAlgorithm class to run.
+    - dough (Dough): The dough object to place biscuits on.
+    - biscuits (dict): Dictionary of Biscuit objects indexed by their type.
+    - generations (int): Number of generations.
+    - population_size (int): Size of the population.
+    - mutation_rate (float): Rate of mutation.
+    - crossover_rate (float): Rate of crossover.
+    - seed (int, optional): Seed of the run, the same seed always gives the same result.
+    - local_search (str, optional): Memetic step of the GA, 'children' or 'elites'. Defaults to none.
+
+    Returns:
+    - dict: Best fitness found (None if no individual was valid), first generation reaching it, number of fitness
+      values requested and number actually computed (cache misses).
+    '''
+    with variant(dough, biscuits, population_size, mutation_rate, crossover_rate, seed=seed, local_search=local_search) as ga:
+        best_fitness = max(ga.evaluate_population(ga.population).tolist())
+        best_generation = 0
+        for generation in range(1, generations + 1):
+            ga.evolve()
+            fitness_value = max(ga.evaluate_population(ga.population).tolist())
+            if fitness_value > best_fitness:
+                best_fitness, best_generation = fitness_value, generation
+    if best_fitness == float('-inf'):
+        best_fitness = None  # No valid individual found, -inf has no JSON representation
+    return {'best_fitness': best_fitness, 'best_generation': best_generation,
+            'fitness_requests': ga.cache_hits + ga.cache_misses, 'evaluations': ga.cache_misses}
+
+
+def run_dp(dough, biscuits):
+    '''
+    Run the exact dynamic programming solver.
+
+    Parameters:
+    - dough (Dough): The dough object to place biscuits on.
+    - biscuits (dict): Dictionary of Biscuit objects indexed by their type.
+
+    Returns:
+    - dict: Optimal fitness. The DP does not evaluate individuals.
+    '''
+    total_value, _ = DPSolver(dough, biscuits).solve()
+    return {'best_fitness': total_value, 'best_generation': 0, 'fitness_requests': 0, 'evaluations': 0}
+
+
+def measure(solve, make_dough, track_memory):
+    '''
+    Time one solver run, and measure its peak memory in a second identical run.
+
+    Each run gets a fresh dough, so it pays for its own defect index and feasibility table.
+
+    Parameters:
+    - solve (callable): Function running the solver on a dough and returning its result dict.
+    - make_dough (callable): Function building the dough of the roll.
+    - track_memory (bool): Whether to measure peak memory (tracemalloc slows the run down, so it is not timed).
+
+    Returns:
+    - dict: Solver results plus wall_time, evaluations_per_second and peak_memory_bytes.
+    '''
+    dough = make_dough()
+    start = time.perf_counter()
+    result = solve(dough)
+    wall_time = time.perf_counter() - start
+    result['wall_time'] = wall_time
+    result['evaluations_per_second'] = result['evaluations'] / wall_time if wall_time > 0 else 0.0
+
+    result['peak_memory_bytes'] = None
+    if track_memory:
+        dough = make_dough()
+        tracemalloc.start()
+        solve(dough)
+        result['peak_memory_bytes'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result
+
+
+def run_benchmark(lengths=(500,), densities=(1.0,), seeds=(0,), class_mix=None, solvers=None, generations=50,
+                  population_size=100, mutation_rate=0.05, crossover_rate=0.7, track_memory=True, local_searches=(None,)):
+    '''
+    Run every solver on every synthetic roll configuration.
+
+    Parameters:
+    - lengths (iterable): Dough lengths to generate.
+    - densities (iterable): Defect densities to generate.
+    - seeds (iterable): Seeds, each gives a different roll and GA run.
+    - class_mix (dict, optional): Probability of each defect class.
+    - solvers (iterable, optional): Names of the solvers to run, GA_VARIANTS names or 'DPSolver'. Defaults to all of them.
+    - generations (int): Number of generations of each GA run.
+    - population_size (int): Size of the GA populations.
+    - mutation_rate (float): Rate of mutation.
+    - crossover_rate (float): Rate of crossover.
+    - track_memory (bool): Whether to measure peak memory.
+    - local_searches (iterable): Memetic steps each GA variant is run with, None for no local search.
+
+    Returns:
+    - list: One result dict per (roll, solver, local search).
+    '''
+    solvers = list(solvers or list(GA_VARIANTS) + ['DPSolver'])
+    biscuits = {i: Biscuit(i) for i in range(4)}
+    results = []
+    for length in lengths:
+        for density in densities:
+            for seed in seeds:
+                make_dough = lambda: generate_roll(length, density, class_mix, seed)
+                for solver in solvers:
+                    if solver == 'DPSolver':
+                        runs = [(None, lambda dough: run_dp(dough, biscuits))]
+                    elif solver in GA_VARIANTS:
+                        runs = [(local_search, lambda dough, local_search=local_search: run_ga(
+                                    GA_VARIANTS[solver], dough, biscuits, generations, population_size, mutation_rate,
+                                    crossover_rate, seed, local_search))
+                                for local_search in local_searches]
+                    else:
+                        raise ValueError(f"Unknown solver {solver!r}")
+                    for local_search, solve in runs:
+                        result = {'solver': solver, 'local_search': local_search, 'length': length,
+                                  'defect_density': density, 'seed': seed}
+                        result.update(measure(solve, make_dough, track_memory))
+                        results.append(result)
+    return results
+
+
+def environment():
+    '''
+    Describe the environment of a benchmark run, so results can be compared across commits.
+
+    Returns:
+    - dict: Commit hash (if available), Python and NumPy versions, and timestamp.
+    '''
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def class_share(text):
+    '''
+    Parse one share of the defect class mix given on the command line.
+
+    Parameters:
+    - text (str): A share written as class=probability, e.g. 'a=0.5'.
+
+    Returns:
+    - tuple: (defect_class, probability).
+    '''
+    defect_class, separator, share = text.partition('=')
+    try:
+        share = float(share)
+    except ValueError:
+        share = None
+    if not separator or not defect_class or share is None or share < 0:
+        raise argparse.ArgumentTypeError(f"invalid class share {text!r}, expected class=probability, e.g. a=0.5")
+    return defect_class, share
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the biscuit placement solvers on synthetic rolls.")
+    parser.add_argument('--lengths', type=int, nargs='+', default=[500])
+    parser.add_argument('--densities', type=float, nargs='+', default=[1.0])
+    parser.add_argument('--seeds', type=int, nargs='+', default=[0])
+    parser.add_argument('--class-mix', type=class_share, nargs='+', default=None,
+                        help="Probability of each defect class, e.g. a=0.5 b=0.3 c=0.2. Defaults to equal shares")
+    parser.add_argument('--solvers', nargs='+', default=None, choices=list(GA_VARIANTS) + ['DPSolver'])
+    parser.add_argument('--generations', type=int, default=50)
+    parser.add_argument('--local-search', nargs='+', default=['none'], choices=['none', 'children', 'elites'],
+                        help="Memetic steps to compare on every GA variant")
+    parser.add_argument('--population-size', type=int, default=100)
+    parser.add_argument('--mutation-rate', type=float, default=0.05)
+    parser.add_argument('--crossover-rate', type=float, default=0.7)
+    parser.add_argument('--no-memory', action='store_true', help="Skip the peak memory measurement run")
+    parser.add_argument('--output', default='benchmark_results.json', help="Path of the JSON results file")
+    args = parser.parse_args()
+    if args.class_mix is not None:
+        args.class_mix = dict(args.class_mix)
+        if sum(args.class_mix.values()) <= 0:
+            parser.error("--class-mix needs at least one positive share")
+
+    results = run_benchmark(args.lengths, args.densities, args.seeds, args.class_mix, solvers=args.solvers, generations=args.generations,
+                            population_size=args.population_size, mutation_rate=args.mutation_rate,
+                            crossover_rate=args.crossover_rate, track_memory=not args.no_memory,
+                            local_searches=[None if scope == 'none' else scope for scope in args.local_search])
+    with open(args.output, 'w') as file:
+        json.dump({'environment': environment(), 'config': vars(args), 'results': results}, file, indent=2, allow_nan=False)
+
+    for result in results:
+        memory = f"{result['peak_memory_bytes'] / 1e6:.1f} MB" if result['peak_memory_bytes'] is not None else "-"
+        solver = result['solver'] + (f"+{result['local_search']}" if result['local_search'] else "")
+        print(f"{solver:<29} length={result['length']:<6} density={result['defect_density']:<5} seed={result['seed']:<4} "
+              f"best={str(result['best_fitness']):<8} at_generation={result['best_generation']:<4} time={result['wall_time']:.3f}s "
+              f"evals/s={result['evaluations_per_second']:.0f} peak={memory}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,60 @@
+import json
+from collections.abc import Mapping
+from types import MappingProxyType
+import numpy as np
+
+DEFECT_CLASSES = ('a', 'b', 'c')
+
+# biscuit_type -> (length, value, max_defects by class)
+STANDARD_SPECS = {
+    0: (4, 3, {'a': 4, 'b': 2, 'c': 3}),
+    1: (8, 12, {'a': 5, 'b': 4, 'c': 4}),
+    2: (2, 1, {'a': 1, 'b': 2, 'c': 1}),
+    3: (5, 8, {'a': 2, 'b': 3, 'c': 2}),
+    4: (1, -1, {'a': 10, 'b': 10, 'c': 10}),  # This biscuit serves for some heuristics
+}
+DEFAULT_SPEC = (1, -1, {'a': 10, 'b': 10, 'c': 10})
+
+
 class Biscuit:
-    def __init__(self, biscuit_type):
+    """
+    Immutable biscuit type. Biscuit(biscuit_type) always returns the same standard object for a type,
+    so it can be called in hot paths without allocating anything.
+    """
+    __slots__ = ('biscuit_type', 'length', 'value', 'max_defects')
+
+    _standard = {}  # biscuit_type -> shared standard Biscuit
+
+    def __new__(cls, biscuit_type, length=None, value=None, max_defects=None):
         """
-        Initialize a Biscuit object with a specific type.
+        Get the standard Biscuit of a type, or create a custom one.
 
         Parameters:
         - biscuit_type (int): An integer representing the type of biscuit.
+        - length (int, optional): Length of a custom biscuit. Without it, the standard biscuit of the type is returned.
+        - value (int, optional): Value of a custom biscuit.
+        - max_defects (dict, optional): Maximum allowable defects by class of a custom biscuit.
         """
-        self.biscuit_type = biscuit_type
-        self.length, self.value, self.max_defects = self._configure_biscuit(biscuit_type)
+        if length is None:
+            biscuit = cls._standard.get(biscuit_type)
+            if biscuit is None:
+                biscuit = cls._standard[biscuit_type] = cls._create(biscuit_type, *cls._configure_biscuit(biscuit_type))
+            return biscuit
+        if value is None or max_defects is None:
+            raise ValueError("A custom biscuit needs a length, a value and max_defects")
+        return cls._create(biscuit_type, length, value, max_defects)
 
-    def _configure_biscuit(self, biscuit_type):
+    @classmethod
+    def _create(cls, biscuit_type, length, value, max_defects):
+        biscuit = object.__new__(cls)
+        object.__setattr__(biscuit, 'biscuit_type', biscuit_type)
+        object.__setattr__(biscuit, 'length', int(length))
+        object.__setattr__(biscuit, 'value', value)
+        object.__setattr__(biscuit, 'max_defects', MappingProxyType(dict(max_defects)))
+        return biscuit
+
+    @staticmethod
+    def _configure_biscuit(biscuit_type):
         """
         Configure the biscuit's properties based on its type.
 
@@ -21,36 +66,139 @@ class Biscuit:
         - value (int): Value of the biscuit.
         - max_defects (dict): Maximum allowable defects by class ('a', 'b', 'c').
         """
-        if biscuit_type == 0:
-            return 4, 3, {'a': 4, 'b': 2, 'c': 3}
-        elif biscuit_type == 1:
-            return 8, 12, {'a': 5, 'b': 4, 'c': 4}
-        elif biscuit_type == 2:
-            return 2, 1, {'a': 1, 'b': 2, 'c': 1}
-        elif biscuit_type == 3:
-            return 5, 8, {'a': 2, 'b': 3, 'c': 2}
-        elif biscuit_type == 4:
-            return 1, -1, {'a': 10, 'b': 10, 'c': 10} # This biscuit serves for some heuristics
-        else:
-            return 1, -1, {'a': 10, 'b': 10, 'c': 10}
-
-    def biscuit_type(self):
-        return self.biscuit_type
-    
-    def value(self):
-        return self.value
-    
-    def length(self):
-        return self.length
-    
-    def max_defects(self):
-        """
-        Get the maximum allowable defects for the biscuit.
+        return STANDARD_SPECS.get(biscuit_type, DEFAULT_SPEC)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Biscuit objects are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Biscuit objects are immutable")
+
+    def __reduce__(self):
+        # Standard biscuits unpickle to the shared object of their process
+        if Biscuit._standard.get(self.biscuit_type) is self:
+            return Biscuit, (self.biscuit_type,)
+        return Biscuit, (self.biscuit_type, self.length, self.value, dict(self.max_defects))
+
+    def __eq__(self, other):
+        if not isinstance(other, Biscuit):
+            return NotImplemented
+        return (self.biscuit_type, self.length, self.value, dict(self.max_defects)) == \
+            (other.biscuit_type, other.length, other.value, dict(other.max_defects))
+
+    def __hash__(self):
+        return hash((self.biscuit_type, self.length, self.value))
+
+    def __repr__(self):
+        return f"Biscuit({self.biscuit_type!r}, {self.length!r}, {self.value!r}, {dict(self.max_defects)!r})"
+
+    def __str__(self):
+        return f"Biscuit Type: {self.biscuit_type}, Length: {self.length}, Value: {self.value}, Max Defects: {dict(self.max_defects)}"
+
+
+class BiscuitCatalogue(Mapping):
+    """
+    Read-only dictionary of Biscuit objects indexed by their type, usable wherever a biscuits dict is expected.
+
+    It also holds flat NumPy arrays indexed by type id for vectorized code: known, length_of, value_of and
+    max_defects_of (one column per class of defect_classes). Type ids must be non-negative integers.
+    """
+    def __init__(self, biscuits):
+        """
+        Initialize the catalogue.
+
+        Parameters:
+        - biscuits (dict or iterable): Dictionary of Biscuit objects indexed by their type, or an iterable of Biscuit objects.
+        """
+        if isinstance(biscuits, Mapping):
+            biscuits = biscuits.values()
+        self._biscuits = {biscuit.biscuit_type: biscuit for biscuit in biscuits}
+
+        classes = list(DEFECT_CLASSES)
+        for biscuit in self._biscuits.values():
+            classes.extend(cls for cls in biscuit.max_defects if cls not in classes)
+        self.defect_classes = tuple(classes)
+
+        size = max(self._biscuits) + 1 if self._biscuits else 0
+        self.types = np.array(sorted(self._biscuits), dtype=np.int64)
+        self.known = np.zeros(size, dtype=bool)
+        self.length_of = np.zeros(size, dtype=np.int64)
+        self.value_of = np.zeros(size, dtype=np.int64)
+        # A class missing from a biscuit's thresholds is not limited, as in FeasibilityTable
+        self.max_defects_of = np.full((size, len(classes)), np.iinfo(np.int64).max, dtype=np.int64)
+        for biscuit_type, biscuit in self._biscuits.items():
+            self.known[biscuit_type] = True
+            self.length_of[biscuit_type] = biscuit.length
+            self.value_of[biscuit_type] = biscuit.value
+            for column, cls in enumerate(classes):
+                if cls in biscuit.max_defects:
+                    self.max_defects_of[biscuit_type, column] = biscuit.max_defects[cls]
+        for array in (self.types, self.known, self.length_of, self.value_of, self.max_defects_of):
+            array.flags.writeable = False
+
+    @classmethod
+    def standard(cls, biscuit_types=range(4)):
+        """
+        Create the catalogue of standard biscuit types.
+
+        Parameters:
+        - biscuit_types (iterable): The standard types to include.
 
         Returns:
-        - dict: Dictionary containing maximum allowable defects for each class ('a', 'b', 'c').
+        - BiscuitCatalogue: The catalogue.
         """
-        return self.max_defects
-    
-    def __str__(self):
-        return f"Biscuit Type: {self.biscuit_type}, Length: {self.length}, Value: {self.value}, Max Defects: {self.max_defects}"
\ No newline at end of file
+        return cls(Biscuit(biscuit_type) for biscuit_type in biscuit_types)
+
+    @classmethod
+    def from_specs(cls, specs):
+        """
+        Create a catalogue of custom biscuits.
+
+        Parameters:
+        - specs (dict or list): Specs indexed by biscuit type, or a list of specs with a 'type' key.
+          Each spec has 'length', 'value' and 'max_defects' (dict of maximum defects by class).
+
+        Returns:
+        - BiscuitCatalogue: The catalogue.
+        """
+        if isinstance(specs, Mapping):
+            specs = [dict(spec, type=biscuit_type) for biscuit_type, spec in specs.items()]
+        biscuits = []
+        for spec in specs:
+            missing = {'type', 'length', 'value', 'max_defects'} - set(spec)
+            if missing:
+                raise ValueError(f"Biscuit spec {spec!r} is missing {sorted(missing)}")
+            biscuit_type = int(spec['type'])
+            if biscuit_type < 0 or spec['length'] < 1:
+                raise ValueError(f"Biscuit spec {spec!r} needs a non-negative type and a positive length")
+            biscuits.append(Biscuit(biscuit_type, spec['length'], spec['value'], spec['max_defects']))
+        return cls(biscuits)
+
+    @classmethod
+    def from_json(cls, path):
+        """
+        Create a catalogue of custom biscuits from a JSON file holding specs as accepted by from_specs.
+
+        Parameters:
+        - path (str): Path of the JSON file.
+
+        Returns:
+        - BiscuitCatalogue: The catalogue.
+        """
+        with open(path) as file:
+            specs = json.load(file)
+        if isinstance(specs, dict):
+            specs = {int(biscuit_type): spec for biscuit_type, spec in specs.items()}
+        return cls.from_specs(specs)
+
+    def __getitem__(self, biscuit_type):
+        return self._biscuits[biscuit_type]
+
+    def __iter__(self):
+        return iter(self._biscuits)
+
+    def __len__(self):
+        return len(self._biscuits)
+
+    def __repr__(self):
+        return f"BiscuitCatalogue({list(self._biscuits.values())!r})"
@@ -0,0 +1,124 @@
+from Occupancy import Occupancy
+
+try:
+    from ortools.sat.python import cp_model
+except ImportError:  # OR-Tools is optional, only this solver needs it
+    cp_model = None
+
+
+class CPSolver:
+    '''
+    Constraint programming solver for placing biscuits on a dough, using OR-Tools CP-SAT.
+
+    Only the (biscuit_type, position) placements allowed by the feasibility table get a variable, so
+    defect constraints are enforced by construction. Overlaps are forbidden with one AtMostOne per
+    dough cell over the placements covering it: on a line these constraints make the linear
+    relaxation exact, so CP-SAT proves optimality at the root. A single NoOverlap over optional
+    intervals is equivalent but relaxes poorly and stalls on a 500-long roll. A valid placement
+    scores sum(value + length) - LENGTH, as in GeneticAlgorithm.delta_fitness, so no coverage
+    variable is needed.
+    '''
+    def __init__(self, dough, biscuits, num_workers=None, time_limit=None):
+        '''
+        Initialize the solver.
+
+        Parameters:
+        - dough (Dough): The dough object to place biscuits on.
+        - biscuits (dict): Dictionary of Biscuit objects indexed by their type.
+        - num_workers (int, optional): Number of CP-SAT search workers. Defaults to the CP-SAT default (all cores).
+        - time_limit (float, optional): Maximum solving time in seconds. The best solution found so far is returned when it is reached.
+        '''
+        if cp_model is None:
+            raise ImportError("CPSolver requires OR-Tools: pip install ortools")
+        self.dough = dough
+        self.biscuits = biscuits
+        self.num_workers = num_workers
+        self.time_limit = time_limit
+        self.status = None  # CP-SAT status name of the last solve, e.g. 'OPTIMAL' or 'FEASIBLE'
+
+    def build_model(self, hint=None):
+        '''
+        Build the CP-SAT model of the dough.
+
+        Parameters:
+        - hint (list, optional): A placement as tuples (position, biscuit_type) given to the solver as a starting point.
+
+        Returns:
+        - model (cp_model.CpModel): The model.
+        - placements (dict): Presence literal of each feasible (position, biscuit_type) placement.
+        '''
+        model = cp_model.CpModel()
+        table = self.dough.feasibility(self.biscuits)
+        placements = {}
+        covering = [[] for _ in range(self.dough.LENGTH)]  # literals of the placements covering each cell
+        objective = []
+        for biscuit_type, biscuit in self.biscuits.items():
+            row = table.row(biscuit_type)
+            position = row.find(1)
+            while position != -1:
+                present = model.NewBoolVar(f"biscuit_{biscuit_type}_start_{position}")
+                placements[(position, biscuit_type)] = present
+                objective.append((biscuit.value + biscuit.length) * present)
+                for cell in range(position, position + biscuit.length):
+                    covering[cell].append(present)
+                position = row.find(1, position + 1)
+        for literals in covering:
+            if len(literals) > 1:
+                model.AddAtMostOne(literals)
+        model.Maximize(sum(objective) - self.dough.LENGTH)
+
+        if hint is not None:
+            hinted = set(hint)
+            for gene, present in placements.items():
+                model.AddHint(present, gene in hinted)
+        return model, placements
+
+    def solve(self, hint=None):
+        '''
+        Compute an optimal placement of biscuits on the whole dough, or the best found within the time limit.
+
+        Parameters:
+        - hint (list, optional): A placement as tuples (position, biscuit_type), e.g. from a GA or greedy run.
+
+        Returns:
+        - total_value (int): The value of the placement, minus the penalty for unused dough.
+        - placement (list): A list of tuples (position, biscuit_type) sorted by position.
+        '''
+        model, placements = self.build_model(hint)
+        solver = cp_model.CpSolver()
+        if self.num_workers is not None:
+            solver.parameters.num_search_workers = self.num_workers
+        if self.time_limit is not None:
+            solver.parameters.max_time_in_seconds = self.time_limit
+        status = solver.Solve(model)
+        self.status = solver.StatusName(status)
+        if status == cp_model.INFEASIBLE or status == cp_model.MODEL_INVALID:
+            raise RuntimeError(f"CP-SAT failed to solve the model (status {self.status})")
+        if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            # Time limit reached before the first solution: fall back on the hint, or on the empty dough
+            return self._score(hint, placements)
+
+        placement = sorted(gene for gene, present in placements.items() if solver.BooleanValue(present))
+        return int(round(solver.ObjectiveValue())), placement
+
+    def _score(self, hint, placements):
+        '''
+        Score a hint placement, or the empty dough if there is no valid hint.
+
+        Parameters:
+        - hint (list or None): A placement as tuples (position, biscuit_type).
+        - placements (dict): Presence literal of each feasible (position, biscuit_type) placement.
+
+        Returns:
+        - total_value (int): The value of the placement, minus the penalty for unused dough.
+        - placement (list): A list of tuples (position, biscuit_type) sorted by position.
+        '''
+        placement = sorted(hint or [])
+        occupancy = Occupancy()
+        total_value = -self.dough.LENGTH
+        for position, biscuit_type in placement:
+            biscuit = self.biscuits[biscuit_type]
+            if (position, biscuit_type) not in placements or not occupancy.try_add(position, position + biscuit.length):
+                return -self.dough.LENGTH, []
+            total_value += biscuit.value + biscuit.length
+        return total_value, placement
@@ -0,0 +1,66 @@
+class DPSolver:
+    '''
+    Exact dynamic programming solver for placing biscuits on a dough.
+
+    The best value of the prefix [0, i) is either the best value of [0, i - 1) with cell i - 1 left
+    empty (penalty of -1, as in GeneticAlgorithm.fitness), or the best value of [0, i - length) plus
+    the value of a biscuit that can be placed at i - length. This runs in O(LENGTH x #types).
+    '''
+    def __init__(self, dough, biscuits):
+        '''
+        Initialize the solver.
+
+        Parameters:
+        - dough (Dough): The dough object to place biscuits on.
+        - biscuits (dict): Dictionary of Biscuit objects indexed by their type.
+        '''
+        self.dough = dough
+        self.biscuits = biscuits
+
+    def solve(self, start=0, end=None):
+        '''
+        Compute an optimal placement of biscuits on the whole dough, or on the section [start, end) only.
+
+        Parameters:
+        - start (int): First cell of the section.
+        - end (int, optional): Cell after the end of the section. Defaults to the end of the dough.
+
+        Returns:
+        - total_value (int): The value of the optimal placement, minus the penalty for unused cells of the section.
+        - placement (list): A list of tuples (position, biscuit_type) sorted by position, all inside the section.
+        '''
+        end = self.dough.LENGTH if end is None else end
+        if not 0 <= start <= end <= self.dough.LENGTH:
+            raise ValueError(f"Section [{start}, {end}) is not inside the dough")
+        length = end - start
+        table = self.dough.feasibility(self.biscuits)
+        biscuit_types = [(biscuit_type, biscuit.length, biscuit.value) for biscuit_type, biscuit in self.biscuits.items()]
+
+        best = [0] * (length + 1)
+        choice = [None] * (length + 1)  # biscuit type ending at i, None for an empty cell
+        for i in range(1, length + 1):
+            best_value = best[i - 1] - 1
+            best_choice = None
+            for biscuit_type, biscuit_length, biscuit_value in biscuit_types:
+                first = i - biscuit_length
+                if first >= 0 and table.row(biscuit_type)[start + first]:
+                    value = best[first] + biscuit_value
+                    if value > best_value:
+                        best_value = value
+                        best_choice = biscuit_type
+            best[i] = best_value
+            choice[i] = best_choice
+
+        # Walk back from the end of the section to recover the placement
+        placement = []
+        i = length
+        while i > 0:
+            biscuit_type = choice[i]
+            if biscuit_type is None:
+                i -= 1
+            else:
+                i -= self.biscuits[biscuit_type].length
+                placement.append((start + i, biscuit_type))
+        placement.reverse()
+
+        return best[length], placement
@@ -1,16 +1,30 @@
+import csv
+from bisect import bisect_left, insort
+from itertools import islice
+import numpy as np
 from Biscuit import *
+from FeasibilityTable import FeasibilityTable
+from Occupancy import Occupancy
 
 class Dough:
-    def __init__(self, length):
+    INDEX_INSORT_LIMIT = 256  # larger batches of defects drop the defect index, a rebuild sorts faster
+
+    def __init__(self, length, known_classes=DEFECT_CLASSES):
         """
         Initialize a Dough object with a specific length.
 
         Parameters:
         - length (int): Length of the dough.
+        - known_classes (iterable): Defect classes accepted on this dough. Defaults to 'a', 'b' and 'c'.
         """
         self.LENGTH = length
+        self.known_classes = tuple(known_classes)
         self.defects_list = []  # tuples (position, class)
         self.biscuits_placed = []  # tuples (position, biscuit_type, valid)
+        self._defect_index = None  # sorted positions per class, rebuilt lazily
+        self._feasibility_tables = {}  # id(biscuits) -> (biscuits, FeasibilityTable)
+        self._standard_biscuits = {}  # biscuit_type -> Biscuit, used when no biscuits are given
+        self.count_defects_calls = 0
 
     def add_defect(self, position, defect_class):
         """
@@ -20,11 +34,106 @@ class Dough:
         - position (int): Position of the defect on the dough.
         - defect_class (str): Class of the defect ('a', 'b', 'c').
         """
+        if defect_class not in self.known_classes:
+            raise ValueError(f"Unknown defect class {defect_class!r}, expected one of {self.known_classes}")
         if 0 <= position < self.LENGTH:
             self.defects_list.append((position, defect_class))
+            if self._defect_index is not None:
+                insort(self._defect_index.setdefault(defect_class, []), position)
+            self._patch_feasibility_tables([position])
         else:
             raise ValueError("Defect position out of dough range")
 
+    def add_defects(self, positions, defect_classes):
+        """
+        Add many defects to the dough at once, validating all positions and classes in a single vectorized pass.
+
+        Parameters:
+        - positions (array-like): Positions of the defects on the dough.
+        - defect_classes (array-like): Class of each defect ('a', 'b', 'c').
+        """
+        positions = np.asarray(positions, dtype=np.float64)
+        defect_classes = list(defect_classes)
+        if positions.ndim != 1 or len(positions) != len(defect_classes):
+            raise ValueError("Defect positions and classes must be one-dimensional and of the same size")
+        # NaN fails every comparison, so non-finite positions are rejected explicitly
+        if (~np.isfinite(positions) | (positions < 0) | (positions >= self.LENGTH)).any():
+            raise ValueError("Defect position out of dough range")
+        unknown = ~np.isin(np.asarray(defect_classes, dtype=object), np.asarray(self.known_classes, dtype=object))
+        if unknown.any():
+            raise ValueError(f"Unknown defect class {defect_classes[int(np.argmax(unknown))]!r}, expected one of {self.known_classes}")
+        if len(positions):
+            positions = positions.tolist()
+            self.defects_list.extend(zip(positions, defect_classes))
+            if self._defect_index is not None:
+                if len(positions) <= self.INDEX_INSORT_LIMIT:
+                    for position, defect_class in zip(positions, defect_classes):
+                        insort(self._defect_index.setdefault(defect_class, []), position)
+                else:
+                    self._defect_index = None  # Index is stale, rebuild on next query
+            self._patch_feasibility_tables(positions)
+
+    def _patch_feasibility_tables(self, positions):
+        """
+        Replace the cached feasibility tables with tables patched around new defects.
+
+        Each patched table is a new object, so holders of the previous table (e.g. the fitness cache of
+        GeneticAlgorithm) still see that the dough changed.
+
+        Parameters:
+        - positions (list): Positions of the defects just added.
+        """
+        for key, (biscuits, table) in list(self._feasibility_tables.items()):
+            self._feasibility_tables[key] = (biscuits, table.patched(self, positions))
+
+    @classmethod
+    def from_arrays(cls, x, defect_classes, length, known_classes=DEFECT_CLASSES):
+        """
+        Create a dough from arrays of defect positions and classes.
+
+        Parameters:
+        - x (array-like): Positions of the defects on the dough.
+        - defect_classes (array-like): Class of each defect ('a', 'b', 'c').
+        - length (int): Length of the dough.
+        - known_classes (iterable): Defect classes accepted on the dough.
+
+        Returns:
+        - Dough: The dough with all the defects added.
+        """
+        dough = cls(length, known_classes)
+        dough.add_defects(x, defect_classes)
+        return dough
+
+    @classmethod
+    def from_csv(cls, path, length, chunk_size=100000, known_classes=DEFECT_CLASSES):
+        """
+        Create a dough from a CSV file in the defects.csv format (columns 'x' and 'class').
+
+        The file is streamed in chunks of rows, so it is never held in memory as a whole table.
+
+        Parameters:
+        - path (str): Path of the CSV file.
+        - length (int): Length of the dough.
+        - chunk_size (int): Number of rows parsed and validated at once.
+        - known_classes (iterable): Defect classes accepted on the dough.
+
+        Returns:
+        - Dough: The dough with all the defects added.
+        """
+        dough = cls(length, known_classes)
+        with open(path, newline='') as file:
+            reader = csv.reader(file)
+            header = next(reader, [])
+            if 'x' not in header or 'class' not in header:
+                raise ValueError(f"{path} must have 'x' and 'class' columns")
+            x_column, class_column = header.index('x'), header.index('class')
+            while True:
+                rows = list(islice(reader, chunk_size))
+                if not rows:
+                    break
+                dough.add_defects([row[x_column] for row in rows], [row[class_column] for row in rows])
+        return dough
+
     def count_defects(self, position, length):
         """
         Count the number of defects in a specific section of the dough.
@@ -36,12 +145,47 @@ class Dough:
         Returns:
         - dict: Dictionary containing counts of each defect class in the specified section.
         """
+        self.count_defects_calls += 1
         defect_counts = {}
-        for pos, cls in self.defects_list:
-            if position <= pos < position + length:
-                defect_counts[cls] = defect_counts.get(cls, 0) + 1
+        end = position + length
+        for cls, positions in self.defect_index().items():
+            count = bisect_left(positions, end) - bisect_left(positions, position)
+            if count:
+                defect_counts[cls] = count
         return defect_counts
 
+    def defect_index(self):
+        """
+        Get the per-class index of defect positions, rebuilding it if defects were added since the last query.
+
+        Returns:
+        - dict: Dictionary mapping each defect class to the sorted list of its defect positions.
+        """
+        if self._defect_index is None:
+            index = {}
+            for pos, cls in self.defects_list:
+                index.setdefault(cls, []).append(pos)
+            for positions in index.values():
+                positions.sort()
+            self._defect_index = index
+        return self._defect_index
+
+    def feasibility(self, biscuits):
+        """
+        Get the feasibility table of a set of biscuits on this dough, building it on first use.
+
+        Parameters:
+        - biscuits (dict): Dictionary of Biscuit objects indexed by their type.
+
+        Returns:
+        - FeasibilityTable: Table telling which (position, biscuit_type) placements are valid.
+        """
+        entry = self._feasibility_tables.get(id(biscuits))
+        if entry is None or entry[0] is not biscuits:
+            entry = (biscuits, FeasibilityTable(self, biscuits))
+            self._feasibility_tables[id(biscuits)] = entry
+        return entry[1]
+
     def place_biscuits(self, biscuits):
         """
         Place biscuits on the dough, ensuring they fit and meet defect requirements.
@@ -61,23 +205,41 @@ class Dough:
             current_position += biscuit.length
             self.biscuits_placed = sorted(self.biscuits_placed, key=lambda x: x[0])
 
-    def place_biscuits_GA(self, biscuit_positions):
+    def place_biscuits_GA(self, biscuit_positions, biscuits=None):
         """
         Place biscuits on the dough using a Genetic Algorithm approach.
 
         Parameters:
         - biscuit_positions (list): List of tuples containing (position, biscuit_type).
+        - biscuits (dict, optional): Dictionary of Biscuit objects indexed by their type. Defaults to the standard biscuit types.
         """
+        if biscuits is None:
+            biscuits = self._default_biscuits(biscuit_positions)
+        table = self.feasibility(biscuits)
         self.biscuits_placed.clear()
         for position, biscuit_type in biscuit_positions:
-            biscuit = Biscuit(biscuit_type)
+            biscuit = biscuits[biscuit_type]
             if position + biscuit.length > self.LENGTH:
                 break  
-            defect_counts = self.count_defects(position, biscuit.length)
-            valid = all(defect_counts.get(cls, 0) <= biscuit.max_defects[cls] for cls in biscuit.max_defects)
+            valid = table.is_valid(position, biscuit_type)
             self.biscuits_placed.append((position, biscuit.biscuit_type, valid))
             self.biscuits_placed = sorted(self.biscuits_placed, key=lambda x: x[0])
 
+    def _default_biscuits(self, biscuit_positions):
+        """
+        Get the standard Biscuit objects for every type used in a placement, reusing the same dictionary across calls.
+
+        Parameters:
+        - biscuit_positions (list): List of tuples containing (position, biscuit_type).
+
+        Returns:
+        - dict: Dictionary of Biscuit objects indexed by their type.
+        """
+        for _, biscuit_type in biscuit_positions:
+            if biscuit_type not in self._standard_biscuits:
+                self._standard_biscuits[biscuit_type] = Biscuit(biscuit_type)
+        return self._standard_biscuits
+
     def get_positions(self):
         """
         Print the positions of all biscuits placed on the dough.
@@ -166,14 +328,17 @@ class Dough:
         Parameters:
         - new_position (int): Position of the new biscuit.
         - new_length (int): Length of the new biscuit.
-        - existing_biscuits (list): List of tuples containing (position, biscuit_type).
+        - existing_biscuits (list or Occupancy): List of tuples containing (position, biscuit_type), or their Occupancy,
+          which answers in O(log n) and should be preferred for repeated queries.
 
         Returns:
         - bool: True if the new placement overlaps, False otherwise.
         """
+        if isinstance(existing_biscuits, Occupancy):
+            return not existing_biscuits.is_free(new_position, new_position + new_length)
+        biscuits = self._default_biscuits(existing_biscuits)
         for position, biscuit_type in existing_biscuits:
-            biscuit_length = Biscuit(biscuit_type).length
-            if not (new_position + new_length <= position or new_position >= position + biscuit_length):
+            if not (new_position + new_length <= position or new_position >= position + biscuits[biscuit_type].length):
                 return True 
         return False 
 
@@ -0,0 +1,79 @@
+from time import perf_counter_ns
+
+
+class EvolutionObserver:
+    '''
+    Base class of the observers notified by GeneticAlgorithm.evolve after every generation.
+
+    Subclasses override on_generation. The stats dictionary contains:
+    - generation (int): Number of generations evolved so far.
+    - phase_ns (dict): Nanoseconds spent in each phase ('selection', 'crossover', 'mutation', ...), excluding fitness.
+    - fitness_ns (int): Nanoseconds spent computing or looking up fitness values during the generation.
+    - fitness_calls (int): Number of fitness values requested.
+    - fitness_evaluations (int): Number of fitness values actually computed (cache misses).
+    - count_defects_calls (int): Number of Dough.count_defects calls.
+    - invalid_ratio (float): Share of the new population with a fitness of negative infinity.
+    '''
+    def on_generation(self, ga, stats):
+        '''
+        Receive the statistics of a generation.
+
+        Parameters:
+        - ga (GeneticAlgorithm): The algorithm that evolved.
+        - stats (dict): Timings and counters of the generation.
+        '''
+        pass
+
+
+class RecordingObserver(EvolutionObserver):
+    '''
+    Observer keeping the statistics of every generation in memory.
+    '''
+    def __init__(self):
+        self.records = []
+
+    def on_generation(self, ga, stats):
+        self.records.append(stats)
+
+
+class PhaseTimer:
+    '''
+    Accumulate the time spent in each phase of a generation, putting fitness time in its own phase.
+    '''
+    def __init__(self, ga):
+        '''
+        Start timing a generation.
+
+        Parameters:
+        - ga (GeneticAlgorithm): The algorithm whose fitness time counter is read at each lap.
+        '''
+        self.ga = ga
+        self.phase_ns = {}
+        self._start = perf_counter_ns()
+        self._fitness_ns = ga.fitness_ns
+        self.start_fitness_ns = ga.fitness_ns
+        self.counters = None  # counter snapshot taken by GeneticAlgorithm.start_generation
+
+    def lap(self, phase):
+        '''
+        Charge the time elapsed since the previous lap to a phase.
+
+        Parameters:
+        - phase (str): Name of the phase that just ended.
+        '''
+        now = perf_counter_ns()
+        fitness_ns = self.ga.fitness_ns - self._fitness_ns
+        self.phase_ns[phase] = self.phase_ns.get(phase, 0) + now - self._start - fitness_ns
+        self._start = now
+        self._fitness_ns = self.ga.fitness_ns
+
+
+class NullTimer:
+    '''
+    Timer used when no observer is attached, so evolve pays almost nothing for its laps.
+    '''
+    def lap(self, phase):
+        pass
+
+
+NULL_TIMER = NullTimer()
@@ -0,0 +1,102 @@
+class FeasibilityTable:
+    '''
+    Lookup table telling whether a biscuit type can be placed at an integer position of a dough.
+
+    Each biscuit type owns one bytearray indexed by start position, where 1 means the biscuit fits
+    inside the dough and its section respects the defect thresholds. Rows are built once per
+    (Dough, biscuits) pair and only read afterwards, so the table can be shared between workers.
+    '''
+    def __init__(self, dough, biscuits):
+        '''
+        Initialize the table for a dough and a set of biscuits.
+
+        Parameters:
+        - dough (Dough): The dough object whose defects constrain the placements.
+        - biscuits (dict): Dictionary of Biscuit objects indexed by their type.
+        '''
+        self.length = dough.LENGTH
+        self.biscuits = biscuits
+        self.rows = {}  # biscuit_type -> bytearray of valid start positions
+        self._dough = dough
+        for biscuit_type in biscuits:
+            self.rows[biscuit_type] = self._build_row(dough, biscuits[biscuit_type])
+
+    def _build_row(self, dough, biscuit):
+        '''
+        Compute the validity of every start position for one biscuit.
+
+        Parameters:
+        - dough (Dough): The dough object to check.
+        - biscuit (Biscuit): The biscuit to place.
+
+        Returns:
+        - bytearray: 1 at each position where the biscuit can be placed, 0 elsewhere.
+        '''
+        row = bytearray(self.length)
+        for position in range(self.length - biscuit.length + 1):
+            defects = dough.count_defects(position, biscuit.length)
+            if all(defects.get(cls, 0) <= biscuit.max_defects[cls] for cls in biscuit.max_defects):
+                row[position] = 1
+        return row
+
+    def patched(self, dough, positions):
+        '''
+        Build the table of the dough after defects were added, recomputing only the start positions whose
+        section contains one of the new defects. The table itself is left unchanged.
+
+        Parameters:
+        - dough (Dough): The dough object, already holding the new defects.
+        - positions (iterable): Positions of the new defects.
+
+        Returns:
+        - FeasibilityTable: The updated table.
+        '''
+        table = FeasibilityTable.__new__(FeasibilityTable)
+        table.length = self.length
+        table.biscuits = self.biscuits
+        table.rows = {}
+        table._dough = dough
+        cells = sorted({int(position) for position in positions})
+        for biscuit_type, row in self.rows.items():
+            biscuit = self.biscuits[biscuit_type]
+            row = bytearray(row)
+            last = self.length - biscuit.length  # last start position inside the dough
+            starts = set()
+            for cell in cells:
+                # A biscuit starting at s covers the defect at cell iff cell - length < s <= cell
+                starts.update(range(max(0, cell - biscuit.length + 1), min(cell, last) + 1))
+            for position in starts:
+                defects = dough.count_defects(position, biscuit.length)
+                row[position] = all(defects.get(cls, 0) <= biscuit.max_defects[cls] for cls in biscuit.max_defects)
+            table.rows[biscuit_type] = row
+        return table
+
+    def row(self, biscuit_type):
+        '''
+        Get the validity row of a biscuit type, building it if the type was added to the biscuits afterwards.
+
+        Parameters:
+        - biscuit_type (int): The type of biscuit.
+
+        Returns:
+        - bytearray: Validity of each start position for this biscuit type.
+        '''
+        row = self.rows.get(biscuit_type)
+        if row is None:
+            row = self._build_row(self._dough, self.biscuits[biscuit_type])
+            self.rows[biscuit_type] = row
+        return row
+
+    def is_valid(self, position, biscuit_type):
+        '''
+        Check whether a biscuit type can be placed at a position.
+
+        Parameters:
+        - position (int): Starting position of the biscuit.
+        - biscuit_type (int): The type of biscuit.
+
+        Returns:
+        - bool: True if the biscuit fits inside the dough and meets its defect thresholds.
+        '''
+        return 0 <= position < self.length and self.row(biscuit_type)[position] == 1
+
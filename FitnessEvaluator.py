@@ -0,0 +1,103 @@
+from itertools import chain
+
+import numpy as np
+from Biscuit import BiscuitCatalogue
+from Genome import Genome
+
+
+class FitnessEvaluator:
+    '''
+    Vectorized fitness evaluation of a whole population of individuals.
+
+    The population is encoded as padded (individuals x genes) integer arrays, then bounds, defects
+    and overlaps are checked with array operations. The result matches GeneticAlgorithm.fitness
+    for every individual.
+    '''
+    def __init__(self, dough, biscuits):
+        '''
+        Initialize the evaluator for a dough and a set of biscuits.
+
+        Parameters:
+        - dough (Dough): The dough object to place biscuits on.
+        - biscuits (dict or BiscuitCatalogue): Dictionary of Biscuit objects indexed by their type (non-negative integers).
+        '''
+        self.length = dough.LENGTH
+        self.table = dough.feasibility(biscuits)
+
+        catalogue = biscuits if isinstance(biscuits, BiscuitCatalogue) else BiscuitCatalogue(biscuits)
+        self.known = catalogue.known
+        self.lengths = catalogue.length_of
+        self.values = catalogue.value_of
+        self.valid = np.zeros((len(self.known), self.length), dtype=bool)
+        for biscuit_type in catalogue:
+            self.valid[biscuit_type] = np.frombuffer(self.table.row(biscuit_type), dtype=np.uint8)
+
+    def encode(self, population):
+        '''
+        Encode a population as padded position and type arrays.
+
+        Parameters:
+        - population (list): List of individuals, each a Genome or a list of tuples (position, biscuit_type).
+
+        Returns:
+        - positions (np.ndarray): (individuals x genes) array of positions.
+        - types (np.ndarray): (individuals x genes) array of biscuit types.
+        - mask (np.ndarray): (individuals x genes) boolean array, False on padding.
+        '''
+        count = len(population)
+        sizes = np.fromiter((len(individual) for individual in population), dtype=np.int64, count=count)
+        width = int(sizes.max()) if count else 0
+        if all(isinstance(individual, Genome) for individual in population):
+            # Genomes already hold their genes in a flat buffer
+            raw = b''.join(individual.data.tobytes() for individual in population)
+            genes = np.frombuffer(raw, dtype=np.dtype(Genome.TYPECODE)).astype(np.int64)
+        else:
+            genes = np.fromiter(chain.from_iterable(chain.from_iterable(population)), dtype=np.int64, count=2 * int(sizes.sum()))
+
+        mask = np.arange(width) < sizes[:, None]
+        positions = np.zeros((count, width), dtype=np.int64)
+        types = np.zeros((count, width), dtype=np.int64)
+        positions[mask] = genes[0::2]
+        types[mask] = genes[1::2]
+        return positions, types, mask
+
+    def evaluate(self, population):
+        '''
+        Calculate the fitness values of a population, including penalty for unused dough.
+
+        Parameters:
+        - population (list): List of individuals, each a Genome or a list of tuples (position, biscuit_type).
+
+        Returns:
+        - np.ndarray: Fitness value of each individual, negative infinity for invalid ones.
+        '''
+        positions, types, mask = self.encode(population)
+        gene_types = types[mask]
+        unknown = (gene_types < 0) | (gene_types >= len(self.known))
+        unknown[~unknown] = ~self.known[gene_types[~unknown]]
+        if unknown.any():
+            raise KeyError(int(gene_types[unknown][0]))  # Same error as looking up self.biscuits
+
+        lengths = np.where(mask, self.lengths[types], 0)
+        ends = positions + lengths
+
+        # Check if biscuits are within the dough
+        valid = ((positions >= 0) & (ends <= self.length)) | ~mask
+
+        # Check defects
+        clipped = np.clip(positions, 0, self.length - 1)
+        valid &= self.valid[types, clipped] | ~mask
+
+        # Check for overlapping: sort genes by position, then each start must not precede the furthest end so far
+        padding = np.iinfo(np.int64).max
+        starts = np.where(mask, positions, padding)
+        order = np.argsort(starts, axis=1, kind='stable')
+        starts = np.take_along_axis(starts, order, axis=1)
+        furthest = np.maximum.accumulate(np.take_along_axis(np.where(mask, ends, padding), order, axis=1), axis=1)
+        overlapping = (starts[:, 1:] < furthest[:, :-1]).any(axis=1)
+
+        # Each placed biscuit earns its value and avoids the penalty on the cells it covers
+        total_value = (np.where(mask, self.values[types], 0) + lengths).sum(axis=1) - self.length
+        fitness_values = total_value.astype(np.float64)
+        fitness_values[~valid.all(axis=1) | overlapping] = float('-inf')
+        return fitness_values
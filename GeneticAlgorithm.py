@@ -1,11 +1,94 @@
 import random
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter, perf_counter_ns
+import weakref
+import numpy as np
 from Biscuit import Biscuit
+from EvolutionObserver import NULL_TIMER, PhaseTimer
+from FitnessEvaluator import FitnessEvaluator
+from Genome import Genome
+from LocalSearch import LocalSearch
+from Occupancy import Occupancy
+from Selection import elite_indices, roulette_wheel_selection, tournament_selection
+from SolutionSampler import SolutionSampler
+
+_worker_evaluator = None  # FitnessEvaluator of the current worker process
+
+
+def _init_worker(dough, biscuits):
+    '''
+    Build the fitness evaluator of a worker process once, from the dough and biscuits sent at startup.
+
+    Parameters:
+    - dough (Dough): The dough object to place biscuits on.
+    - biscuits (dict): Dictionary of Biscuit objects indexed by their type.
+    '''
+    global _worker_evaluator
+    _worker_evaluator = FitnessEvaluator(dough, biscuits)
+
+
+def _evaluate_chunk(population):
+    '''
+    Evaluate a chunk of the population inside a worker process.
+
+    Parameters:
+    - population (list): List of individuals to evaluate.
+
+    Returns:
+    - np.ndarray: Fitness value of each individual.
+    '''
+    return _worker_evaluator.evaluate(population)
+
+
+def biscuit_lengths(biscuits=None):
+    '''
+    Get a function giving the length of a biscuit type, looking each type up only once.
+
+    Parameters:
+    - biscuits (dict, optional): Dictionary of Biscuit objects indexed by their type. Defaults to the standard biscuit types.
+
+    Returns:
+    - callable: Function of the biscuit type returning its length.
+    '''
+    lengths = {}
+
+    def length_of(biscuit_type):
+        length = lengths.get(biscuit_type)
+        if length is None:
+            biscuit = biscuits[biscuit_type] if biscuits is not None else Biscuit(biscuit_type)
+            length = lengths[biscuit_type] = biscuit.length
+        return length
+    return length_of
+
+
+LOCAL_SEARCH_SCOPES = ('children', 'elites')
+
+
+def as_seed_sequence(seed=None):
+    '''
+    Turn a seed into a SeedSequence, from which independent random streams can be spawned.
+
+    Parameters:
+    - seed (int or np.random.SeedSequence, optional): The seed. Defaults to fresh entropy.
+
+    Returns:
+    - np.random.SeedSequence: The seed sequence.
+    '''
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    return np.random.SeedSequence(seed)
+
 
 class GeneticAlgorithm:
     '''
     Class representing a Genetic Algorithm for placing biscuits on a dough.
     '''
-    def __init__(self, dough, biscuits, population_size, mutation_rate, crossover_rate):
+    RANDOM_TYPE_WEIGHTS = {3: 4, 0: 2, 1: 2, 2: 1}  # Heuristic to favor certain biscuits in random solutions
+    tournament_size = None  # Default selection: roulette wheel, or tournaments of this size when set by a variant
+
+    def __init__(self, dough, biscuits, population_size, mutation_rate, crossover_rate, cache_size=4096, workers=None,
+                 observer=None, selection_method=None, seed=None, local_search=None, type_weights=None):
         '''
         Initialize the Genetic Algorithm.
 
@@ -15,49 +98,89 @@ class GeneticAlgorithm:
         - population_size (int): Size of the population.
         - mutation_rate (float): Rate of mutation.
         - crossover_rate (float): Rate of crossover.
+        - cache_size (int): Maximum number of fitness values kept in the LRU cache (0 disables it).
+        - workers (int, optional): Number of worker processes used to evaluate the population. Defaults to serial evaluation.
+          The pool is shut down by close() or the with statement, or else when the GA is garbage collected.
+        - observer (EvolutionObserver, optional): Observer receiving per-generation timings and counters.
+        - selection_method (callable, optional): Operator from Selection, called as selection_method(fitness_values, count, rng=...)
+          and returning the indices of the selected individuals. Defaults to the selection of each variant.
+        - seed (int or np.random.SeedSequence, optional): Seed of the random streams of this instance. The same seed
+          gives the same run. Defaults to fresh entropy.
+        - local_search (str, optional): Memetic step refining individuals with LocalSearch every generation: 'children'
+          refines the offspring, 'elites' the best individuals. Defaults to no local search.
+        - type_weights (dict, optional): Relative probability of drawing each biscuit type in random solutions. Defaults
+          to RANDOM_TYPE_WEIGHTS, plus weight 1 for the other types worth placing (value + length > 0), so fillers
+          such as the standard type 4 are never drawn.
         '''
+        if local_search is not None and local_search not in LOCAL_SEARCH_SCOPES:
+            raise ValueError(f"Unknown local search scope {local_search!r}, expected one of {LOCAL_SEARCH_SCOPES}")
         self.dough = dough
         self.biscuits = biscuits
         self.population_size = population_size
         self.mutation_rate = mutation_rate
         self.crossover_rate = crossover_rate
         self.population = []
+        self._evaluator = None
+        self._sampler = None
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._fitness_cache = OrderedDict()  # genome key -> fitness value
+        self._cache_table = None  # feasibility table the cached values were computed with
+        self.workers = workers
+        self._executor = None
+        self._executor_table = None  # feasibility table the workers were started with
+        self._executor_finalizer = None  # shuts the pool down if the GA is collected without close()
+        self.observer = observer
+        self.generation = 0
+        self.fitness_ns = 0  # time spent in fitness, only measured while an observer is attached
+        self.selection_method = selection_method
+        self.best_fitness = float('-inf')
+        self.best_individual = None
+        self.stop_reason = None
+        self.type_weights = type_weights
+        self.local_search = local_search
+        self._local_search = LocalSearch(dough, biscuits) if local_search is not None else None
+        # Own random streams: a Python one for scalar operators and a NumPy one for vectorized operators
+        self.seed_sequence = as_seed_sequence(seed)
+        python_seed, numpy_seed = self.seed_sequence.spawn(2)
+        self.rng = random.Random(int(python_seed.generate_state(1, np.uint64)[0]))
+        self.np_rng = np.random.default_rng(numpy_seed)
         self.initialize_population()
 
     def initialize_population(self):
         '''
-        Initialize the population with random solutions without overlapping.
+        Initialize the population with random solutions without overlapping, sampled all at once.
+        '''
+        self.population.extend(self.sampler().sample_population(self.population_size, self.np_rng))
+
+    def sampler(self):
+        '''
+        Get the sampler of random solutions, rebuilding it if defects were added to the dough since it was built.
+
+        Returns:
+        - SolutionSampler: Sampler drawing biscuit types with type_weights, or RANDOM_TYPE_WEIGHTS by default.
         '''
-        for _ in range(self.population_size):
-            individual = self.random_solution()
-            self.population.append(individual)
+        table = self.dough.feasibility(self.biscuits)
+        if self._sampler is None or self._sampler.table is not table:
+            weights = self.type_weights
+            if weights is None:
+                # Types without a heuristic weight, e.g. from a custom catalogue, are drawn with weight 1 if they
+                # add value: a filler costing as much as the cells it covers would only crowd random solutions
+                weights = {biscuit_type: self.RANDOM_TYPE_WEIGHTS.get(biscuit_type, 1) for biscuit_type, biscuit
+                           in self.biscuits.items()
+                           if biscuit_type in self.RANDOM_TYPE_WEIGHTS or biscuit.value + biscuit.length > 0}
+            self._sampler = SolutionSampler(table, self.biscuits, weights)
+        return self._sampler
 
     def random_solution(self):
         '''
         Generate a random solution without overlapping, favoring certain biscuit types based on heuristic.
 
         Returns:
-        - individual (list): A list representing a possible solution (position, biscuit_type).
-        '''
-        biscuit_types_list = [3, 3, 3, 3, 0, 0, 1, 1, 2]  # Heuristic to favor certain biscuits
-        individual = []
-        position = 0
-        while position < self.dough.LENGTH:
-            random.shuffle(biscuit_types_list)  # Shuffle to introduce randomness
-            for biscuit_type in biscuit_types_list:
-                biscuit = self.biscuits[biscuit_type]
-                if position + biscuit.length <= self.dough.LENGTH:
-                    # Check defects in the dough segment
-                    defects = self.dough.count_defects(position, biscuit.length)
-                    # Verify if biscuit meets defect constraints
-                    if all(defects.get(cls, 0) <= biscuit.max_defects[cls] for cls in biscuit.max_defects):
-                        individual.append((position, biscuit_type))
-                        position += biscuit.length
-                        break
-            else:
-                # No biscuit could be placed; move to the next position
-                position += 1
-        return individual
+        - individual (Genome): A possible solution made of (position, biscuit_type) genes.
+        '''
+        return self.sampler().sample(self.rng)
 
     def fitness(self, individual):
         '''
@@ -66,11 +189,34 @@ class GeneticAlgorithm:
         Parameters:
         - individual (list): A list representing an individual solution (list of tuples: (position, biscuit_type)).
 
+        Returns:
+        - total_value (float): The fitness value of the solution. Returns negative infinity for invalid solutions.
+        '''
+        start = perf_counter_ns() if self.observer is not None else 0
+        self._sync_with_dough()
+        key = self.genome_key(individual)
+        total_value = self._cached_fitness(key)
+        if total_value is None:
+            total_value = self._compute_fitness(individual)
+            self._cache_fitness(key, total_value)
+        if start:
+            self.fitness_ns += perf_counter_ns() - start
+        return total_value
+
+    def _compute_fitness(self, individual):
+        '''
+        Calculate the fitness value of an individual solution without going through the cache.
+
+        Parameters:
+        - individual (list): A list representing an individual solution (list of tuples: (position, biscuit_type)).
+
         Returns:
         - total_value (float): The fitness value of the solution. Returns negative infinity for invalid solutions.
         '''
         total_value = 0
-        occupied_positions = set()
+        used_positions = 0
+        occupancy = Occupancy()
+        table = self.dough.feasibility(self.biscuits)
 
         for position, biscuit_type in individual:
             biscuit = self.biscuits[biscuit_type]
@@ -81,26 +227,188 @@ class GeneticAlgorithm:
                 return float('-inf')  # Invalid solution due to exceeding dough length
 
             # Check for overlapping
-            biscuit_range = set(range(position, end_position))
-            if occupied_positions.intersection(biscuit_range):
+            if not occupancy.try_add(position, end_position):
                 return float('-inf')  # Invalid solution due to overlapping
-            occupied_positions.update(biscuit_range)
+            used_positions += biscuit.length
 
             # Check defects
-            defects = self.dough.count_defects(position, biscuit.length)
-            if all(defects.get(cls, 0) <= biscuit.max_defects[cls] for cls in biscuit.max_defects):
+            if table.is_valid(position, biscuit_type):
                 total_value += biscuit.value
             else:
                 return float('-inf')  # Invalid solution due to defects exceeding maximum
 
         # Calculate penalty for unused positions
-        total_positions = set(range(self.dough.LENGTH))
-        unused_positions = total_positions - occupied_positions
-        penalty = -len(unused_positions)
+        penalty = -(self.dough.LENGTH - used_positions)
         total_value += penalty  # Subtract penalty from total value
 
         return total_value
 
+    def evaluate_population(self, population):
+        '''
+        Calculate the fitness values of many individuals at once with vectorized operations.
+
+        Parameters:
+        - population (list): List of individuals (lists of tuples: (position, biscuit_type)).
+
+        Returns:
+        - np.ndarray: Fitness value of each individual, same as calling fitness on each of them.
+        '''
+        start = perf_counter_ns() if self.observer is not None else 0
+        self._sync_with_dough()
+        fitness_values = np.empty(len(population), dtype=np.float64)
+        missing = {}  # genome key -> indices of the individuals to evaluate
+        for index, individual in enumerate(population):
+            key = self.genome_key(individual)
+            if key in missing:
+                missing[key].append(index)
+                self.cache_hits += 1
+                continue
+            value = self._cached_fitness(key)
+            if value is None:
+                missing[key] = [index]
+            else:
+                fitness_values[index] = value
+
+        if missing:
+            computed = self._evaluate_batch([population[indices[0]] for indices in missing.values()])
+            for (key, indices), value in zip(missing.items(), computed.tolist()):
+                fitness_values[indices] = value
+                # Cache integers like fitness computes them, keep -inf as a float
+                self._cache_fitness(key, int(value) if value != float('-inf') else value)
+        if start:
+            self.fitness_ns += perf_counter_ns() - start
+        return fitness_values
+
+    def _evaluate_batch(self, population):
+        '''
+        Evaluate individuals that are not cached, in the worker processes if enabled.
+
+        Parameters:
+        - population (list): List of individuals to evaluate.
+
+        Returns:
+        - np.ndarray: Fitness value of each individual.
+        '''
+        if self.workers and self.workers > 1 and len(population) > 1:
+            executor = self._get_executor()
+            chunk_size = -(-len(population) // self.workers)
+            chunks = [population[i:i + chunk_size] for i in range(0, len(population), chunk_size)]
+            return np.concatenate(list(executor.map(_evaluate_chunk, chunks)))
+
+        if self._evaluator is None or self._evaluator.table is not self._cache_table:
+            self._evaluator = FitnessEvaluator(self.dough, self.biscuits)
+        return self._evaluator.evaluate(population)
+
+    def _get_executor(self):
+        '''
+        Get the process pool, restarting it if defects were added to the dough since the workers started.
+
+        Returns:
+        - ProcessPoolExecutor: Pool whose workers hold the current dough and biscuits.
+        '''
+        if self._executor is not None and self._executor_table is not self._cache_table:
+            self.close()
+        if self._executor is None:
+            # The dough and biscuits are pickled once per worker, not once per task
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker, initargs=(self.dough, self.biscuits))
+            self._executor_table = self._cache_table
+            # Shut the workers down when the GA is garbage collected, even if close() is never called
+            self._executor_finalizer = weakref.finalize(self, self._executor.shutdown)
+        return self._executor
+
+    def close(self):
+        '''
+        Shut down the worker processes, if any. They are started again on the next evaluation.
+        '''
+        if self._executor is not None:
+            self._executor_finalizer()
+            self._executor = None
+            self._executor_table = None
+            self._executor_finalizer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def genome_key(individual):
+        '''
+        Get an immutable representation of an individual, used to key the fitness cache.
+
+        Parameters:
+        - individual (Genome or list): The individual.
+
+        Returns:
+        - bytes or tuple: Raw content of a Genome, or the tuple of genes of a list.
+        '''
+        if isinstance(individual, Genome):
+            return individual.key()
+        return tuple(individual)
+
+    def _sync_with_dough(self):
+        '''
+        Drop the cached fitness values if defects were added to the dough since they were computed.
+        '''
+        table = self.dough.feasibility(self.biscuits)
+        if table is not self._cache_table:
+            self._fitness_cache.clear()
+            self._cache_table = table
+
+    def _cached_fitness(self, key):
+        '''
+        Look up a fitness value in the LRU cache and update the hit/miss counters.
+
+        Parameters:
+        - key (bytes or tuple): Immutable representation of the individual.
+
+        Returns:
+        - float or None: The cached fitness value, or None if it is not cached.
+        '''
+        value = self._fitness_cache.get(key)
+        if value is None:
+            self.cache_misses += 1
+        else:
+            self._fitness_cache.move_to_end(key)
+            self.cache_hits += 1
+        return value
+
+    def _cache_fitness(self, key, value):
+        '''
+        Store a fitness value in the LRU cache, evicting the least recently used entries if it is full.
+
+        Parameters:
+        - key (bytes or tuple): Immutable representation of the individual.
+        - value (float): The fitness value of the individual.
+        '''
+        if self.cache_size <= 0:
+            return
+        self._fitness_cache[key] = value
+        self._fitness_cache.move_to_end(key)
+        while len(self._fitness_cache) > self.cache_size:
+            self._fitness_cache.popitem(last=False)
+
+    def select_indices(self, fitness_values, count):
+        '''
+        Select individuals of the population with the configured selection operator.
+
+        Without a selection_method, variants setting tournament_size use vectorized tournament selection,
+        the others roulette wheel selection.
+
+        Parameters:
+        - fitness_values (np.ndarray): Fitness value of each individual of the population.
+        - count (int): Number of individuals to select.
+
+        Returns:
+        - np.ndarray: Indices of the selected individuals.
+        '''
+        if self.selection_method is not None:
+            return self.selection_method(fitness_values, count, rng=self.np_rng)
+        if self.tournament_size is not None:
+            return tournament_selection(fitness_values, count, self.tournament_size, self.np_rng)
+        return roulette_wheel_selection(fitness_values, count, self.np_rng)
+
     def selection(self):
         '''
         Perform roulette wheel selection to choose an individual from the population.
@@ -108,35 +416,27 @@ class GeneticAlgorithm:
         Returns:
         - selected_individual (list): The selected individual from the population.
         '''
-        fitness_values = [self.fitness(individual) for individual in self.population]
-        total_fitness = sum(fitness_values)
-
-        if total_fitness == 0:
-            # All individuals are invalid; return a random individual
-            return random.choice(self.population)
-
-        pick = random.uniform(0, total_fitness)
-        current = 0
-        for individual, fitness_value in zip(self.population, fitness_values):
-            current += fitness_value
-            if current > pick:
-                return individual
+        fitness_values = self.evaluate_population(self.population)
+        return self.population[self.select_indices(fitness_values, 1)[0]]
 
     @staticmethod
-    def crossover(parent1, parent2):
+    def crossover(parent1, parent2, biscuits=None):
         '''
         Perform one-point crossover on two parents to produce offspring without overlapping.
 
         Parameters:
         - parent1 (list): The first parent individual.
         - parent2 (list): The second parent individual.
+        - biscuits (dict, optional): Dictionary of Biscuit objects indexed by their type. Defaults to the standard biscuit types.
 
         Returns:
         - tuple: Two offspring individuals.
         '''
+        lengths = biscuit_lengths(biscuits)
+
         def create_child(p1, p2):
             child = []
-            positions = set()
+            occupancy = Occupancy()
             i = j = 0
             len_p1, len_p2 = len(p1), len(p2)
 
@@ -144,22 +444,17 @@ class GeneticAlgorithm:
             while i < len_p1 or j < len_p2:
                 if i < len_p1:
                     gene = p1[i]
-                    biscuit_length = Biscuit(gene[1]).length
-                    biscuit_positions = range(gene[0], gene[0] + biscuit_length)
-                    if not positions.intersection(biscuit_positions):
+                    if occupancy.try_add(gene[0], gene[0] + lengths(gene[1])):
                         child.append(gene)
-                        positions.update(biscuit_positions)
                     i += 1
                 if j < len_p2:
                     gene = p2[j]
-                    biscuit_length = Biscuit(gene[1]).length
-                    biscuit_positions = range(gene[0], gene[0] + biscuit_length)
-                    if not positions.intersection(biscuit_positions):
+                    if occupancy.try_add(gene[0], gene[0] + lengths(gene[1])):
                         child.append(gene)
-                        positions.update(biscuit_positions)
                     j += 1
-            return child
+            return Genome(child)
 
+        parent1, parent2 = list(parent1), list(parent2)
         child1 = create_child(parent1, parent2)
         child2 = create_child(parent2, parent1)
 
@@ -169,58 +464,312 @@ class GeneticAlgorithm:
         '''
         Apply mutation to an individual while avoiding overlapping.
 
+        When the fitness of the individual is cached, the fitness of the mutated individual is derived
+        from the mutation delta instead of being recomputed.
+
         Parameters:
         - individual (list): The individual to mutate.
 
         Returns:
         - individual (list): Mutated individual.
         '''
-        if len(individual) > 0 and random.random() < self.mutation_rate:
-            mutate_index = random.randint(0, len(individual) - 1)
-            biscuit_positions = set()
-            for idx, (pos, b_type) in enumerate(individual):
-                if idx != mutate_index:
-                    biscuit = self.biscuits[b_type]
-                    biscuit_positions.update(range(pos, pos + biscuit.length))
+        delta = self.mutate_delta(individual)
+        if delta:
+            old_key = self.genome_key(individual)
+            for index, _, new_gene in delta:
+                individual[index] = new_gene
+            self.apply_delta(old_key, individual, delta)
+        return individual
 
-            # Attempt to mutate the biscuit type or position without overlapping
-            position, biscuit_type = individual[mutate_index]
-            biscuit = self.biscuits[biscuit_type]
+    def mutate_delta(self, individual):
+        '''
+        Choose a mutation of an individual without applying it.
 
-            if random.random() > 0.5:
-                # Change biscuit type
-                new_biscuit_type = random.choice(list(self.biscuits.keys()))
-                new_biscuit = self.biscuits[new_biscuit_type]
-                end_position = position + new_biscuit.length
-                if end_position <= self.dough.LENGTH and not any(pos in biscuit_positions for pos in range(position, end_position)):
-                    individual[mutate_index] = (position, new_biscuit_type)
-            else:
-                # Change position
-                shift = random.choice([-1, 1])
-                new_position = position + shift
-                new_position = max(0, min(self.dough.LENGTH - biscuit.length, new_position))
-                end_position = new_position + biscuit.length
-                if not any(pos in biscuit_positions for pos in range(new_position, end_position)):
-                    individual[mutate_index] = (new_position, biscuit_type)
-        return individual
+        Parameters:
+        - individual (list): The individual to mutate.
+
+        Returns:
+        - delta (list): Changes as tuples (index, old_gene, new_gene), empty if nothing is mutated.
+        '''
+        if len(individual) > 0 and self.rng.random() < self.mutation_rate:
+            return self.random_delta(individual)
+        return []
+
+    def random_delta(self, individual):
+        '''
+        Choose a random change of the type or position of one gene, without overlapping the other genes.
+
+        Parameters:
+        - individual (list): A non-empty individual.
+
+        Returns:
+        - delta (list): Changes as tuples (index, old_gene, new_gene), empty if the change would overlap.
+        '''
+        delta = []
+        mutate_index = self.rng.randint(0, len(individual) - 1)
+        occupancy = Occupancy.from_genes(individual, biscuit_lengths(self.biscuits), skip=mutate_index)
+
+        # Attempt to mutate the biscuit type or position without overlapping
+        position, biscuit_type = individual[mutate_index]
+        biscuit = self.biscuits[biscuit_type]
+
+        if self.rng.random() > 0.5:
+            # Change biscuit type
+            new_biscuit_type = self.rng.choice(list(self.biscuits.keys()))
+            new_biscuit = self.biscuits[new_biscuit_type]
+            end_position = position + new_biscuit.length
+            if end_position <= self.dough.LENGTH and occupancy.is_free(position, end_position):
+                delta.append((mutate_index, (position, biscuit_type), (position, new_biscuit_type)))
+        else:
+            # Change position
+            shift = self.rng.choice([-1, 1])
+            new_position = position + shift
+            new_position = max(0, min(self.dough.LENGTH - biscuit.length, new_position))
+            end_position = new_position + biscuit.length
+            if occupancy.is_free(new_position, end_position):
+                delta.append((mutate_index, (position, biscuit_type), (new_position, biscuit_type)))
+        return delta
+
+    def perturb(self, individual, moves):
+        '''
+        Build a copy of an individual with a number of random changes applied, e.g. to spread seeds.
+
+        Parameters:
+        - individual (list): The individual to copy.
+        - moves (int): Number of random changes attempted.
+
+        Returns:
+        - Genome: The perturbed copy.
+        '''
+        perturbed = Genome(individual)
+        for _ in range(moves):
+            if len(perturbed) == 0:
+                break
+            delta = self.random_delta(perturbed)
+            if delta:
+                old_key = self.genome_key(perturbed)
+                for index, _, new_gene in delta:
+                    perturbed[index] = new_gene
+                self.apply_delta(old_key, perturbed, delta)
+        return perturbed
+
+    def seed_population(self, solutions, copies=0, moves=3):
+        '''
+        Replace the worst individuals of the population with known solutions and perturbed copies of them.
+
+        Seeds can come from any solver, e.g. Greedy.greedy_biscuit_placement or Solvers.SOLVERS, and let
+        the first generations start from good regions instead of climbing out of random ones.
+
+        Parameters:
+        - solutions (iterable): Placements as lists of tuples (position, biscuit_type).
+        - copies (int): Number of perturbed copies added for each solution.
+        - moves (int): Number of random changes attempted on each copy.
+
+        Returns:
+        - int: Number of individuals replaced, at most the population size.
+        '''
+        originals = [Genome(solution) for solution in solutions]
+        seeds = list(originals)
+        for _ in range(copies):
+            seeds.extend(self.perturb(seed, moves) for seed in originals)
+        seeds = seeds[:len(self.population)]
+        if seeds:
+            fitness_values = self.evaluate_population(self.population)
+            for index, seed in zip(np.argsort(fitness_values, kind='stable'), seeds):
+                self.population[index] = seed
+            self.update_best()
+        return len(seeds)
+
+    def delta_fitness(self, fitness_value, delta):
+        '''
+        Update a fitness value with the genes changed by a mutation.
+
+        Each placed biscuit adds its value and removes the penalty of the cells it covers, so a valid
+        individual scores sum(value + length) - LENGTH and only the changed genes need to be looked at.
+        The mutation operators guarantee that new genes do not overlap the other genes.
+
+        Parameters:
+        - fitness_value (float): Fitness of the individual before the mutation, must be finite.
+        - delta (list): Changes as tuples (index, old_gene, new_gene), applied in order.
+
+        Returns:
+        - float: Fitness of the mutated individual. Returns negative infinity for invalid solutions.
+        '''
+        table = self.dough.feasibility(self.biscuits)
+        for _, (_, old_type), (new_position, new_type) in delta:
+            if not table.is_valid(new_position, new_type):
+                return float('-inf')  # Invalid solution due to exceeding dough length or defects
+            old_biscuit, new_biscuit = self.biscuits[old_type], self.biscuits[new_type]
+            fitness_value += (new_biscuit.value + new_biscuit.length) - (old_biscuit.value + old_biscuit.length)
+        return fitness_value
+
+    def apply_delta(self, old_key, individual, delta):
+        '''
+        Cache the fitness of a mutated individual from the cached fitness of the individual it comes from.
+
+        Parameters:
+        - old_key (bytes or tuple): Cache key of the individual before the mutation.
+        - individual (list): The mutated individual.
+        - delta (list): Changes as tuples (index, old_gene, new_gene) that were applied.
+        '''
+        self._sync_with_dough()
+        old_fitness = self._fitness_cache.get(old_key)
+        if old_fitness is None or old_fitness == float('-inf'):
+            return  # Unknown, or invalid for a reason the delta cannot undo: evaluate it in full later
+        self._cache_fitness(self.genome_key(individual), self.delta_fitness(old_fitness, delta))
+
+    def refine(self, individuals, scope):
+        '''
+        Improve individuals with the local search if it is enabled for this scope.
+
+        The local search scores its moves incrementally and ends with the fitness of each refined
+        individual, which is cached so the next selection does not compute it again.
+
+        Parameters:
+        - individuals (list): The individuals to refine.
+        - scope (str): Which individuals these are, 'children' or 'elites'.
+
+        Returns:
+        - list: The refined individuals, or the individuals themselves if the local search is not enabled for this scope.
+        '''
+        if self.local_search != scope:
+            return individuals
+        self._sync_with_dough()
+        refined = []
+        for individual in individuals:
+            fitness_value, individual = self._local_search.improve(individual)
+            self._cache_fitness(self.genome_key(individual), fitness_value)
+            refined.append(individual)
+        return refined
 
     def evolve(self):
         '''
         Evolve the population over one generation.
         '''
-        new_population = []
-        while len(new_population) < self.population_size:
-            parent1 = self.selection()
-            parent2 = self.selection()
-
-            if random.random() < self.crossover_rate:
-                offspring1, offspring2 = self.crossover(parent1, parent2)
+        timer = self.start_generation()
+        # Score the population once and draw every parent of the generation from the same wheel
+        fitness_values = self.evaluate_population(self.population)
+        if self.local_search == 'elites':
+            # No elitism here: refine the best 20% before they are drawn as parents
+            elites = elite_indices(fitness_values, int(self.population_size * 0.2)).tolist()
+            for index, individual in zip(elites, self.refine([self.population[index] for index in elites], 'elites')):
+                self.population[index] = individual
+            fitness_values = self.evaluate_population(self.population)
+            timer.lap('local_search')
+        parents = self.select_indices(fitness_values, 2 * (-(-self.population_size // 2))).tolist()
+        timer.lap('selection')
+
+        offspring = []
+        while len(offspring) < self.population_size:
+            parent1 = self.population[parents[len(offspring)]]
+            parent2 = self.population[parents[len(offspring) + 1]]
+
+            if self.rng.random() < self.crossover_rate:
+                offspring.extend(self.crossover(parent1, parent2, self.biscuits))
             else:
-                offspring1, offspring2 = parent1.copy(), parent2.copy()
+                offspring.extend([parent1.copy(), parent2.copy()])
+        offspring = offspring[:self.population_size]
+        if self.cache_size > 0:
+            # Score the children before mutating them, so the fitness of the mutants is derived from theirs
+            self.evaluate_population(offspring)
+        timer.lap('crossover')
 
-            offspring1 = self.mutate(offspring1)
-            offspring2 = self.mutate(offspring2)
+        new_population = [self.mutate(individual) for individual in offspring]
+        timer.lap('mutation')
 
-            new_population.extend([offspring1, offspring2])
+        self.population = self.refine(new_population, 'children')
+        timer.lap('local_search')
+        self.end_generation(timer)
 
-        self.population = new_population[:self.population_size]
+    def start_generation(self):
+        '''
+        Start timing a generation if an observer is attached.
+
+        Returns:
+        - PhaseTimer or NullTimer: Timer whose lap(phase) method is called at the end of each phase of evolve.
+        '''
+        if self.observer is None:
+            return NULL_TIMER
+        timer = PhaseTimer(self)
+        timer.counters = (self.cache_hits + self.cache_misses, self.cache_misses, self.dough.count_defects_calls)
+        return timer
+
+    def end_generation(self, timer):
+        '''
+        Count the generation and report its timings and counters to the observer, if any.
+
+        Parameters:
+        - timer (PhaseTimer or NullTimer): The timer returned by start_generation.
+        '''
+        self.generation += 1
+        if self.observer is None:
+            return
+        fitness_calls, fitness_evaluations, count_defects_calls = timer.counters
+        stats = {
+            'generation': self.generation,
+            'phase_ns': timer.phase_ns,
+            'fitness_ns': self.fitness_ns - timer.start_fitness_ns,
+            'fitness_calls': self.cache_hits + self.cache_misses - fitness_calls,
+            'fitness_evaluations': self.cache_misses - fitness_evaluations,
+            'count_defects_calls': self.dough.count_defects_calls - count_defects_calls,
+        }
+        # Scoring the new population warms the cache for the next selection
+        fitness_values = self.evaluate_population(self.population)
+        stats['invalid_ratio'] = float(np.isneginf(fitness_values).mean()) if len(fitness_values) else 0.0
+        self.observer.on_generation(self, stats)
+
+    def update_best(self):
+        '''
+        Update the best individual found so far with the current population.
+
+        Returns:
+        - bool: True if the current population contains a new best individual.
+        '''
+        fitness_values = self.evaluate_population(self.population)
+        if not len(fitness_values):
+            return False
+        best_index = int(np.argmax(fitness_values))
+        if self.best_individual is not None and fitness_values[best_index] <= self.best_fitness:
+            return False
+        self.best_individual = self.population[best_index].copy()
+        self.best_fitness = self.fitness(self.best_individual)
+        return True
+
+    def run(self, max_generations=None, time_budget=None, target_fitness=None, stall_generations=None):
+        '''
+        Evolve the population until any stopping criterion is met, keeping the best individual found so far.
+
+        The reason of the stop is stored in stop_reason ('max_generations', 'time_budget', 'target_fitness'
+        or 'stall_generations').
+
+        Parameters:
+        - max_generations (int, optional): Maximum number of generations to evolve.
+        - time_budget (float, optional): Wall-clock budget in seconds, checked after every generation.
+        - target_fitness (float, optional): Stop as soon as an individual reaches this fitness.
+        - stall_generations (int, optional): Stop after this many generations without improvement of the best fitness.
+
+        Returns:
+        - best_fitness (float): The fitness of the best individual found.
+        - best_individual (Genome): The best individual found.
+        '''
+        if max_generations is None and time_budget is None and target_fitness is None and stall_generations is None:
+            raise ValueError("At least one stopping criterion must be given")
+        start = perf_counter()
+        self.update_best()
+        generations = 0
+        stalled = 0
+        while True:
+            if target_fitness is not None and self.best_fitness >= target_fitness:
+                self.stop_reason = 'target_fitness'
+            elif max_generations is not None and generations >= max_generations:
+                self.stop_reason = 'max_generations'
+            elif time_budget is not None and perf_counter() - start >= time_budget:
+                self.stop_reason = 'time_budget'
+            elif stall_generations is not None and stalled >= stall_generations:
+                self.stop_reason = 'stall_generations'
+            else:
+                self.evolve()
+                generations += 1
+                stalled = 0 if self.update_best() else stalled + 1
+                continue
+            return self.best_fitness, self.best_individual
@@ -1,13 +1,13 @@
-import random
 from GeneticAlgorithm import *
 from Biscuit import *
+from Selection import elite_indices
 
 class GeneticElitism(GeneticAlgorithm):
     '''
     Genetic Algorithm class implementing elitism in the selection process.
     Inherits from the base GeneticAlgorithm class.
     '''
-    def __init__(self, dough, biscuits, population_size, mutation_rate, crossover_rate):
+    def __init__(self, dough, biscuits, population_size, mutation_rate, crossover_rate, **kwargs):
         '''
         Initialize the GeneticElitism algorithm with the given parameters.
 
@@ -17,45 +17,33 @@ class GeneticElitism(GeneticAlgorithm):
         - population_size: The number of individuals in the population.
         - mutation_rate: The probability of mutation occurring.
         - crossover_rate: The probability of crossover occurring.
+        - **kwargs: Optional settings forwarded to GeneticAlgorithm (e.g. cache_size, workers, observer, local_search).
         '''
         # Call the initializer of the parent class GeneticAlgorithm
-        super().__init__(dough, biscuits, population_size, mutation_rate, crossover_rate)
+        super().__init__(dough, biscuits, population_size, mutation_rate, crossover_rate, **kwargs)
 
     def selection(self):
         '''
         Perform selection using roulette wheel selection with elitism.
 
-        This method calculates the cumulative fitness of the population,
-        picks a random value between 0 and the total fitness,
-        and iterates through the population summing fitness values
-        until the cumulative fitness exceeds the random value.
-        The individual at that point is selected.
+        This method keeps the best 20% of the population, then builds the cumulative fitness
+        of the population once and picks the rest of the individuals with a binary search
+        of random values between 0 and the total fitness.
 
         Returns:
         - selected_individuals: A list of selected individuals for the next generation.
         '''
-        # Calculate the total fitness of the population
-        total_fitness = sum(self.fitness(individual) for individual in self.population)
-
-        # Create a list to hold selected individuals
-        selected_individuals = []
+        # Calculate the fitness of the whole population once
+        fitness_values = self.evaluate_population(self.population)
 
         # Number of elite individuals to carry over
         elite_size = int(self.population_size * 0.2)
-        # Sort the population based on fitness in descending order
-        ranked_population = sorted(self.population, key=lambda ind: self.fitness(ind), reverse=True)
-        # Add elite individuals to the selected list
-        selected_individuals.extend(ranked_population[:elite_size])
-
-        # Perform roulette wheel selection for the rest of the population
-        for _ in range(self.population_size - elite_size):
-            pick = random.uniform(0, total_fitness)
-            current = 0
-            for individual in self.population:
-                current += self.fitness(individual)
-                if current > pick:
-                    selected_individuals.append(individual)
-                    break
+        # Add the best individuals to the selected list
+        selected_individuals = [self.population[index] for index in elite_indices(fitness_values, elite_size).tolist()]
+
+        # Perform roulette wheel selection for the rest of the population, with the wheel built once
+        for index in self.select_indices(fitness_values, self.population_size - elite_size).tolist():
+            selected_individuals.append(self.population[index])
 
         return selected_individuals
 
@@ -70,12 +58,21 @@ class GeneticElitism(GeneticAlgorithm):
         Returns:
         - The mutated individual.
         '''
+        old_key = None
+        delta = []
         for i in range(len(individual)):
-            if random.random() < mutation_rate:
+            if self.rng.random() < mutation_rate:
                 # Select a random position to swap with
-                swap_with = random.randint(0, len(individual) - 1)
+                swap_with = self.rng.randint(0, len(individual) - 1)
+                if old_key is None:
+                    old_key = self.genome_key(individual)
+                delta.append((i, individual[i], individual[swap_with]))
+                delta.append((swap_with, individual[swap_with], individual[i]))
                 # Swap the positions
                 individual[i], individual[swap_with] = individual[swap_with], individual[i]
+        if delta:
+            # Swapping genes keeps the same biscuits, the cached fitness carries over
+            self.apply_delta(old_key, individual, delta)
         return individual
 
     def mutate_population(self, population):
@@ -94,10 +91,13 @@ class GeneticElitism(GeneticAlgorithm):
         '''
         Evolve the population over one generation using elitism, crossover, and mutation.
         '''
+        timer = self.start_generation()
         # Perform selection to get individuals for breeding
         selected_individuals = self.selection()
-        # Start the new population with elite individuals
+        timer.lap('selection')
+        # Start the new population with elite individuals, refined first if enabled
         elite_size = int(self.population_size * 0.2)
+        selected_individuals[:elite_size] = self.refine(selected_individuals[:elite_size], 'elites')
         new_population = selected_individuals[:elite_size]
 
         # Generate offspring through crossover
@@ -107,56 +107,24 @@ class GeneticElitism(GeneticAlgorithm):
             parent1 = selected_individuals[i % len(selected_individuals)]
             parent2 = selected_individuals[(i + 1) % len(selected_individuals)]
             # Perform crossover to produce children
-            child1, child2 = GeneticAlgorithm.crossover(parent1, parent2)
+            child1, child2 = GeneticAlgorithm.crossover(parent1, parent2, self.biscuits)
             offspring_population.append(child1)
             # Ensure offspring list doesn't exceed required size
             if len(offspring_population) < self.population_size - elite_size:
                 offspring_population.append(child2)
+        if self.cache_size > 0:
+            # Score the children before mutating them, so the fitness of the mutants is derived from theirs
+            self.evaluate_population(offspring_population)
+        timer.lap('crossover')
 
         # Apply mutation to offspring
         mutated_offspring = self.mutate_population(offspring_population)
+        timer.lap('mutation')
+
+        # Refine the offspring, if enabled
+        mutated_offspring = self.refine(mutated_offspring, 'children')
+        timer.lap('local_search')
 
         # Combine elite individuals and mutated offspring to form new population
         self.population = new_population + mutated_offspring
-
-    def fitness(self, individual):
-        '''
-        Calculate the fitness value of an individual solution, including penalty for unused dough.
-
-        Parameters:
-        - individual: A list representing an individual solution (list of tuples: (position, biscuit_type)).
-
-        Returns:
-        - The fitness value of the solution. Returns negative infinity for invalid solutions.
-        '''
-        total_value = 0
-        occupied_positions = set()
-
-        for position, biscuit_type in individual:
-            biscuit = self.biscuits[biscuit_type]
-            end_position = position + biscuit.length
-
-            # Check if biscuit is within the dough
-            if end_position > self.dough.LENGTH:
-                return float('-inf')  # Invalid solution due to exceeding dough length
-
-            # Check for overlapping
-            biscuit_range = set(range(position, end_position))
-            if occupied_positions.intersection(biscuit_range):
-                return float('-inf')  # Invalid solution due to overlapping
-            occupied_positions.update(biscuit_range)
-
-            # Check defects
-            defects = self.dough.count_defects(position, biscuit.length)
-            if all(defects.get(cls, 0) <= biscuit.max_defects[cls] for cls in biscuit.max_defects):
-                total_value += biscuit.value
-            else:
-                return float('-inf')  # Invalid solution due to defects exceeding maximum
-
-        # Calculate penalty for unused positions
-        total_positions = set(range(self.dough.LENGTH))
-        unused_positions = total_positions - occupied_positions
-        penalty = -len(unused_positions)
-        total_value += penalty  # Subtract penalty from total value
-
-        return total_value
+        self.end_generation(timer)
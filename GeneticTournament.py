@@ -1,5 +1,5 @@
-import random
 from GeneticAlgorithm import *
+from Selection import elite_indices
 from Biscuit import *
 
 class GeneticTournament(GeneticAlgorithm):
@@ -7,8 +7,9 @@ class GeneticTournament(GeneticAlgorithm):
     Genetic Algorithm class implementing tournament selection and elitism.
     Inherits from the base GeneticAlgorithm class.
     '''
+    tournament_size = 5  # Size of the tournament for selection
 
-    def __init__(self, dough, biscuits, population_size, mutation_rate, crossover_rate):
+    def __init__(self, dough, biscuits, population_size, mutation_rate, crossover_rate, **kwargs):
         '''
         Initialize the GeneticTournament algorithm with the given parameters.
 
@@ -18,10 +19,10 @@ class GeneticTournament(GeneticAlgorithm):
         - population_size: The number of individuals in the population.
         - mutation_rate: The probability of mutation occurring.
         - crossover_rate: The probability of crossover occurring.
+        - **kwargs: Optional settings forwarded to GeneticAlgorithm (e.g. cache_size, workers, observer, local_search).
         '''
         # Call the initializer of the parent class GeneticAlgorithm
-        super().__init__(dough, biscuits, population_size, mutation_rate, crossover_rate)
-        self.tournament_size = 5  # Size of the tournament for selection
+        super().__init__(dough, biscuits, population_size, mutation_rate, crossover_rate, **kwargs)
 
     def selection(self, elite_size):
         '''
@@ -33,21 +34,14 @@ class GeneticTournament(GeneticAlgorithm):
         Returns:
         - selected_individuals: A list of selected individuals for the next generation.
         '''
-        # Rank the population based on fitness
-        ranked_population = [(individual, self.fitness(individual)) for individual in self.population]
-        # Sort the population in descending order of fitness
-        ranked_population.sort(key=lambda x: x[1], reverse=True)
+        fitness_values = self.evaluate_population(self.population)
 
         # Automatically select the top 'elite_size' individuals (elitism)
-        selected_individuals = [individual for individual, _ in ranked_population[:elite_size]]
+        selected_individuals = [self.population[index] for index in elite_indices(fitness_values, elite_size).tolist()]
 
-        # For the rest of the population, select individuals using tournament selection
-        for _ in range(len(ranked_population) - elite_size):
-            # Randomly select 'tournament_size' individuals from the population
-            tournament = random.sample(ranked_population, self.tournament_size)
-            # Select the best individual from the tournament
-            best_individual = sorted(tournament, key=lambda x: x[1], reverse=True)[0][0]
-            selected_individuals.append(best_individual)
+        # For the rest of the population, run all the tournaments at once
+        for index in self.select_indices(fitness_values, len(self.population) - elite_size).tolist():
+            selected_individuals.append(self.population[index])
 
         return selected_individuals
 
@@ -62,12 +56,21 @@ class GeneticTournament(GeneticAlgorithm):
         Returns:
         - The mutated individual.
         '''
+        old_key = None
+        delta = []
         for i in range(len(individual)):
-            if random.random() < mutation_rate:
+            if self.rng.random() < mutation_rate:
                 # Select a random position to swap with
-                swap_with = random.randint(0, len(individual) - 1)
+                swap_with = self.rng.randint(0, len(individual) - 1)
+                if old_key is None:
+                    old_key = self.genome_key(individual)
+                delta.append((i, individual[i], individual[swap_with]))
+                delta.append((swap_with, individual[swap_with], individual[i]))
                 # Swap the positions
                 individual[i], individual[swap_with] = individual[swap_with], individual[i]
+        if delta:
+            # Swapping genes keeps the same biscuits, the cached fitness carries over
+            self.apply_delta(old_key, individual, delta)
         return individual
 
     def mutate_population(self, population):
@@ -86,9 +89,13 @@ class GeneticTournament(GeneticAlgorithm):
         '''
         Evolve the population over one generation using tournament selection, crossover, and mutation.
         '''
+        timer = self.start_generation()
         elite_size = int(self.population_size * 0.2)  # 20% elitism
         # Perform selection to get individuals for breeding
         selected_individuals = self.selection(elite_size)
+        timer.lap('selection')
+        # Refine the elites before they are bred and carried over, if enabled
+        selected_individuals[:elite_size] = self.refine(selected_individuals[:elite_size], 'elites')
         # Start the new population with elite individuals
         new_population = selected_individuals[:elite_size]
 
@@ -99,56 +106,24 @@ class GeneticTournament(GeneticAlgorithm):
             parent1 = selected_individuals[i % len(selected_individuals)]
             parent2 = selected_individuals[(i + 1) % len(selected_individuals)]
             # Perform crossover to produce children
-            child1, child2 = GeneticAlgorithm.crossover(parent1, parent2)
+            child1, child2 = GeneticAlgorithm.crossover(parent1, parent2, self.biscuits)
             offspring_population.append(child1)
             # Ensure offspring list doesn't exceed required size
             if len(offspring_population) < self.population_size - elite_size:
                 offspring_population.append(child2)
+        if self.cache_size > 0:
+            # Score the children before mutating them, so the fitness of the mutants is derived from theirs
+            self.evaluate_population(offspring_population)
+        timer.lap('crossover')
 
         # Apply mutation to offspring
         mutated_offspring = self.mutate_population(offspring_population)
+        timer.lap('mutation')
+
+        # Refine the offspring, if enabled
+        mutated_offspring = self.refine(mutated_offspring, 'children')
+        timer.lap('local_search')
 
         # Combine elite individuals and mutated offspring to form new population
         self.population = new_population + mutated_offspring
-
-    def fitness(self, individual):
-        '''
-        Calculate the fitness value of an individual solution, including penalty for unused dough.
-
-        Parameters:
-        - individual: A list representing an individual solution (list of tuples: (position, biscuit_type)).
-
-        Returns:
-        - The fitness value of the solution. Returns negative infinity for invalid solutions.
-        '''
-        total_value = 0
-        occupied_positions = set()
-
-        for position, biscuit_type in individual:
-            biscuit = self.biscuits[biscuit_type]
-            end_position = position + biscuit.length
-
-            # Check if biscuit is within the dough
-            if end_position > self.dough.LENGTH:
-                return float('-inf')  # Invalid solution due to exceeding dough length
-
-            # Check for overlapping
-            biscuit_range = set(range(position, end_position))
-            if occupied_positions.intersection(biscuit_range):
-                return float('-inf')  # Invalid solution due to overlapping
-            occupied_positions.update(biscuit_range)
-
-            # Check defects
-            defects = self.dough.count_defects(position, biscuit.length)
-            if all(defects.get(cls, 0) <= biscuit.max_defects[cls] for cls in biscuit.max_defects):
-                total_value += biscuit.value
-            else:
-                return float('-inf')  # Invalid solution due to defects exceeding maximum
-
-        # Calculate penalty for unused positions
-        total_positions = set(range(self.dough.LENGTH))
-        unused_positions = total_positions - occupied_positions
-        penalty = -len(unused_positions)
-        total_value += penalty  # Subtract penalty from total value
-
-        return total_value
+        self.end_generation(timer)
@@ -0,0 +1,127 @@
+from array import array
+from itertools import chain
+
+
+class Genome:
+    '''
+    Compact individual storing its genes (position, biscuit_type) interleaved in one unsigned int array.
+
+    A Genome behaves like the list of tuples used elsewhere: it can be iterated, indexed, sliced and
+    appended to, so it can be passed to Dough.place_biscuits_GA or GeneticAlgorithm.fitness as is.
+    Like a list it is mutable, hence not hashable: use key() to index a Genome in a dict or a set.
+    '''
+    __slots__ = ('data',)
+
+    TYPECODE = 'I'  # 32-bit unsigned, positions are not limited to 65535 on long rolls
+
+    def __init__(self, genes=()):
+        '''
+        Initialize a Genome from genes.
+
+        Parameters:
+        - genes (iterable): Tuples (position, biscuit_type).
+        '''
+        self.data = array(self.TYPECODE, chain.from_iterable(genes))
+
+    @classmethod
+    def from_list(cls, individual):
+        '''
+        Build a Genome from the list format.
+
+        Parameters:
+        - individual (list): A list of tuples (position, biscuit_type).
+
+        Returns:
+        - Genome: The compact genome.
+        '''
+        return cls(individual)
+
+    @classmethod
+    def _from_data(cls, data):
+        genome = cls.__new__(cls)
+        genome.data = data
+        return genome
+
+    def to_list(self):
+        '''
+        Convert the Genome to the list format.
+
+        Returns:
+        - list: A list of tuples (position, biscuit_type).
+        '''
+        return list(self)
+
+    def key(self):
+        '''
+        Get an immutable snapshot of the genes, usable as a cache key.
+
+        Returns:
+        - bytes: Raw content of the genome.
+        '''
+        return self.data.tobytes()
+
+    def copy(self):
+        '''
+        Copy the Genome, in a single buffer copy.
+
+        Returns:
+        - Genome: An independent copy.
+        '''
+        return self._from_data(self.data[:])
+
+    def append(self, gene):
+        '''
+        Add a gene at the end of the Genome.
+
+        Parameters:
+        - gene (tuple): (position, biscuit_type).
+        '''
+        self.data.extend(gene)
+
+    def extend(self, genes):
+        '''
+        Add several genes at the end of the Genome.
+
+        Parameters:
+        - genes (iterable): Tuples (position, biscuit_type).
+        '''
+        self.data.extend(chain.from_iterable(genes))
+
+    def __len__(self):
+        return len(self.data) // 2
+
+    def __iter__(self):
+        values = iter(self.data)
+        return zip(values, values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return self._from_data(self.data[2 * start:2 * max(start, stop)])
+            return Genome(self.to_list()[index])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Genome index out of range")
+        return self.data[2 * index], self.data[2 * index + 1]
+
+    def __setitem__(self, index, gene):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Genome assignment index out of range")
+        self.data[2 * index], self.data[2 * index + 1] = gene
+
+    def __contains__(self, gene):
+        return any(own_gene == gene for own_gene in self)
+
+    def __eq__(self, other):
+        if isinstance(other, Genome):
+            return self.data == other.data
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(self.to_list())
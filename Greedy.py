@@ -0,0 +1,54 @@
+HEURISTICS = ('value', 'valength', 'valengthdef')
+
+
+def greedy_biscuit_placement(dough, biscuits, heuristic='value'):
+    '''
+    Place biscuits on the dough using a greedy approach based on a specified heuristic.
+
+    Parameters:
+    - dough (Dough): The dough object to place biscuits on.
+    - biscuits (dict): Dictionary of Biscuit objects indexed by their type.
+    - heuristic (str): The heuristic to use for sorting biscuits. Options are:
+        - 'value': Sort biscuits by their value in descending order.
+        - 'valength': Sort biscuits by their value-to-length ratio in descending order.
+        - Other ('valengthdef'): Sort biscuits by value divided by (length * sum of max defects), in descending order.
+
+    Returns:
+    - total_value (int): The total value of the biscuits placed, minus the penalty for unused dough.
+    - placed_biscuits (list): A list of tuples representing the placed biscuits as (position, biscuit_type).
+    '''
+    # Sort biscuits based on the selected heuristic
+    if heuristic == 'value':
+        sorted_biscuits = sorted(biscuits.items(), key=lambda item: item[1].value, reverse=True)
+    elif heuristic == 'valength':
+        sorted_biscuits = sorted(biscuits.items(), key=lambda item: item[1].value / item[1].length, reverse=True)
+    else:
+        sorted_biscuits = sorted(
+            biscuits.items(),
+            key=lambda item: item[1].value / (item[1].length * sum(item[1].max_defects.values())),
+            reverse=True
+        )
+
+    table = dough.feasibility(biscuits)
+    total_value = 0
+    current_position = 0
+    placed_biscuits = []
+    used_positions = 0
+
+    while current_position < dough.LENGTH:
+        for biscuit_type, biscuit in sorted_biscuits:
+            # The table checks both the end of the dough and the defect thresholds
+            if table.is_valid(current_position, biscuit_type):
+                placed_biscuits.append((current_position, biscuit_type))
+                total_value += biscuit.value
+                used_positions += biscuit.length
+                current_position += biscuit.length
+                break
+        else:
+            # No biscuit could be placed; move to the next position
+            current_position += 1
+
+    # Calculate the penalty for unused positions
+    total_value -= dough.LENGTH - used_positions
+
+    return total_value, placed_biscuits
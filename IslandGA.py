@@ -0,0 +1,223 @@
+import time
+from multiprocessing import Pipe, Process
+from GeneticAlgorithm import as_seed_sequence
+from GeneticTournament import GeneticTournament
+from Genome import Genome
+
+TOPOLOGIES = ('ring', 'full')
+
+
+def _island_worker(connection, variant, dough, biscuits, population_size, mutation_rate, crossover_rate, migration_size, kwargs):
+    '''
+    Run one island in its own process, answering evolve requests from the IslandGA orchestrator.
+
+    Once its population is initialized, the worker sends (best_fitness, best_individual).
+    Each request is then a tuple (generations, deadline, migrants). The migrants replace the worst individuals,
+    the island evolves for the given number of generations or until the deadline, then it answers with
+    (emigrants, best_fitness, best_individual, generations_run). A None request stops the worker.
+
+    Parameters:
+    - connection (Connection): Pipe end used to talk with the orchestrator.
+    - variant (type): The GeneticAlgorithm subclass run on this island.
+    - dough (Dough): The dough object to place biscuits on.
+    - biscuits (dict): Dictionary of Biscuit objects indexed by their type.
+    - population_size (int): Size of the island population.
+    - mutation_rate (float): Rate of mutation.
+    - crossover_rate (float): Rate of crossover.
+    - migration_size (int): Number of top individuals sent back as emigrants.
+    - kwargs (dict): Optional settings forwarded to the variant.
+    '''
+    try:
+        ga = variant(dough, biscuits, population_size, mutation_rate, crossover_rate, **kwargs)
+        ga.update_best()
+        connection.send((ga.best_fitness, list(ga.best_individual)))
+
+        while True:
+            message = connection.recv()
+            if message is None:
+                break
+            generations, deadline, migrants = message
+
+            if migrants:
+                # Migrants replace the worst individuals of the island
+                fitness_values = ga.evaluate_population(ga.population).tolist()
+                worst_first = sorted(range(len(fitness_values)), key=fitness_values.__getitem__)
+                for index, migrant in zip(worst_first, migrants):
+                    ga.population[index] = Genome(migrant)
+
+            generations_run = 0
+            while generations_run < generations and (deadline is None or time.time() < deadline):
+                ga.evolve()
+                generations_run += 1
+                ga.update_best()
+
+            fitness_values = ga.evaluate_population(ga.population).tolist()
+            ranked = sorted(range(len(fitness_values)), key=fitness_values.__getitem__, reverse=True)
+            emigrants = [(fitness_values[index], list(ga.population[index])) for index in ranked[:migration_size]]
+            connection.send((emigrants, ga.best_fitness, list(ga.best_individual), generations_run))
+        ga.close()
+    except Exception as error:
+        connection.send(error)
+    finally:
+        connection.close()
+
+
+class IslandGA:
+    '''
+    Island model running several Genetic Algorithm populations in separate processes.
+
+    Every migration_interval generations, the best migration_size individuals of each island are sent to
+    its neighbours: the previous island on a 'ring' topology, or every other island on a 'full' topology.
+    '''
+    def __init__(self, dough, biscuits, population_size, mutation_rate, crossover_rate, variant=GeneticTournament,
+                 islands=4, migration_interval=10, migration_size=2, topology='ring', seed=None, **kwargs):
+        '''
+        Initialize the island model.
+
+        Parameters:
+        - dough (Dough): The dough object to place biscuits on.
+        - biscuits (dict): Dictionary of Biscuit objects indexed by their type.
+        - population_size (int): Size of the population of each island.
+        - mutation_rate (float): Rate of mutation.
+        - crossover_rate (float): Rate of crossover.
+        - variant (type): The GeneticAlgorithm subclass run on every island (e.g. GeneticElitism, UniformCrossoverGA).
+        - islands (int): Number of islands, each running in its own process.
+        - migration_interval (int): Number of generations between two migrations.
+        - migration_size (int): Number of top individuals sent by each island at every migration.
+        - topology (str): 'ring' or 'full'.
+        - seed (int or np.random.SeedSequence, optional): Seed of the run, each island gets its own stream spawned from it.
+          With max_generations, the same seed gives the same run. Defaults to fresh entropy.
+        - **kwargs: Optional settings forwarded to the variant (e.g. cache_size).
+        '''
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"Unknown topology {topology!r}, expected one of {TOPOLOGIES}")
+        self.dough = dough
+        self.biscuits = biscuits
+        self.population_size = population_size
+        self.mutation_rate = mutation_rate
+        self.crossover_rate = crossover_rate
+        self.variant = variant
+        self.islands = islands
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.topology = topology
+        self.kwargs = kwargs
+        self.seed_sequence = as_seed_sequence(seed)
+        self.best_fitness = float('-inf')
+        self.best_individual = None
+        self.generations = 0
+
+    def migrate(self, emigrants):
+        '''
+        Choose the migrants received by each island.
+
+        Parameters:
+        - emigrants (list): For each island, its best individuals as (fitness, individual) sorted by decreasing fitness.
+
+        Returns:
+        - list: For each island, the list of individuals it receives.
+        '''
+        count = len(emigrants)
+        migrants = []
+        for island in range(count):
+            if self.topology == 'ring':
+                candidates = emigrants[(island - 1) % count]
+            else:
+                candidates = [emigrant for other in range(count) if other != island for emigrant in emigrants[other]]
+                candidates = sorted(candidates, key=lambda x: x[0], reverse=True)[:self.migration_size]
+            migrants.append([individual for _, individual in candidates])
+        return migrants
+
+    def _receive(self, connection):
+        '''
+        Receive the answer of an island, raising the error if its process failed.
+
+        Parameters:
+        - connection (Connection): Pipe end connected to the island.
+
+        Returns:
+        - tuple: The message sent by the island.
+        '''
+        result = connection.recv()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def _update_best(self, candidate):
+        '''
+        Keep the best individual found so far.
+
+        Parameters:
+        - candidate (tuple): (fitness, individual) reported by an island.
+        '''
+        best_fitness, best_individual = candidate
+        if self.best_individual is None or best_fitness > self.best_fitness:
+            self.best_fitness, self.best_individual = best_fitness, best_individual
+
+    def run(self, max_generations=None, time_budget=None):
+        '''
+        Evolve all islands until the generation count or the wall-clock budget is reached.
+
+        Parameters:
+        - max_generations (int, optional): Number of generations run on each island.
+        - time_budget (float, optional): Wall-clock budget in seconds.
+
+        Returns:
+        - best_fitness (float): The fitness of the best individual found on any island.
+        - best_individual (list): The best individual found, as a list of tuples (position, biscuit_type).
+        '''
+        if max_generations is None and time_budget is None:
+            raise ValueError("At least one of max_generations and time_budget must be given")
+        deadline = time.time() + time_budget if time_budget is not None else None
+
+        connections, processes = [], []
+        for island_seed in self.seed_sequence.spawn(self.islands):
+            parent_end, child_end = Pipe()
+            island_kwargs = dict(self.kwargs, seed=island_seed)
+            process = Process(target=_island_worker, args=(child_end, self.variant, self.dough, self.biscuits, self.population_size,
+                                                           self.mutation_rate, self.crossover_rate, self.migration_size, island_kwargs),
+                              daemon=True)
+            process.start()
+            child_end.close()
+            connections.append(parent_end)
+            processes.append(process)
+
+        try:
+            for connection in connections:
+                self._update_best(self._receive(connection))
+
+            migrants = [[] for _ in range(self.islands)]
+            generation = 0
+            while max_generations is None or generation < max_generations:
+                if deadline is not None and time.time() >= deadline:
+                    break
+                generations = self.migration_interval
+                if max_generations is not None:
+                    generations = min(generations, max_generations - generation)
+                for connection, island_migrants in zip(connections, migrants):
+                    connection.send((generations, deadline, island_migrants))
+
+                emigrants = []
+                generations_run = 0
+                for connection in connections:
+                    island_emigrants, best_fitness, best_individual, island_generations = self._receive(connection)
+                    emigrants.append(island_emigrants)
+                    generations_run = max(generations_run, island_generations)
+                    self._update_best((best_fitness, best_individual))
+
+                generation += generations_run
+                self.generations += generations_run
+                if generations_run < generations:
+                    break  # Deadline reached during this epoch
+                migrants = self.migrate(emigrants)
+        finally:
+            for connection in connections:
+                try:
+                    connection.send(None)
+                except (BrokenPipeError, OSError):
+                    pass
+                connection.close()
+            for process in processes:
+                process.join()
+
+        return self.best_fitness, self.best_individual
@@ -0,0 +1,280 @@
+from DPSolver import DPSolver
+from Genome import Genome
+
+
+class LocalSearch:
+    '''
+    Hill-climber refining a placement with moves scored incrementally, for memetic Genetic Algorithms.
+
+    A valid placement scores sum(value + length) - LENGTH, as in GeneticAlgorithm.delta_fitness, so a
+    move is worth the value + length of the biscuits it adds minus those it removes, without scoring
+    the whole placement again. Each pass walks the biscuits in position order and, for each one:
+    - fills the gap before it with feasible biscuits, the best value + length first;
+    - upgrades it to the best type worth more that fits in its free space, shifting the next biscuit
+      right to make room if needed;
+    - otherwise shifts it to the other end of its free space, when this opens a gap that can be filled.
+    These moves stop at local optima that random solutions often already are, so each pass then
+    re-solves the neighbourhood of every gap exactly with DPSolver.solve(start, end), as Reoptimizer
+    does: the gap with up to radius biscuits on each side, capped at max_cells cells so that a pass
+    costs less than solving the whole dough. The re-solve is opt-in: on a 500 cell roll the moves
+    alone take about as long as DPSolver.solve(), and neighbourhoods of radius 2 up to 32 cells
+    roughly triple that. Passes are repeated until one gains nothing or max_passes is reached.
+    '''
+    def __init__(self, dough, biscuits, max_passes=3, radius=2, max_cells=0):
+        '''
+        Initialize the local search.
+
+        Parameters:
+        - dough (Dough): The dough object the placements are on.
+        - biscuits (dict): Dictionary of Biscuit objects indexed by their type.
+        - max_passes (int): Maximum number of passes over the placement.
+        - radius (int): Number of biscuits on each side of a gap re-solved with it.
+        - max_cells (int): Maximum number of cells re-solved at once. Defaults to 0, which disables the re-solve.
+        '''
+        self.dough = dough
+        self.biscuits = biscuits
+        self.max_passes = max_passes
+        self.radius = radius
+        self.max_cells = max_cells
+        self._solver = DPSolver(dough, biscuits)
+
+    def improve(self, individual):
+        '''
+        Refine a placement until no move gains, or max_passes is reached.
+
+        Parameters:
+        - individual (list): A placement as tuples (position, biscuit_type), in any order.
+
+        Returns:
+        - fitness_value (float): The fitness of the refined placement. Returns negative infinity for invalid placements.
+        - individual (Genome): The refined placement sorted by position, or the individual itself if it is invalid.
+        '''
+        table = self.dough.feasibility(self.biscuits)
+        length = self.dough.LENGTH
+        placement = sorted(individual)
+
+        fitness_value = -length
+        end = 0
+        for position, biscuit_type in placement:
+            biscuit = self.biscuits[biscuit_type]
+            if position < end or not table.is_valid(position, biscuit_type):
+                return float('-inf'), individual  # Overlapping or infeasible: nothing to climb from
+            end = position + biscuit.length
+            fitness_value += biscuit.value + biscuit.length
+
+        # Biscuit types worth placing, best value + length first
+        ranked = sorted(((biscuit.value + biscuit.length, biscuit_type, biscuit.length)
+                         for biscuit_type, biscuit in self.biscuits.items() if biscuit.value + biscuit.length > 0),
+                        reverse=True)
+        rows = {biscuit_type: table.row(biscuit_type) for biscuit_type in self.biscuits}
+
+        for _ in range(self.max_passes):
+            placement, gain = self._climb(placement, ranked, rows, length)
+            if self.max_cells > 0:
+                placement, resolve_gain = self._resolve(placement, length)
+                gain += resolve_gain
+            fitness_value += gain
+            if gain <= 0:
+                break
+        return fitness_value, Genome(placement)
+
+    def _climb(self, placement, ranked, rows, length):
+        '''
+        Run one pass of moves over a valid placement.
+
+        Parameters:
+        - placement (list): Valid placement as tuples (position, biscuit_type) sorted by position.
+        - ranked (list): Tuples (value + length, biscuit_type, length) of the types worth placing, best first.
+        - rows (dict): Feasibility row of each biscuit type.
+        - length (int): Length of the dough.
+
+        Returns:
+        - placement (list): The refined placement sorted by position.
+        - gain (int): Fitness gained by the pass.
+        '''
+        placement = list(placement)  # the next biscuit may be shifted while the current one is upgraded
+        refined = []
+        gain = 0
+        previous_end = 0
+        for index in range(len(placement)):
+            position, biscuit_type = placement[index]
+            biscuit = self.biscuits[biscuit_type]
+            next_start = placement[index + 1][0] if index + 1 < len(placement) else length
+
+            # Fill the gap before the biscuit
+            genes, fill_gain = self._fill(ranked, rows, previous_end, position)
+            if genes:
+                refined.extend(genes)
+                gain += fill_gain
+                last_position, last_type = genes[-1]
+                previous_end = last_position + self.biscuits[last_type].length
+
+            upgrade = self._upgrade(placement, index, previous_end, ranked, rows, length)
+            if upgrade is not None:
+                upgrade_gain, position, biscuit_type = upgrade
+                gain += upgrade_gain
+                biscuit = self.biscuits[biscuit_type]
+            else:
+                row = rows[biscuit_type]
+                # Shift left if the gap opened before the next biscuit takes more than the current one
+                shifted = row.find(1, previous_end, position)
+                if shifted != -1 and (self._fill(ranked, rows, shifted + biscuit.length, next_start)[1] >
+                                      self._fill(ranked, rows, position + biscuit.length, next_start)[1]):
+                    position = shifted
+                else:
+                    # Shift right if the gap opened after the previous biscuit can be filled
+                    shifted = row.rfind(1, position + 1, next_start - biscuit.length + 1)
+                    if shifted != -1:
+                        genes, fill_gain = self._fill(ranked, rows, previous_end, shifted)
+                        if fill_gain > 0:
+                            refined.extend(genes)
+                            gain += fill_gain
+                            position = shifted
+
+            refined.append((position, biscuit_type))
+            previous_end = position + biscuit.length
+
+        # Fill the gap after the last biscuit
+        genes, fill_gain = self._fill(ranked, rows, previous_end, length)
+        refined.extend(genes)
+        return refined, gain + fill_gain
+
+    def _upgrade(self, placement, index, previous_end, ranked, rows, length):
+        '''
+        Find the best type worth more than a biscuit that fits in its free space, shifting the next biscuit right if needed.
+
+        The new biscuit starts at its first valid position after the previous biscuit, which leaves the
+        most room to the next one. When the next biscuit is moved, placement is updated.
+
+        Parameters:
+        - placement (list): The placement being refined, sorted by position.
+        - index (int): Index of the biscuit to upgrade.
+        - previous_end (int): Cell after the end of the previous biscuit.
+        - ranked (list): Tuples (value + length, biscuit_type, length) of the types worth placing, best first.
+        - rows (dict): Feasibility row of each biscuit type.
+        - length (int): Length of the dough.
+
+        Returns:
+        - tuple or None: (gain, position, biscuit_type) of the upgraded biscuit, None if no upgrade fits.
+        '''
+        position, biscuit_type = placement[index]
+        biscuit = self.biscuits[biscuit_type]
+        score = biscuit.value + biscuit.length
+        if index + 1 < len(placement):
+            next_position, next_type = placement[index + 1]
+            next_length = self.biscuits[next_type].length
+            following = placement[index + 2][0] if index + 2 < len(placement) else length
+        else:
+            next_position, next_length, following = length, 0, length
+
+        for new_score, new_type, new_length in ranked:
+            if new_score <= score:
+                break
+            last = following - next_length - new_length  # last start leaving room for the next biscuit
+            if last < previous_end:
+                continue
+            start = rows[new_type].find(1, previous_end, last + 1)
+            if start == -1:
+                continue
+            end = start + new_length
+            if end <= next_position:
+                return new_score - score, start, new_type
+            # Make room by shifting the next biscuit right
+            shifted = rows[next_type].find(1, end, following - next_length + 1)
+            if shifted != -1:
+                placement[index + 1] = (shifted, next_type)
+                return new_score - score, start, new_type
+        return None
+
+    def _resolve(self, placement, length):
+        '''
+        Re-solve the neighbourhood of each gap exactly, keeping the new placement of the neighbourhoods that gain.
+
+        A neighbourhood spans from the end of the biscuit before it to the start of the biscuit after it.
+        Its biscuits are dropped from the far side while it has more than max_cells cells, and it is
+        skipped if the gap alone is larger. Its current score is sum(value + length) - its cells, the
+        scale of the value returned by DPSolver.solve(start, end).
+
+        Parameters:
+        - placement (list): Valid placement as tuples (position, biscuit_type) sorted by position.
+        - length (int): Length of the dough.
+
+        Returns:
+        - placement (list): The refined placement sorted by position.
+        - gain (int): Fitness gained by the pass.
+        '''
+        count = len(placement)
+        refined = []
+        gain = 0
+        first = 0  # biscuits before first are settled in refined, and end before floor
+        floor = 0
+
+        def start_of(index):  # first cell of a region whose first re-solved biscuit is placement[index]
+            if index == first:
+                return floor
+            position, biscuit_type = placement[index - 1]
+            return position + self.biscuits[biscuit_type].length
+
+        def end_of(index):  # cell after a region whose biscuits end before placement[index]
+            return placement[index][0] if index < count else length
+
+        gap = 0  # the gap before placement[gap], or after the last biscuit if gap == count
+        while gap <= count:
+            if end_of(gap) == start_of(gap):
+                gap += 1
+                continue
+            low, high = max(gap - self.radius, first), min(gap + self.radius, count)
+            while end_of(high) - start_of(low) > self.max_cells and (low < gap or high > gap):
+                if high - gap >= gap - low:
+                    high -= 1
+                else:
+                    low += 1
+            region_start, region_end = start_of(low), end_of(high)
+            if region_end - region_start > self.max_cells:
+                gap += 1  # left to the greedy fill of the moves
+                continue
+
+            current = sum(self.biscuits[biscuit_type].value + self.biscuits[biscuit_type].length
+                          for _, biscuit_type in placement[low:high]) - (region_end - region_start)
+            region_value, region_placement = self._solver.solve(region_start, region_end)
+            if region_value > current:
+                gain += region_value - current
+                refined.extend(placement[first:low])
+                refined.extend(region_placement)
+                first, floor = high, region_end
+            gap = high + 1
+        refined.extend(placement[first:])
+        return refined, gain
+
+    def _fill(self, ranked, rows, start, end):
+        '''
+        Greedily fill the free section [start, end): at the first position where some type fits, place the best one.
+
+        Parameters:
+        - ranked (list): Tuples (value + length, biscuit_type, length) of the types worth placing, best first.
+        - rows (dict): Feasibility row of each biscuit type.
+        - start (int): First free cell.
+        - end (int): Cell after the last free cell.
+
+        Returns:
+        - genes (list): The placed biscuits as tuples (position, biscuit_type) sorted by position.
+        - gain (int): Fitness gained by placing them.
+        '''
+        genes = []
+        gain = 0
+        position = start
+        while True:
+            best = None
+            for score, biscuit_type, biscuit_length in ranked:
+                last = end - biscuit_length  # last start position inside the section
+                if last < position:
+                    continue
+                first = rows[biscuit_type].find(1, position, last + 1)
+                if first != -1 and (best is None or first < best[0]):
+                    best = (first, score, biscuit_type, biscuit_length)
+            if best is None:
+                return genes, gain
+            first, score, biscuit_type, biscuit_length = best
+            genes.append((first, biscuit_type))
+            gain += score
+            position = first + biscuit_length
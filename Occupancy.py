@@ -0,0 +1,105 @@
+from bisect import bisect_right
+
+
+class Occupancy:
+    '''
+    Occupied sections of a dough, kept as sorted disjoint intervals [start, end).
+
+    Checking whether a section is free is a binary search over the interval starts, O(log n), and
+    no object is allocated per cell or per biscuit.
+    '''
+    __slots__ = ('starts', 'ends')
+
+    def __init__(self):
+        '''
+        Initialize an empty occupancy.
+        '''
+        self.starts = []
+        self.ends = []
+
+    @classmethod
+    def from_genes(cls, genes, lengths, skip=None):
+        '''
+        Build the occupancy of the genes of an individual.
+
+        Parameters:
+        - genes (iterable): Tuples (position, biscuit_type), not overlapping each other.
+        - lengths (dict or callable): Length of each biscuit type, as a mapping or a function of the type.
+        - skip (int, optional): Index of a gene to leave out.
+
+        Returns:
+        - Occupancy: The occupied sections.
+        '''
+        length_of = lengths if callable(lengths) else lengths.__getitem__
+        intervals = sorted((position, position + length_of(biscuit_type))
+                           for index, (position, biscuit_type) in enumerate(genes) if index != skip)
+        occupancy = cls()
+        occupancy.starts = [start for start, _ in intervals]
+        occupancy.ends = [end for _, end in intervals]
+        return occupancy
+
+    def is_free(self, start, end):
+        '''
+        Check whether a section does not overlap any occupied section.
+
+        Parameters:
+        - start (int): Starting position of the section.
+        - end (int): Position after the end of the section.
+
+        Returns:
+        - bool: True if the section is free.
+        '''
+        index = bisect_right(self.starts, start)
+        if index > 0 and self.ends[index - 1] > start:
+            return False
+        return index == len(self.starts) or self.starts[index] >= end
+
+    def add(self, start, end):
+        '''
+        Mark a free section as occupied.
+
+        Parameters:
+        - start (int): Starting position of the section.
+        - end (int): Position after the end of the section.
+        '''
+        index = bisect_right(self.starts, start)
+        self.starts.insert(index, start)
+        self.ends.insert(index, end)
+
+    def try_add(self, start, end):
+        '''
+        Mark a section as occupied if it is free.
+
+        Parameters:
+        - start (int): Starting position of the section.
+        - end (int): Position after the end of the section.
+
+        Returns:
+        - bool: True if the section was free and is now occupied.
+        '''
+        index = bisect_right(self.starts, start)
+        if (index > 0 and self.ends[index - 1] > start) or (index < len(self.starts) and self.starts[index] < end):
+            return False
+        self.starts.insert(index, start)
+        self.ends.insert(index, end)
+        return True
+
+    def remove(self, start, end):
+        '''
+        Free an occupied section, added before with the same bounds.
+
+        Parameters:
+        - start (int): Starting position of the section.
+        - end (int): Position after the end of the section.
+        '''
+        index = bisect_right(self.starts, start) - 1
+        if index < 0 or self.starts[index] != start or self.ends[index] != end:
+            raise ValueError(f"Section [{start}, {end}) is not occupied")
+        del self.starts[index]
+        del self.ends[index]
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __iter__(self):
+        return zip(self.starts, self.ends)
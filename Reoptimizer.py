@@ -0,0 +1,117 @@
+from bisect import bisect_right
+from DPSolver import DPSolver
+
+
+class Reoptimizer:
+    '''
+    Keep a placement up to date as defects are detected late, without solving the whole dough again.
+
+    Adding defects patches the feasibility table around them only. A biscuit still valid after new
+    defects keeps its value, so only the biscuits made invalid are removed, together with margin
+    neighbours on each side. The region they free is filled again with DPSolver restricted to it.
+    The work is proportional to the repaired regions, not to the dough.
+    '''
+    def __init__(self, dough, biscuits, placement, margin=2):
+        '''
+        Initialize the reoptimizer with a valid placement.
+
+        Parameters:
+        - dough (Dough): The dough object the placement is on.
+        - biscuits (dict): Dictionary of Biscuit objects indexed by their type.
+        - placement (list): A valid placement as tuples (position, biscuit_type), e.g. from a solver.
+        - margin (int): Number of neighbouring biscuits re-placed on each side of an invalidated biscuit.
+        '''
+        self.dough = dough
+        self.biscuits = biscuits
+        self.margin = margin
+        self.placement = sorted(placement)
+        self.starts = [position for position, _ in self.placement]
+        self._solver = DPSolver(dough, biscuits)
+
+        table = dough.feasibility(biscuits)
+        end = 0
+        self.total_value = -dough.LENGTH
+        for position, biscuit_type in self.placement:
+            if position < end or not table.is_valid(position, biscuit_type):
+                raise ValueError(f"Biscuit type {biscuit_type} at position {position} is not a valid placement")
+            end = position + biscuits[biscuit_type].length
+            self.total_value += biscuits[biscuit_type].value + biscuits[biscuit_type].length
+
+    def add_defect(self, position, defect_class):
+        '''
+        Add a defect to the dough and repair the placement.
+
+        Parameters:
+        - position (float): Position of the defect on the dough.
+        - defect_class (str): Class of the defect ('a', 'b', 'c').
+
+        Returns:
+        - total_value (int): The value of the updated placement, minus the penalty for unused dough.
+        - placement (list): The updated placement as tuples (position, biscuit_type) sorted by position.
+        '''
+        self.dough.add_defect(position, defect_class)
+        return self.repair([position])
+
+    def add_defects(self, positions, defect_classes):
+        '''
+        Add many defects to the dough and repair the placement once.
+
+        Parameters:
+        - positions (array-like): Positions of the defects on the dough.
+        - defect_classes (array-like): Class of each defect ('a', 'b', 'c').
+
+        Returns:
+        - total_value (int): The value of the updated placement, minus the penalty for unused dough.
+        - placement (list): The updated placement as tuples (position, biscuit_type) sorted by position.
+        '''
+        positions = list(positions)
+        self.dough.add_defects(positions, defect_classes)
+        return self.repair(positions)
+
+    def repair(self, positions):
+        '''
+        Re-place the biscuits around the new defects that made them invalid.
+
+        Parameters:
+        - positions (list): Positions of the defects added to the dough since the last repair.
+
+        Returns:
+        - total_value (int): The value of the updated placement, minus the penalty for unused dough.
+        - placement (list): The updated placement as tuples (position, biscuit_type) sorted by position.
+        '''
+        table = self.dough.feasibility(self.biscuits)
+        broken = set()
+        for position in positions:
+            index = bisect_right(self.starts, position) - 1
+            if index >= 0:
+                start, biscuit_type = self.placement[index]
+                if position < start + self.biscuits[biscuit_type].length and not table.is_valid(start, biscuit_type):
+                    broken.add(index)
+        if not broken:
+            return self.total_value, self.placement
+
+        # Merge the biscuits to re-place into runs of consecutive indices
+        runs = []
+        for index in sorted(broken):
+            low, high = max(0, index - self.margin), min(len(self.placement) - 1, index + self.margin)
+            if runs and low <= runs[-1][1] + 1:
+                runs[-1][1] = max(runs[-1][1], high)
+            else:
+                runs.append([low, high])
+
+        # Repair from the right so the indices of the runs on the left stay valid
+        for low, high in reversed(runs):
+            region_start = 0
+            if low > 0:
+                position, biscuit_type = self.placement[low - 1]
+                region_start = position + self.biscuits[biscuit_type].length
+            region_end = self.placement[high + 1][0] if high + 1 < len(self.placement) else self.dough.LENGTH
+
+            removed = sum(self.biscuits[biscuit_type].value + self.biscuits[biscuit_type].length
+                          for _, biscuit_type in self.placement[low:high + 1])
+            region_value, region_placement = self._solver.solve(region_start, region_end)
+            # region_value counts the empty cells of the region, add them back to get sum(value + length)
+            self.total_value += region_value + (region_end - region_start) - removed
+            self.placement[low:high + 1] = region_placement
+            self.starts[low:high + 1] = [position for position, _ in region_placement]
+        return self.total_value, self.placement
@@ -0,0 +1,140 @@
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from Dough import Dough
+from GeneticAlgorithm import as_seed_sequence
+from Solvers import accepts_seed, get_solver
+
+
+def _solve_segment(segment, biscuits, solver, solver_kwargs):
+    '''
+    Solve one segment, inside a worker process or in the calling process.
+
+    Parameters:
+    - segment (Dough): The dough of the segment, positions starting at 0.
+    - biscuits (dict): Dictionary of Biscuit objects indexed by their type.
+    - solver (str or callable): Solver name from Solvers.SOLVERS, or a picklable solver function.
+    - solver_kwargs (dict): Optional settings forwarded to the solver.
+
+    Returns:
+    - tuple: (total_value, placement) of the segment.
+    '''
+    return get_solver(solver)(segment, biscuits, **solver_kwargs)
+
+
+class SegmentSolver:
+    '''
+    Split a dough into independent segments at the cells no biscuit can straddle, solve each segment
+    with any solver, and stitch the placements back together.
+
+    A boundary between two cells is a cut when no feasible placement, according to the feasibility
+    table, starts before it and ends after it. The value of a placement is a sum over biscuits and
+    empty cells, so the best placement of the dough is the union of the best placements of its
+    segments, and the work scales with the largest segment instead of the whole dough.
+    '''
+    def __init__(self, dough, biscuits, solver='dp', workers=None, min_segment_length=64, **solver_kwargs):
+        '''
+        Initialize the solver.
+
+        Parameters:
+        - dough (Dough): The dough object to place biscuits on.
+        - biscuits (dict): Dictionary of Biscuit objects indexed by their type.
+        - solver (str or callable): Solver name from Solvers.SOLVERS, or a solver function, run on each segment.
+        - workers (int, optional): Number of worker processes solving segments in parallel. Defaults to serial solving.
+        - min_segment_length (int): Cuts closer than this to the previous one are skipped, so tiny segments are
+          merged and do not each pay for a solver call.
+        - **solver_kwargs: Optional settings forwarded to the solver. A seed is not forwarded as is: each segment
+          gets its own stream spawned from it. It is ignored by solvers without a seed, such as 'dp'.
+        '''
+        get_solver(solver)  # Fail fast on unknown solver names
+        self.dough = dough
+        self.biscuits = biscuits
+        self.solver = solver
+        self.workers = workers
+        self.min_segment_length = min_segment_length
+        self.solver_kwargs = solver_kwargs
+
+    def cut_points(self):
+        '''
+        Find every boundary that no feasible placement crosses.
+
+        Returns:
+        - np.ndarray: Sorted cells c, 0 < c < LENGTH, such that no biscuit can cover both c - 1 and c.
+        '''
+        length = self.dough.LENGTH
+        table = self.dough.feasibility(self.biscuits)
+        crossings = np.zeros(length + 1, dtype=np.int64)
+        for biscuit_type, biscuit in self.biscuits.items():
+            starts = np.flatnonzero(np.frombuffer(bytes(table.row(biscuit_type)), dtype=np.uint8))
+            if biscuit.length > 1 and len(starts):
+                # A biscuit at p crosses the boundaries p + 1 to p + length - 1
+                np.add.at(crossings, starts + 1, 1)
+                np.add.at(crossings, starts + biscuit.length, -1)
+        crossed = np.cumsum(crossings)
+        return np.flatnonzero(crossed[1:length] == 0) + 1
+
+    def segments(self):
+        '''
+        Split the dough into segments at the cut points, merging segments shorter than min_segment_length.
+
+        Returns:
+        - list: Tuples (start, end) of the segments, covering the dough in order.
+        '''
+        segments = []
+        start = 0
+        for cut in self.cut_points().tolist():
+            if cut - start >= self.min_segment_length:
+                segments.append((start, cut))
+                start = cut
+        if start < self.dough.LENGTH:
+            segments.append((start, self.dough.LENGTH))
+        return segments
+
+    def segment_dough(self, start, end):
+        '''
+        Build the dough of a segment, with its defects shifted to start at position 0.
+
+        Parameters:
+        - start (int): First cell of the segment.
+        - end (int): Cell after the end of the segment.
+
+        Returns:
+        - Dough: The dough of the segment.
+        '''
+        segment = Dough(end - start, self.dough.known_classes)
+        defects = [(position - start, defect_class) for position, defect_class in self.dough.defects_list
+                   if start <= position < end]
+        segment.add_defects([position for position, _ in defects], [defect_class for _, defect_class in defects])
+        return segment
+
+    def solve(self):
+        '''
+        Solve every segment and stitch the results.
+
+        Returns:
+        - total_value (int): The value of the placement, minus the penalty for unused dough.
+        - placement (list): A list of tuples (position, biscuit_type) sorted by position.
+        '''
+        segments = self.segments()
+        doughs = [self.segment_dough(start, end) for start, end in segments]
+        solver_kwargs = self.solver_kwargs
+        if 'seed' in solver_kwargs and not accepts_seed(self.solver):
+            solver_kwargs = {key: value for key, value in solver_kwargs.items() if key != 'seed'}
+        segment_kwargs = [solver_kwargs] * len(doughs)
+        if solver_kwargs.get('seed') is not None:
+            # Same seed on every segment would correlate their runs: give each one its own stream
+            segment_seeds = as_seed_sequence(solver_kwargs['seed']).spawn(len(doughs))
+            segment_kwargs = [dict(solver_kwargs, seed=segment_seed) for segment_seed in segment_seeds]
+        if self.workers and self.workers > 1 and len(segments) > 1:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(segments))) as executor:
+                results = list(executor.map(_solve_segment, doughs, [self.biscuits] * len(doughs),
+                                            [self.solver] * len(doughs), segment_kwargs))
+        else:
+            results = [_solve_segment(dough, self.biscuits, self.solver, kwargs)
+                       for dough, kwargs in zip(doughs, segment_kwargs)]
+
+        total_value = 0
+        placement = []
+        for (start, _), (segment_value, segment_placement) in zip(segments, results):
+            total_value += segment_value
+            placement.extend((start + position, biscuit_type) for position, biscuit_type in sorted(segment_placement))
+        return total_value, placement
@@ -0,0 +1,111 @@
+import numpy as np
+
+_default_rng = np.random.default_rng()
+
+
+def selection_weights(fitness_values):
+    '''
+    Turn fitness values into non-negative selection weights.
+
+    Invalid individuals (negative infinity) get a weight of 0. If some valid fitness is negative,
+    all valid fitness values are shifted so that the lowest one gets a weight of 0.
+
+    Parameters:
+    - fitness_values (array-like): Fitness value of each individual.
+
+    Returns:
+    - np.ndarray: Weight of each individual. All ones if no individual has a positive weight.
+    '''
+    fitness_values = np.asarray(fitness_values, dtype=np.float64)
+    valid = np.isfinite(fitness_values)
+    weights = np.where(valid, fitness_values, 0.0)
+    if valid.any():
+        lowest = weights[valid].min()
+        if lowest < 0:
+            weights = np.where(valid, weights - lowest, 0.0)
+    if not weights.sum() > 0:
+        return np.ones_like(weights)
+    return weights
+
+
+def roulette_wheel_selection(fitness_values, count, rng=None):
+    '''
+    Select individuals with probability proportional to their fitness.
+
+    The cumulative weights are built once, then every pick is a binary search: O(P + count log P).
+
+    Parameters:
+    - fitness_values (array-like): Fitness value of each individual.
+    - count (int): Number of individuals to select.
+    - rng (np.random.Generator, optional): Random generator to use.
+
+    Returns:
+    - np.ndarray: Indices of the selected individuals.
+    '''
+    rng = rng or _default_rng
+    cumulative = np.cumsum(selection_weights(fitness_values))
+    picks = rng.random(count) * cumulative[-1]
+    return np.minimum(np.searchsorted(cumulative, picks, side='right'), len(cumulative) - 1)
+
+
+def stochastic_universal_sampling(fitness_values, count, rng=None):
+    '''
+    Select individuals proportionally to their fitness with evenly spaced pointers on the wheel.
+
+    Compared to roulette wheel selection, the number of copies of each individual stays within one
+    of its expected value.
+
+    Parameters:
+    - fitness_values (array-like): Fitness value of each individual.
+    - count (int): Number of individuals to select.
+    - rng (np.random.Generator, optional): Random generator to use.
+
+    Returns:
+    - np.ndarray: Indices of the selected individuals, in random order.
+    '''
+    rng = rng or _default_rng
+    if count <= 0:
+        return np.empty(0, dtype=np.intp)
+    cumulative = np.cumsum(selection_weights(fitness_values))
+    step = cumulative[-1] / count
+    pointers = (rng.random() + np.arange(count)) * step
+    indices = np.minimum(np.searchsorted(cumulative, pointers, side='right'), len(cumulative) - 1)
+    return rng.permutation(indices)  # Shuffled so that consecutive picks are not paired by wheel order
+
+
+def tournament_selection(fitness_values, count, tournament_size, rng=None):
+    '''
+    Select the best of tournament_size random individuals, count times, in one vectorized step.
+
+    Contestants are drawn with replacement as a (count x tournament_size) index matrix, and the winner
+    of each row is its first contestant with the highest fitness.
+
+    Parameters:
+    - fitness_values (array-like): Fitness value of each individual.
+    - count (int): Number of individuals to select.
+    - tournament_size (int): Number of contestants in each tournament.
+    - rng (np.random.Generator, optional): Random generator to use.
+
+    Returns:
+    - np.ndarray: Indices of the selected individuals.
+    '''
+    rng = rng or _default_rng
+    fitness_values = np.asarray(fitness_values, dtype=np.float64)
+    contestants = rng.integers(0, len(fitness_values), size=(count, tournament_size))
+    winners = np.argmax(fitness_values[contestants], axis=1)
+    return contestants[np.arange(count), winners]
+
+
+def elite_indices(fitness_values, elite_size):
+    '''
+    Get the indices of the best individuals, ties kept in population order.
+
+    Parameters:
+    - fitness_values (array-like): Fitness value of each individual.
+    - elite_size (int): Number of individuals to keep.
+
+    Returns:
+    - np.ndarray: Indices of the elite_size best individuals, best first.
+    '''
+    fitness_values = np.asarray(fitness_values, dtype=np.float64)
+    return np.argsort(-fitness_values, kind='stable')[:elite_size]
@@ -0,0 +1,116 @@
+from array import array
+from bisect import bisect_right
+import random
+import numpy as np
+from Genome import Genome
+
+_default_rng = np.random.default_rng()
+
+
+class SolutionSampler:
+    '''
+    Sample random solutions without overlapping from per-position lists of feasible biscuit types.
+
+    At each position, a biscuit type is drawn with probability proportional to its weight among the
+    types that can be placed there, then the position moves past the biscuit. Positions where nothing
+    fits are skipped at once. The candidates are computed once from the feasibility table, so sampling
+    a solution costs one draw per gene.
+    '''
+    def __init__(self, table, biscuits, type_weights):
+        '''
+        Precompute the feasible biscuit types of every position.
+
+        Parameters:
+        - table (FeasibilityTable): Validity of the placements on the dough.
+        - biscuits (dict): Dictionary of Biscuit objects indexed by their type.
+        - type_weights (dict): Relative probability of drawing each biscuit type where it fits.
+        '''
+        self.table = table
+        self.length = table.length
+        types = [biscuit_type for biscuit_type in type_weights if biscuit_type in biscuits and type_weights[biscuit_type] > 0]
+        self.types = np.array(types, dtype=np.int64)
+        self.type_lengths = np.array([biscuits[biscuit_type].length for biscuit_type in types], dtype=np.int64)
+
+        # valid[t, p]: type t fits at position p, padded with one infeasible position at the end
+        valid = np.zeros((len(types), self.length + 1), dtype=bool)
+        for row, biscuit_type in enumerate(types):
+            valid[row, :self.length] = np.frombuffer(bytes(table.row(biscuit_type)), dtype=np.uint8).astype(bool)
+        weights = valid * np.array([type_weights[biscuit_type] for biscuit_type in types], dtype=np.float64)[:, None]
+        totals = weights.sum(axis=0)
+        feasible = totals > 0
+        self.cumulative = np.cumsum(weights, axis=0) / np.where(feasible, totals, 1.0)  # (types x positions)
+
+        # next_feasible[p]: first position >= p where some type fits, self.length if none
+        positions = np.where(feasible, np.arange(self.length + 1), self.length)
+        self.next_feasible = np.minimum.accumulate(positions[::-1])[::-1]
+
+        # Pure Python lists for the scalar sampler
+        self._next_feasible = self.next_feasible.tolist()
+        self._candidates = [None] * self.length
+        for position in np.flatnonzero(feasible).tolist():
+            rows = np.flatnonzero(valid[:, position])
+            self._candidates[position] = (self.cumulative[rows, position].tolist(),
+                                          [(types[row], int(self.type_lengths[row])) for row in rows])
+
+    def sample(self, rng=None):
+        '''
+        Sample one random solution.
+
+        Parameters:
+        - rng (random.Random, optional): Random generator to use. Defaults to the random module.
+
+        Returns:
+        - Genome: A solution made of (position, biscuit_type) genes.
+        '''
+        rng = rng or random
+        genes = []
+        next_feasible = self._next_feasible
+        candidates = self._candidates
+        position = next_feasible[0]
+        while position < self.length:
+            cumulative, choices = candidates[position]
+            biscuit_type, biscuit_length = choices[min(bisect_right(cumulative, rng.random()), len(choices) - 1)]
+            genes.append((position, biscuit_type))
+            position = next_feasible[min(position + biscuit_length, self.length)]
+        return Genome(genes)
+
+    def sample_population(self, count, rng=None):
+        '''
+        Sample many random solutions at once, advancing all of them by one gene per vectorized step.
+
+        Parameters:
+        - count (int): Number of solutions.
+        - rng (np.random.Generator, optional): Random generator to use.
+
+        Returns:
+        - list: The solutions, as Genomes.
+        '''
+        rng = rng or _default_rng
+        positions = np.full(count, self.next_feasible[0], dtype=np.int64)
+        owners, gene_positions, gene_types = [], [], []
+        active = np.flatnonzero(positions < self.length)
+        while len(active):
+            current = positions[active]
+            draws = rng.random(len(active))
+            rows = np.minimum((draws[:, None] >= self.cumulative[:, current].T).sum(axis=1), len(self.types) - 1)
+            owners.append(active)
+            gene_positions.append(current)
+            gene_types.append(self.types[rows])
+            positions[active] = self.next_feasible[np.minimum(current + self.type_lengths[rows], self.length)]
+            active = active[positions[active] < self.length]
+
+        if not owners:
+            return [Genome() for _ in range(count)]
+        # Genes were produced step by step: a stable sort by owner keeps each solution in position order
+        owners = np.concatenate(owners)
+        order = np.argsort(owners, kind='stable')
+        genes = np.empty((len(order), 2), dtype=np.dtype(f'u{array(Genome.TYPECODE).itemsize}'))
+        genes[:, 0] = np.concatenate(gene_positions)[order]
+        genes[:, 1] = np.concatenate(gene_types)[order]
+        bounds = np.searchsorted(owners[order], np.arange(count + 1))
+        population = []
+        for start, end in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+            data = array(Genome.TYPECODE)
+            data.frombytes(genes[start:end].tobytes())
+            population.append(Genome._from_data(data))
+        return population
@@ -0,0 +1,138 @@
+import inspect
+from functools import partial
+from Biscuit import BiscuitCatalogue
+from CPSolver import CPSolver
+from DPSolver import DPSolver
+from GeneticTournament import GeneticTournament
+from Greedy import HEURISTICS, greedy_biscuit_placement
+
+
+def default_biscuits():
+    '''
+    Get the biscuit types used by the solvers when none are given.
+
+    Returns:
+    - BiscuitCatalogue: The standard biscuit types 0 to 3.
+    '''
+    return BiscuitCatalogue.standard()
+
+
+def solve_dp(dough, biscuits):
+    '''
+    Solve a dough exactly with dynamic programming.
+
+    Parameters:
+    - dough (Dough): The dough object to place biscuits on.
+    - biscuits (dict): Dictionary of Biscuit objects indexed by their type.
+
+    Returns:
+    - total_value (int): The value of the placement, minus the penalty for unused dough.
+    - placement (list): A list of tuples (position, biscuit_type).
+    '''
+    return DPSolver(dough, biscuits).solve()
+
+
+def solve_cp(dough, biscuits, num_workers=None, time_limit=None, hint_solver=None):
+    '''
+    Solve a dough with the OR-Tools CP-SAT model.
+
+    Parameters:
+    - dough (Dough): The dough object to place biscuits on.
+    - biscuits (dict): Dictionary of Biscuit objects indexed by their type.
+    - num_workers (int, optional): Number of CP-SAT search workers. Defaults to all cores.
+    - time_limit (float, optional): Maximum solving time in seconds.
+    - hint_solver (str or callable, optional): Solver whose placement is given to CP-SAT as a hint.
+
+    Returns:
+    - total_value (int): The value of the placement, minus the penalty for unused dough.
+    - placement (list): A list of tuples (position, biscuit_type).
+    '''
+    hint = get_solver(hint_solver)(dough, biscuits)[1] if hint_solver is not None else None
+    return CPSolver(dough, biscuits, num_workers, time_limit).solve(hint)
+
+
+def solve_greedy(dough, biscuits, heuristic='valength'):
+    '''
+    Solve a dough with the greedy heuristic.
+
+    Parameters:
+    - dough (Dough): The dough object to place biscuits on.
+    - biscuits (dict): Dictionary of Biscuit objects indexed by their type.
+    - heuristic (str): Order of the biscuits, one of Greedy.HEURISTICS.
+
+    Returns:
+    - total_value (int): The value of the placement, minus the penalty for unused dough.
+    - placement (list): A list of tuples (position, biscuit_type).
+    '''
+    return greedy_biscuit_placement(dough, biscuits, heuristic)
+
+
+def solve_ga(dough, biscuits, variant=GeneticTournament, population_size=100, mutation_rate=0.05, crossover_rate=0.7,
+             max_generations=100, time_budget=None, seed_solvers=(), seed_copies=0, **kwargs):
+    '''
+    Solve a dough with a Genetic Algorithm variant.
+
+    Parameters:
+    - dough (Dough): The dough object to place biscuits on.
+    - biscuits (dict): Dictionary of Biscuit objects indexed by their type.
+    - variant (type): The GeneticAlgorithm class to run.
+    - population_size (int): Size of the population.
+    - mutation_rate (float): Rate of mutation.
+    - crossover_rate (float): Rate of crossover.
+    - max_generations (int, optional): Maximum number of generations.
+    - time_budget (float, optional): Wall-clock budget in seconds.
+    - seed_solvers (iterable): Solvers (names or functions) whose placements seed the initial population.
+    - seed_copies (int): Number of perturbed copies added for each seed.
+    - **kwargs: Optional settings forwarded to the variant, e.g. seed to make the run reproducible.
+
+    Returns:
+    - total_value (int): The fitness of the best individual found.
+    - placement (list): A list of tuples (position, biscuit_type).
+    '''
+    with variant(dough, biscuits, population_size, mutation_rate, crossover_rate, **kwargs) as ga:
+        seeds = [get_solver(solver)(dough, biscuits)[1] for solver in seed_solvers]
+        ga.seed_population(seeds, seed_copies)
+        best_fitness, best_individual = ga.run(max_generations=max_generations, time_budget=time_budget)
+    return best_fitness, list(best_individual)
+
+
+SOLVERS = {
+    'cp': solve_cp,
+    'dp': solve_dp,
+    'ga': solve_ga,
+    'greedy': solve_greedy,
+    # Each greedy ordering under its own name, e.g. to seed solve_ga with seed_solvers=['greedy_value']
+    **{f'greedy_{heuristic}': partial(solve_greedy, heuristic=heuristic) for heuristic in HEURISTICS},
+}
+
+
+def get_solver(solver):
+    '''
+    Resolve a solver given by name or as a function.
+
+    Parameters:
+    - solver (str or callable): A key of SOLVERS, or a function called as solver(dough, biscuits, **kwargs)
+      and returning (total_value, placement).
+
+    Returns:
+    - callable: The solver function.
+    '''
+    if callable(solver):
+        return solver
+    if solver not in SOLVERS:
+        raise ValueError(f"Unknown solver {solver!r}, expected one of {sorted(SOLVERS)} or a function")
+    return SOLVERS[solver]
+
+
+def accepts_seed(solver):
+    '''
+    Tell whether a solver takes a seed, i.e. is randomized, so callers only forward a seed to solvers that accept it.
+
+    Parameters:
+    - solver (str or callable): A key of SOLVERS, or a solver function.
+
+    Returns:
+    - bool: True if the solver has a seed parameter or accepts extra keyword arguments.
+    '''
+    parameters = inspect.signature(get_solver(solver)).parameters.values()
+    return any(parameter.name == 'seed' or parameter.kind == inspect.Parameter.VAR_KEYWORD for parameter in parameters)
@@ -0,0 +1,229 @@
+from bisect import bisect_left
+
+
+class StreamingPlacer:
+    '''
+    Place biscuits on a continuous strip of dough whose defects arrive in position order.
+
+    The placer runs the DPSolver recurrence cell by cell as defects arrive: the best value of the
+    prefix [0, i) is known as soon as every defect before i has been seen. Biscuits are committed
+    once every placement still reachable goes through them, which happens when the backpointer
+    chains of the last max(biscuit length) cells meet. Only the cells since the last commit and
+    their defects are kept, so memory and work per unit of dough stay bounded as the strip grows.
+
+    If the chains have not met for max_lag cells, the chain of the best recent cell is committed
+    anyway, which bounds memory at the cost of optimality.
+    '''
+    def __init__(self, biscuits, max_lag=1000):
+        '''
+        Initialize the placer at the start of the strip.
+
+        Parameters:
+        - biscuits (dict): Dictionary of Biscuit objects indexed by their type.
+        - max_lag (int): Maximum number of uncommitted cells before a forced commit.
+        '''
+        self.biscuits = biscuits
+        self.max_length = max(biscuit.length for biscuit in biscuits.values())
+        if max_lag < self.max_length:
+            raise ValueError("max_lag must be at least the length of the longest biscuit")
+        self.max_lag = max_lag
+        self.biscuit_types = [(biscuit_type, biscuit.length, biscuit.value, biscuit.max_defects)
+                              for biscuit_type, biscuit in biscuits.items()]
+        self.position = 0  # no defect may arrive before this position
+        self.total_value = None  # value of the whole strip, set by close
+        self.forced_commits = 0
+        self._base = 0  # cell where the last committed biscuit ends
+        self._best = [0]  # best value of the prefix ending at cell _base + k
+        self._choice = [None]  # biscuit type ending at cell _base + k, None for an empty cell
+        self._defects = {}  # class -> sorted positions of the defects at or after _base
+
+    @property
+    def frontier(self):
+        '''
+        Cell up to which the best values are computed.
+
+        Returns:
+        - int: The frontier cell.
+        '''
+        return self._base + len(self._best) - 1
+
+    def add_defect(self, position, defect_class):
+        '''
+        Add the next defect of the strip.
+
+        Parameters:
+        - position (float): Position of the defect, not before any position already given.
+        - defect_class (str): Class of the defect ('a', 'b', 'c').
+
+        Returns:
+        - list: Tuples (position, biscuit_type) committed by this call, sorted by position.
+        '''
+        if self.total_value is not None:
+            raise ValueError("The strip is closed")
+        if position < self.position:
+            raise ValueError(f"Defect at {position} arrived after position {self.position}")
+        self.position = position
+        self._defects.setdefault(defect_class, []).append(position)
+        return self._advance(int(position))
+
+    def advance(self, position):
+        '''
+        Declare that no defect lies before a position, e.g. when the strip moved on without defects.
+
+        Parameters:
+        - position (float): Position before which every defect has been added.
+
+        Returns:
+        - list: Tuples (position, biscuit_type) committed by this call, sorted by position.
+        '''
+        if self.total_value is not None:
+            raise ValueError("The strip is closed")
+        if position < self.position:
+            raise ValueError(f"Cannot advance to {position}, already at position {self.position}")
+        self.position = position
+        return self._advance(int(position))
+
+    def close(self, length):
+        '''
+        End the strip and commit the rest of its biscuits.
+
+        Parameters:
+        - length (int): Length of the strip, after every defect added.
+
+        Returns:
+        - list: Tuples (position, biscuit_type) committed by this call, sorted by position.
+        '''
+        if self.total_value is not None:
+            raise ValueError("The strip is closed")
+        if length < self.position or length < self.frontier:
+            raise ValueError(f"Strip length {length} ends before position {max(self.position, self.frontier)}")
+        self.position = length
+        self._extend(length)
+        self.total_value = self._best[-1]
+        return self._commit(length)
+
+    def _advance(self, cell):
+        '''
+        Compute the best values up to a cell and commit the biscuits that can no longer change.
+
+        Parameters:
+        - cell (int): Cell up to which every defect is known.
+
+        Returns:
+        - list: Tuples (position, biscuit_type) committed, sorted by position.
+        '''
+        self._extend(cell)
+        frontier = self.frontier
+        placement = self._commit(self._convergence())
+        if frontier - self._base > self.max_lag:
+            # Chains did not meet in time: keep the best recent cell's chain and drop the others
+            live = range(max(self._base, frontier - self.max_length + 1), frontier + 1)
+            best_cell = max(live, key=lambda cell: self._best[cell - self._base])
+            cell = best_cell
+            while cell > frontier - self.max_length:
+                cell = self._parent(cell)
+            placement += self._commit(cell)
+            del self._best[1:]
+            del self._choice[1:]
+            self._extend(frontier)
+            self.forced_commits += 1
+        return placement
+
+    def _extend(self, cell):
+        '''
+        Run the DPSolver recurrence from the frontier up to a cell.
+
+        Parameters:
+        - cell (int): Last cell to compute.
+        '''
+        base = self._base
+        best = self._best
+        choice = self._choice
+        for i in range(self.frontier + 1, cell + 1):
+            best_value = best[i - 1 - base] - 1
+            best_choice = None
+            for biscuit_type, biscuit_length, biscuit_value, max_defects in self.biscuit_types:
+                start = i - biscuit_length
+                if start >= base and self._fits(start, i, max_defects):
+                    value = best[start - base] + biscuit_value
+                    if value > best_value:
+                        best_value = value
+                        best_choice = biscuit_type
+            best.append(best_value)
+            choice.append(best_choice)
+
+    def _fits(self, start, end, max_defects):
+        '''
+        Check whether the section [start, end) respects defect thresholds.
+
+        Parameters:
+        - start (int): Starting cell of the section.
+        - end (int): Cell after the end of the section.
+        - max_defects (dict): Maximum allowable defects by class.
+
+        Returns:
+        - bool: True if no class has more defects than allowed.
+        '''
+        for cls, positions in self._defects.items():
+            if cls in max_defects and bisect_left(positions, end) - bisect_left(positions, start) > max_defects[cls]:
+                return False
+        return True
+
+    def _parent(self, cell):
+        '''
+        Get the previous cell on the best chain ending at a cell.
+
+        Parameters:
+        - cell (int): Cell after the base.
+
+        Returns:
+        - int: Start of the biscuit ending at the cell, or the previous cell if it is empty.
+        '''
+        biscuit_type = self._choice[cell - self._base]
+        return cell - 1 if biscuit_type is None else cell - self.biscuits[biscuit_type].length
+
+    def _convergence(self):
+        '''
+        Find the last cell shared by the chains of every cell a future placement can extend.
+
+        Returns:
+        - int: The meeting cell, the base if the chains only meet there.
+        '''
+        frontier = self.frontier
+        cells = set(range(max(self._base, frontier - self.max_length + 1), frontier + 1))
+        while len(cells) > 1:
+            cell = max(cells)
+            cells.remove(cell)
+            cells.add(self._parent(cell))
+        return cells.pop()
+
+    def _commit(self, cell):
+        '''
+        Commit the biscuits of the best chain between the base and a cell, then forget what lies before the cell.
+
+        Parameters:
+        - cell (int): The new base, on the best chain of every live cell.
+
+        Returns:
+        - list: Tuples (position, biscuit_type) committed, sorted by position.
+        '''
+        base = self._base
+        if cell <= base:
+            return []
+        placement = []
+        i = cell
+        while i > base:
+            parent = self._parent(i)
+            if self._choice[i - base] is not None:
+                placement.append((parent, self._choice[i - base]))
+            i = parent
+        placement.reverse()
+
+        # Everything before the new base is final; its best value carries over as the new origin
+        del self._best[:cell - base]
+        del self._choice[:cell - base]
+        self._choice[0] = None
+        self._base = cell
+        for positions in self._defects.values():
+            del positions[:bisect_left(positions, cell)]
+        return placement
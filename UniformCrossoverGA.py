@@ -1,14 +1,16 @@
 import random
-from Biscuit import Biscuit
 from GeneticAlgorithm import *
+from Selection import elite_indices
+from Genome import Genome
 
 class UniformCrossoverGA(GeneticAlgorithm):
     '''
     Genetic Algorithm class that implements uniform crossover with tournament selection and elitism.
     Inherits from the base GeneticAlgorithm class.
     '''
+    tournament_size = 15  # Size of the tournament for selection
 
-    def __init__(self, dough, biscuits, population_size, mutation_rate, crossover_rate):
+    def __init__(self, dough, biscuits, population_size, mutation_rate, crossover_rate, **kwargs):
         '''
         Initialize the UniformCrossoverGA algorithm with the given parameters.
 
@@ -18,9 +20,9 @@ class UniformCrossoverGA(GeneticAlgorithm):
         - population_size: The number of individuals in the population.
         - mutation_rate: The probability of mutation occurring.
         - crossover_rate: The probability of crossover occurring.
+        - **kwargs: Optional settings forwarded to GeneticAlgorithm (e.g. cache_size, workers, observer, local_search).
         '''
-        super().__init__(dough, biscuits, population_size, mutation_rate, crossover_rate)
-        self.tournament_size = 15  # Size of the tournament for selection
+        super().__init__(dough, biscuits, population_size, mutation_rate, crossover_rate, **kwargs)
 
     def selection(self, elite_size):
         '''
@@ -32,25 +34,19 @@ class UniformCrossoverGA(GeneticAlgorithm):
         Returns:
         - selected_individuals: A list of selected individuals for the next generation.
         '''
-        # Rank the population based on fitness
-        ranked_population = [(individual, self.fitness(individual)) for individual in self.population]
-        ranked_population.sort(key=lambda x: x[1], reverse=True)
+        fitness_values = self.evaluate_population(self.population)
 
-        # Select elite individuals
-        selected_individuals = [individual for individual, _ in ranked_population[:elite_size]]
+        # Automatically select the top 'elite_size' individuals (elitism)
+        selected_individuals = [self.population[index] for index in elite_indices(fitness_values, elite_size).tolist()]
 
-        # Perform tournament selection for the rest of the population
-        for _ in range(len(ranked_population) - elite_size):
-            # Randomly select individuals for the tournament
-            tournament = random.sample(ranked_population, self.tournament_size)
-            # Select the best individual from the tournament
-            best_individual = sorted(tournament, key=lambda x: x[1], reverse=True)[0][0]
-            selected_individuals.append(best_individual)
+        # For the rest of the population, run all the tournaments at once
+        for index in self.select_indices(fitness_values, len(self.population) - elite_size).tolist():
+            selected_individuals.append(self.population[index])
 
         return selected_individuals
 
     @staticmethod
-    def uniform_crossover(parent1, parent2, max_attempts=500):
+    def uniform_crossover(parent1, parent2, max_attempts=500, biscuits=None, rng=None):
         '''
         Perform uniform crossover on two parents to produce offspring without overlapping.
 
@@ -58,18 +54,14 @@ class UniformCrossoverGA(GeneticAlgorithm):
         - parent1: The first parent individual.
         - parent2: The second parent individual.
         - max_attempts: Maximum number of attempts to find valid crossover points.
+        - biscuits (dict, optional): Dictionary of Biscuit objects indexed by their type. Defaults to the standard biscuit types.
+        - rng (random.Random, optional): Random generator to use. Defaults to the random module.
 
         Returns:
         - tuple: Two offspring individuals.
         '''
-        # Define the biscuit types
-        biscuits = {
-            0: Biscuit(0),
-            1: Biscuit(1),
-            2: Biscuit(2),
-            3: Biscuit(3),
-            4: Biscuit(4)
-        }
+        lengths = biscuit_lengths(biscuits)
+        rng = rng or random
 
         def find_valid_crossover_points(parent):
             '''
@@ -86,7 +78,7 @@ class UniformCrossoverGA(GeneticAlgorithm):
                 prev_position, prev_type = parent[i - 1]
                 current_position, _ = parent[i]
                 # Ensure there is space between biscuits to prevent overlapping
-                if current_position - (prev_position + biscuits[prev_type].length) > 0:
+                if current_position - (prev_position + lengths(prev_type)) > 0:
                     valid_points.append(i)
             return valid_points
 
@@ -103,8 +95,10 @@ class UniformCrossoverGA(GeneticAlgorithm):
             - child: The resulting child individual.
             '''
             # Combine genes from both parents
-            child = parent_a[:crossover_point] + [gene for gene in parent_b[crossover_point:] if gene not in parent_a[:crossover_point]]
-            return child
+            head = parent_a[:crossover_point]
+            head_genes = set(head)
+            child = head + [gene for gene in parent_b[crossover_point:] if gene not in head_genes]
+            return Genome(child)
 
         # Sort parents by position to maintain order
         parent1_sorted = sorted(parent1, key=lambda x: x[0])
@@ -116,8 +110,8 @@ class UniformCrossoverGA(GeneticAlgorithm):
 
             if valid_points_p1 and valid_points_p2:
                 # Randomly select crossover points from valid points
-                crossover_point1 = random.choice(valid_points_p1)
-                crossover_point2 = random.choice(valid_points_p2)
+                crossover_point1 = rng.choice(valid_points_p1)
+                crossover_point2 = rng.choice(valid_points_p2)
 
                 # Create children using the selected crossover points
                 child1 = create_child(parent1_sorted, parent2_sorted, crossover_point1)
@@ -132,24 +126,34 @@ class UniformCrossoverGA(GeneticAlgorithm):
         '''
         Evolve the population over one generation using uniform crossover, tournament selection, and elitism.
         '''
+        timer = self.start_generation()
         # Determine the number of elite individuals to carry over
         elite_size = int(self.population_size * 0.2)
         # Perform selection to get individuals for breeding
         selected_individuals = self.selection(elite_size)
+        timer.lap('selection')
+        # Refine the elites before they are bred and carried over, if enabled
+        selected_individuals[:elite_size] = self.refine(selected_individuals[:elite_size], 'elites')
         # Start the new population with elite individuals
         new_population = selected_individuals[:elite_size]
 
         # Generate the rest of the new population
         while len(new_population) < self.population_size:
             # Randomly select parents from the elite individuals
-            parent1 = random.choice(selected_individuals[:elite_size])
-            parent2 = random.choice(selected_individuals[:elite_size])
+            parent1 = self.rng.choice(selected_individuals[:elite_size])
+            parent2 = self.rng.choice(selected_individuals[:elite_size])
             # Perform uniform crossover to produce offspring
-            child1, child2 = self.uniform_crossover(parent1, parent2)
+            child1, child2 = self.uniform_crossover(parent1, parent2, biscuits=self.biscuits, rng=self.rng)
             # Add offspring to the new population
             new_population.append(child1)
             if len(new_population) < self.population_size:
                 new_population.append(child2)
+        timer.lap('crossover')
+
+        # Refine the offspring, if enabled
+        new_population[elite_size:] = self.refine(new_population[elite_size:], 'children')
+        timer.lap('local_search')
 
         # Update the population with the new generation
         self.population = new_population
+        self.end_generation(timer)
@@ -0,0 +1,32 @@
+from Benchmark import generate_roll
+from GeneticAlgorithm import GeneticAlgorithm
+from Genome import Genome
+from Solvers import default_biscuits
+
+
+def full_fitness(dough, biscuits, placement):
+    '''
+    Score a placement with the reference GeneticAlgorithm.fitness.
+    '''
+    return GeneticAlgorithm(dough, biscuits, 1, 0.0, 0.0, cache_size=0, seed=0).fitness(list(placement))
+
+
+def make_ga(length, density, seed, population_size=30):
+    '''
+    A GeneticAlgorithm without fitness cache on a synthetic roll.
+    '''
+    dough = generate_roll(length, density, seed=seed)
+    return GeneticAlgorithm(dough, default_biscuits(), population_size, 0.05, 0.7, cache_size=0, seed=seed)
+
+
+def broken_individuals(ga):
+    '''
+    Individuals covering the invalid cases: overlapping, past the end of the dough, and on defects.
+    '''
+    length = ga.dough.LENGTH
+    table = ga.dough.feasibility(ga.biscuits)
+    individuals = [Genome([(0, 1), (3, 0)]), Genome([(length - 2, 0)]), Genome()]
+    infeasible = [position for position in range(length - 8) if not table.is_valid(position, 1)]
+    if infeasible:
+        individuals.append(Genome([(infeasible[0], 1)]))
+    return individuals
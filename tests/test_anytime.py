@@ -0,0 +1,54 @@
+import pytest
+from Benchmark import generate_roll
+from GeneticAlgorithm import GeneticAlgorithm
+from GeneticTournament import GeneticTournament
+from Solvers import default_biscuits
+
+
+def make_ga(variant=GeneticTournament, mutation_rate=0.05, crossover_rate=0.7):
+    return variant(generate_roll(300, 1.0, seed=0), default_biscuits(), 20, mutation_rate, crossover_rate, seed=0)
+
+
+def test_run_needs_a_stopping_criterion():
+    with make_ga() as ga, pytest.raises(ValueError):
+        ga.run()
+
+
+def test_run_stops_after_max_generations():
+    with make_ga() as ga:
+        best_fitness, best_individual = ga.run(max_generations=4)
+        assert ga.stop_reason == 'max_generations'
+        assert ga.generation == 4
+        assert best_fitness == ga._compute_fitness(best_individual)
+        assert best_fitness >= max(ga.evaluate_population(ga.population))
+
+
+def test_run_stops_on_the_target_before_evolving():
+    with make_ga() as ga:
+        initial = max(ga.evaluate_population(ga.population))
+        assert ga.run(max_generations=10, target_fitness=initial)[0] == initial
+        assert ga.stop_reason == 'target_fitness'
+        assert ga.generation == 0
+
+
+def test_run_stops_on_the_time_budget():
+    with make_ga() as ga:
+        ga.run(max_generations=10, time_budget=0)
+        assert ga.stop_reason == 'time_budget'
+        assert ga.generation == 0
+
+
+def test_run_stops_when_the_best_fitness_stalls():
+    # Without crossover nor mutation, the population only copies its initial individuals
+    with make_ga(GeneticAlgorithm, mutation_rate=0, crossover_rate=0) as ga:
+        ga.run(max_generations=50, stall_generations=3)
+        assert ga.stop_reason == 'stall_generations'
+        assert ga.generation == 3
+
+
+def test_best_individual_is_kept_across_runs():
+    with make_ga() as ga:
+        first, _ = ga.run(max_generations=2)
+        second, best_individual = ga.run(max_generations=2)
+        assert second >= first
+        assert second == ga._compute_fitness(best_individual)
@@ -0,0 +1,33 @@
+import pytest
+from Benchmark import generate_roll
+from DPSolver import DPSolver
+from Greedy import greedy_biscuit_placement
+from Solvers import default_biscuits
+from helpers import full_fitness
+
+pytest.importorskip('ortools')
+from CPSolver import CPSolver
+
+ROLLS = [(length, density, seed) for length, density in ((300, 0.2), (300, 1.0)) for seed in range(2)]
+
+
+@pytest.mark.parametrize('length, density, seed', ROLLS)
+def test_cp_solver_finds_the_optimum(length, density, seed):
+    biscuits = default_biscuits()
+    dough = generate_roll(length, density, seed=seed)
+    optimum, _ = DPSolver(dough, biscuits).solve()
+    value, placement = CPSolver(dough, biscuits, num_workers=1).solve()
+    assert value == optimum
+    assert full_fitness(dough, biscuits, placement) == optimum
+
+
+def test_cp_solver_with_a_hint():
+    biscuits = default_biscuits()
+    dough = generate_roll(300, 1.0, seed=0)
+    optimum, _ = DPSolver(dough, biscuits).solve()
+    hint = greedy_biscuit_placement(dough, biscuits, 'valength')[1]
+    solver = CPSolver(dough, biscuits, num_workers=1)
+    value, placement = solver.solve(hint)
+    assert solver.status == 'OPTIMAL'
+    assert value == optimum
+    assert full_fitness(dough, biscuits, placement) == optimum
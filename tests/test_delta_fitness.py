@@ -0,0 +1,39 @@
+import pytest
+from Benchmark import generate_roll
+from GeneticAlgorithm import GeneticAlgorithm
+from GeneticElitism import GeneticElitism
+from GeneticTournament import GeneticTournament
+from Genome import Genome
+from Solvers import default_biscuits
+from helpers import make_ga
+
+ROLLS = [(length, density, seed) for length, density in ((200, 0.2), (400, 1.0), (400, 3.0)) for seed in range(2)]
+
+
+@pytest.mark.parametrize('length, density, seed', ROLLS)
+def test_delta_fitness_matches_fitness(length, density, seed):
+    ga = make_ga(length, density, seed)
+    for individual in ga.population:
+        if not len(individual):
+            continue
+        delta = ga.random_delta(individual)
+        mutated = Genome(individual)
+        for index, _, new_gene in delta:
+            mutated[index] = new_gene
+        assert ga.delta_fitness(ga.fitness(individual), delta) == ga.fitness(mutated)
+
+
+@pytest.mark.parametrize('variant', [GeneticAlgorithm, GeneticElitism, GeneticTournament])
+def test_mutants_are_scored_from_their_cached_parent(variant):
+    dough = generate_roll(400, 1.0, seed=0)
+    with variant(dough, default_biscuits(), 40, 0.3, 0.7, seed=0) as ga:
+        ga.evolve()
+        calls = []
+        for _ in range(3):
+            # Every mutated child was scored before its mutation
+            ga.apply_delta = lambda old_key, individual, delta: (
+                calls.append(old_key in ga._fitness_cache), GeneticAlgorithm.apply_delta(ga, old_key, individual, delta))
+            ga.evolve()
+        assert calls and all(calls)
+        cached = ga.evaluate_population(ga.population).tolist()
+        assert cached == [ga._compute_fitness(individual) for individual in ga.population]
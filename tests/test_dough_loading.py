@@ -0,0 +1,55 @@
+import pytest
+from Dough import Dough
+
+
+def write_csv(tmp_path, text):
+    path = tmp_path / 'defects.csv'
+    path.write_text(text)
+    return str(path)
+
+
+def test_from_csv_reads_columns_in_any_order(tmp_path):
+    path = write_csv(tmp_path, 'class,id,x\nb,0,12.5\na,1,3\nc,2,99.75\n')
+    dough = Dough.from_csv(path, 100, chunk_size=2)
+    assert dough.defects_list == [(12.5, 'b'), (3.0, 'a'), (99.75, 'c')]
+
+
+def test_from_csv_matches_from_arrays():
+    dough = Dough.from_csv('defects.csv', 500, chunk_size=64)
+    positions = [position for position, _ in dough.defects_list]
+    classes = [defect_class for _, defect_class in dough.defects_list]
+    assert Dough.from_arrays(positions, classes, 500).count_defects(0, 500) == dough.count_defects(0, 500)
+
+
+@pytest.mark.parametrize('text', ['x,kind\n1,a\n', 'position,class\n1,a\n', ''])
+def test_from_csv_rejects_missing_columns(tmp_path, text):
+    with pytest.raises(ValueError):
+        Dough.from_csv(write_csv(tmp_path, text), 100)
+
+
+@pytest.mark.parametrize('row', ['nan,a', 'inf,a', '-0.5,b', '100,c', '10,d', 'ten,a'])
+def test_from_csv_rejects_invalid_rows(tmp_path, row):
+    with pytest.raises(ValueError):
+        Dough.from_csv(write_csv(tmp_path, f'x,class\n1,a\n{row}\n'), 100)
+
+
+@pytest.mark.parametrize('positions, classes', [
+    ([float('nan')], ['a']),
+    ([-1], ['a']),
+    ([100], ['a']),
+    ([1, 2], ['a', 'd']),
+    ([1, 2], ['a']),
+    ([[1, 2]], ['a', 'b']),
+])
+def test_add_defects_rejects_invalid_defects(positions, classes):
+    dough = Dough(100)
+    with pytest.raises(ValueError):
+        dough.add_defects(positions, classes)
+    assert dough.defects_list == []
+
+
+def test_custom_defect_classes():
+    dough = Dough.from_arrays([1, 2], ['a', 'd'], 100, known_classes=('a', 'd'))
+    assert dough.defects_list == [(1.0, 'a'), (2.0, 'd')]
+    with pytest.raises(ValueError):
+        dough.add_defect(3, 'b')
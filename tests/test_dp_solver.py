@@ -0,0 +1,32 @@
+import pytest
+from Benchmark import generate_roll
+from DPSolver import DPSolver
+from Solvers import default_biscuits
+from helpers import full_fitness
+
+ROLLS = [(length, density, seed) for length, density in ((300, 0.2), (300, 1.0), (500, 3.0)) for seed in range(3)]
+
+
+@pytest.mark.parametrize('length, density, seed', ROLLS)
+def test_dp_solver_scores_its_placement(length, density, seed):
+    biscuits = default_biscuits()
+    dough = generate_roll(length, density, seed=seed)
+    optimum, placement = DPSolver(dough, biscuits).solve()
+    assert full_fitness(dough, biscuits, placement) == optimum
+
+
+@pytest.mark.parametrize('length, density, seed', ROLLS[:3])
+def test_dp_solver_sections_add_up(length, density, seed):
+    biscuits = default_biscuits()
+    dough = generate_roll(length, density, seed=seed)
+    solver = DPSolver(dough, biscuits)
+    optimum, _ = solver.solve()
+    middle = length // 2
+    left, left_placement = solver.solve(0, middle)
+    right, right_placement = solver.solve(middle, length)
+    # Cutting the dough can only forbid biscuits across the cut
+    assert left + right <= optimum
+    assert all(position + biscuits[biscuit_type].length <= middle for position, biscuit_type in left_placement)
+    assert all(position >= middle for position, _ in right_placement)
+    with pytest.raises(ValueError):
+        solver.solve(0, length + 1)
@@ -0,0 +1,42 @@
+from Dough import Dough
+from GeneticAlgorithm import GeneticAlgorithm
+from Genome import Genome
+from Solvers import default_biscuits
+
+
+def make_ga(cache_size):
+    return GeneticAlgorithm(Dough(100), default_biscuits(), 4, 0.05, 0.7, cache_size=cache_size, seed=0)
+
+
+def test_cache_hits_and_evicts_the_least_recently_used():
+    ga = make_ga(2)
+    first, second, third = Genome([(0, 1)]), Genome([(0, 3)]), Genome([(0, 0)])
+    ga.fitness(first)
+    ga.fitness(second)
+    hits, misses = ga.cache_hits, ga.cache_misses
+    assert ga.fitness(first) == 12 + 8 - 100
+    assert (ga.cache_hits, ga.cache_misses) == (hits + 1, misses)
+    # first was used last, so second is evicted
+    ga.fitness(third)
+    assert ga.genome_key(first) in ga._fitness_cache
+    assert ga.genome_key(second) not in ga._fitness_cache
+    assert len(ga._fitness_cache) == 2
+
+
+def test_cache_is_dropped_when_defects_are_added():
+    ga = make_ga(16)
+    individual = Genome([(0, 1)])
+    assert ga.fitness(individual) == 12 + 8 - 100
+    # Type 1 takes up to 5 defects of class 'a'
+    for _ in range(6):
+        ga.dough.add_defect(1, 'a')
+    assert ga.fitness(individual) == float('-inf')
+    ga.dough.add_defects([50.5] * 5, ['c'] * 5)
+    assert ga.fitness(Genome([(48, 1)])) == float('-inf')
+
+
+def test_disabled_cache_stores_nothing():
+    ga = make_ga(0)
+    ga.fitness(Genome([(0, 1)]))
+    ga.evaluate_population([Genome([(0, 3)])])
+    assert not ga._fitness_cache
@@ -0,0 +1,20 @@
+import pytest
+from FitnessEvaluator import FitnessEvaluator
+from helpers import broken_individuals, make_ga
+
+ROLLS = [(length, density, seed) for length, density in ((200, 0.2), (400, 1.0), (400, 3.0)) for seed in range(2)]
+
+
+@pytest.mark.parametrize('length, density, seed', ROLLS)
+def test_evaluator_matches_fitness(length, density, seed):
+    ga = make_ga(length, density, seed)
+    population = ga.population + broken_individuals(ga)
+    values = FitnessEvaluator(ga.dough, ga.biscuits).evaluate(population).tolist()
+    assert values == [ga.fitness(individual) for individual in population]
+
+
+def test_evaluate_population_scores_duplicates_and_empty_populations():
+    ga = make_ga(300, 1.0, 0)
+    population = ga.population[:5] * 2 + broken_individuals(ga)
+    assert ga.evaluate_population(population).tolist() == [ga.fitness(individual) for individual in population]
+    assert ga.evaluate_population([]).tolist() == []
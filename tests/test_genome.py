@@ -0,0 +1,47 @@
+import pytest
+from Genome import Genome
+
+GENES = [(0, 1), (8, 3), (13, 0), (17, 2), (70000, 1)]
+
+
+@pytest.mark.parametrize('index', [slice(None), slice(1, 3), slice(-2, None), slice(3, 1), slice(None, None, 2),
+                                   slice(None, None, -1), slice(10, 20)])
+def test_slices_match_list_slices(index):
+    genome = Genome(GENES)
+    assert genome[index] == GENES[index]
+    assert isinstance(genome[index], Genome)
+
+
+def test_slices_are_independent_copies():
+    genome = Genome(GENES)
+    head = genome[:2]
+    head[0] = (1, 2)
+    assert genome[0] == (0, 1)
+
+
+def test_indexing_and_assignment():
+    genome = Genome(GENES)
+    assert genome[-1] == (70000, 1)
+    genome[-1] = (71000, 3)
+    genome[0] = (2, 0)
+    assert genome.to_list() == [(2, 0)] + GENES[1:-1] + [(71000, 3)]
+    with pytest.raises(IndexError):
+        genome[len(GENES)]
+    with pytest.raises(IndexError):
+        genome[-len(GENES) - 1] = (0, 0)
+
+
+def test_key_is_a_snapshot():
+    genome = Genome(GENES)
+    key = genome.key()
+    copy = genome.copy()
+    assert copy.key() == key
+    copy[1] = (9, 3)
+    assert copy.key() != key
+    assert genome.key() == key
+    assert Genome(GENES[:2]).key() != Genome(GENES[:3]).key()
+
+
+def test_genome_is_not_hashable():
+    with pytest.raises(TypeError):
+        hash(Genome(GENES))
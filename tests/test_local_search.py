@@ -0,0 +1,40 @@
+import pytest
+from Benchmark import GA_VARIANTS, generate_roll
+from DPSolver import DPSolver
+from LocalSearch import LocalSearch
+from Solvers import default_biscuits
+from helpers import broken_individuals, make_ga
+
+ROLLS = [(length, density, seed) for length, density in ((200, 0.2), (400, 1.0), (400, 3.0)) for seed in range(2)]
+
+
+@pytest.mark.parametrize('radius, max_cells', [(2, 0), (1, 16), (2, 32), (4, 500)])
+@pytest.mark.parametrize('length, density, seed', ROLLS)
+def test_local_search_returns_the_fitness_it_reaches(length, density, seed, radius, max_cells):
+    ga = make_ga(length, density, seed)
+    optimum, _ = DPSolver(ga.dough, ga.biscuits).solve()
+    local_search = LocalSearch(ga.dough, ga.biscuits, radius=radius, max_cells=max_cells)
+    for individual in ga.population + broken_individuals(ga):
+        before = ga.fitness(individual)
+        fitness_value, improved = local_search.improve(individual)
+        assert fitness_value == ga.fitness(improved)
+        assert before <= fitness_value <= optimum
+
+
+@pytest.mark.parametrize('local_search', ['children', 'elites'])
+@pytest.mark.parametrize('variant', list(GA_VARIANTS.values()))
+def test_memetic_runs_cache_exact_fitness(variant, local_search):
+    dough = generate_roll(300, 1.0, seed=0)
+    with variant(dough, default_biscuits(), 20, 0.05, 0.7, seed=0, local_search=local_search) as ga:
+        for _ in range(3):
+            ga.evolve()
+        cached = ga.evaluate_population(ga.population).tolist()
+        assert cached == [ga._compute_fitness(individual) for individual in ga.population]
+
+
+def test_resolving_gap_neighbourhoods_gains():
+    ga = make_ga(400, 1.0, 0)
+    moves = LocalSearch(ga.dough, ga.biscuits)
+    resolves = LocalSearch(ga.dough, ga.biscuits, radius=2, max_cells=32)
+    gains = [resolves.improve(individual)[0] - moves.improve(individual)[0] for individual in ga.population]
+    assert sum(gains) > 0
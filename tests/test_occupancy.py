@@ -0,0 +1,61 @@
+import random
+import pytest
+from Occupancy import Occupancy
+
+
+def occupancy_of(*sections):
+    occupancy = Occupancy()
+    for start, end in sections:
+        occupancy.add(start, end)
+    return occupancy
+
+
+@pytest.mark.parametrize('start, end, free', [
+    (0, 2, True),    # ends where [2, 5) starts
+    (0, 3, False),
+    (5, 8, True),    # between [2, 5) and [8, 10), touching both
+    (4, 6, False),
+    (7, 9, False),
+    (2, 5, False),   # same bounds
+    (3, 4, False),   # inside
+    (1, 11, False),  # around
+    (10, 12, True),  # starts where [8, 10) ends
+])
+def test_boundaries(start, end, free):
+    occupancy = occupancy_of((2, 5), (8, 10))
+    assert occupancy.is_free(start, end) == free
+    assert occupancy.try_add(start, end) == free
+    assert len(occupancy) == 2 + free
+
+
+def test_matches_a_cell_by_cell_model():
+    rng = random.Random(0)
+    occupancy = Occupancy()
+    cells = set()
+    for _ in range(2000):
+        start = rng.randrange(100)
+        end = start + rng.randint(1, 8)
+        section = set(range(start, end))
+        free = not cells & section
+        assert occupancy.is_free(start, end) == free
+        if occupancy.try_add(start, end):
+            cells |= section
+        elif free:
+            pytest.fail(f"[{start}, {end}) is free but was not added")
+        if cells and rng.random() < 0.3:
+            start, end = rng.choice(list(occupancy))
+            occupancy.remove(start, end)
+            cells -= set(range(start, end))
+    assert list(occupancy) == sorted(occupancy)
+
+
+def test_from_genes_and_remove():
+    lengths = {0: 4, 1: 8}
+    occupancy = Occupancy.from_genes([(8, 1), (0, 0), (20, 0)], lengths, skip=2)
+    assert list(occupancy) == [(0, 4), (8, 16)]
+    assert occupancy.is_free(4, 8) and occupancy.is_free(16, 24)
+    assert list(Occupancy.from_genes([(0, 0)], lengths.get)) == [(0, 4)]
+    with pytest.raises(ValueError):
+        occupancy.remove(0, 5)
+    occupancy.remove(0, 4)
+    assert list(occupancy) == [(8, 16)]
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from Benchmark import generate_roll
+from Dough import Dough
+from DPSolver import DPSolver
+from FeasibilityTable import FeasibilityTable
+from Reoptimizer import Reoptimizer
+from Solvers import default_biscuits
+from helpers import full_fitness
+
+
+def late_defects(dough, count, seed):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(0, dough.LENGTH, count), rng.choice(['a', 'b', 'c'], count).tolist()
+
+
+def fresh_optimum(dough, biscuits):
+    positions = [position for position, _ in dough.defects_list]
+    defect_classes = [defect_class for _, defect_class in dough.defects_list]
+    return DPSolver(Dough.from_arrays(positions, defect_classes, dough.LENGTH), biscuits).solve()[0]
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_reoptimizer_keeps_an_exact_score(seed):
+    biscuits = default_biscuits()
+    dough = generate_roll(400, 0.5, seed=seed)
+    reoptimizer = Reoptimizer(dough, biscuits, DPSolver(dough, biscuits).solve()[1])
+    for step in range(3):
+        value, placement = reoptimizer.add_defects(*late_defects(dough, 4, 10 * seed + step))
+        assert full_fitness(dough, biscuits, placement) == value
+        assert value <= fresh_optimum(dough, biscuits)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_reoptimizer_with_a_wide_margin_matches_a_fresh_solve(seed):
+    biscuits = default_biscuits()
+    dough = generate_roll(400, 0.5, seed=seed)
+    placement = DPSolver(dough, biscuits).solve()[1]
+    # A margin spanning the whole placement re-solves the dough from scratch around any broken biscuit
+    reoptimizer = Reoptimizer(dough, biscuits, placement, margin=len(placement))
+    value, placement = reoptimizer.add_defects(*late_defects(dough, 4, seed))
+    assert value == fresh_optimum(dough, biscuits)
+    assert full_fitness(dough, biscuits, placement) == value
+
+
+@pytest.mark.parametrize('count', [1, 4, Dough.INDEX_INSORT_LIMIT + 1])
+def test_defect_index_follows_added_defects(count):
+    dough = generate_roll(400, 0.5, seed=0)
+    dough.defect_index()
+    dough.add_defects(*late_defects(dough, count, count))
+    # Small batches are inserted in the index, larger ones drop it
+    assert (dough._defect_index is not None) == (count <= Dough.INDEX_INSORT_LIMIT)
+    dough.add_defect(7, 'b')
+    index = {defect_class: list(positions) for defect_class, positions in dough.defect_index().items()}
+    dough._defect_index = None
+    assert index == dough.defect_index()
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_patched_feasibility_table_matches_a_fresh_table(seed):
+    biscuits = default_biscuits()
+    dough = generate_roll(400, 1.0, seed=seed)
+    dough.feasibility(biscuits)
+    for step in range(3):
+        # Positions between cells, as read from a CSV file
+        dough.add_defects(*late_defects(dough, 5, 10 * seed + step))
+    fresh = FeasibilityTable(dough, biscuits)
+    patched = dough.feasibility(biscuits)
+    assert patched is not fresh
+    for biscuit_type in biscuits:
+        assert patched.row(biscuit_type) == fresh.row(biscuit_type)
@@ -0,0 +1,43 @@
+import pytest
+from Benchmark import GA_VARIANTS, generate_roll
+from IslandGA import IslandGA
+from Solvers import default_biscuits, solve_ga
+from helpers import full_fitness
+
+
+def run_variant(variant, seed, **kwargs):
+    dough = generate_roll(300, 1.0, seed=0)
+    with variant(dough, default_biscuits(), 20, 0.1, 0.7, seed=seed, **kwargs) as ga:
+        best_fitness, best_individual = ga.run(max_generations=5)
+        return best_fitness, list(best_individual), [list(individual) for individual in ga.population]
+
+
+@pytest.mark.parametrize('variant', list(GA_VARIANTS.values()))
+def test_same_seed_gives_the_same_run(variant):
+    assert run_variant(variant, 3) == run_variant(variant, 3)
+    # Population snapshots of two seeds differ
+    assert run_variant(variant, 3)[2] != run_variant(variant, 4)[2]
+
+
+@pytest.mark.parametrize('variant', list(GA_VARIANTS.values()))
+def test_same_seed_with_local_search_and_workers(variant):
+    assert run_variant(variant, 1, local_search='elites', workers=2) == run_variant(variant, 1, local_search='elites')
+
+
+def test_same_seed_through_solve_ga():
+    dough = generate_roll(300, 1.0, seed=0)
+    runs = [solve_ga(dough, default_biscuits(), population_size=20, max_generations=5, seed_solvers=['greedy'],
+                     seed_copies=3, seed=7) for _ in range(2)]
+    assert runs[0] == runs[1]
+
+
+def test_same_seed_gives_the_same_island_run():
+    dough = generate_roll(300, 1.0, seed=0)
+
+    def run(seed):
+        islands = IslandGA(dough, default_biscuits(), 10, 0.1, 0.7, islands=2, migration_interval=2, seed=seed)
+        return islands.run(max_generations=4)
+
+    best_fitness, best_individual = run(5)
+    assert run(5) == (best_fitness, best_individual)
+    assert full_fitness(dough, default_biscuits(), best_individual) == best_fitness
@@ -0,0 +1,71 @@
+from collections import Counter
+import random
+import numpy as np
+import pytest
+from Benchmark import generate_roll
+from Biscuit import Biscuit
+from Dough import Dough
+from GeneticAlgorithm import GeneticAlgorithm
+from SolutionSampler import SolutionSampler
+from Solvers import default_biscuits
+
+
+def test_filler_type_is_not_sampled():
+    dough = Dough.from_csv('defects.csv', 500)
+    standard = {biscuit_type: Biscuit(biscuit_type) for biscuit_type in range(4)}
+    with_filler = {**standard, 4: Biscuit(4)}
+    baseline = GeneticAlgorithm(dough, standard, 150, 0.05, 0.7, seed=0)
+    ga = GeneticAlgorithm(dough, with_filler, 150, 0.05, 0.7, seed=0)
+    assert ga.population == baseline.population
+    types = Counter(biscuit_type for individual in ga.population for _, biscuit_type in individual)
+    assert 4 not in types
+
+
+def test_custom_types_worth_placing_are_sampled():
+    dough = Dough(200)
+    biscuits = {0: Biscuit(0), 7: Biscuit(7, 3, 5, {'a': 1, 'b': 1, 'c': 1})}
+    ga = GeneticAlgorithm(dough, biscuits, 20, 0.05, 0.7, seed=0)
+    assert {biscuit_type for individual in ga.population for _, biscuit_type in individual} == {0, 7}
+
+
+def test_explicit_type_weights():
+    dough = Dough(200)
+    biscuits = {biscuit_type: Biscuit(biscuit_type) for biscuit_type in range(5)}
+    ga = GeneticAlgorithm(dough, biscuits, 20, 0.05, 0.7, seed=0, type_weights={4: 1})
+    assert {biscuit_type for individual in ga.population for _, biscuit_type in individual} == {4}
+
+
+def check_solution(table, biscuits, type_weights, individual):
+    '''
+    Check that a sampled solution is feasible, sorted without overlapping, and leaves no gap where a type fits.
+    '''
+    weighted_types = [biscuit_type for biscuit_type, weight in type_weights.items() if weight > 0]
+    end = 0
+    for position, biscuit_type in individual:
+        assert type_weights.get(biscuit_type, 0) > 0
+        assert table.is_valid(position, biscuit_type)
+        assert position >= end
+        assert not any(table.is_valid(gap, weighted) for gap in range(end, position) for weighted in weighted_types)
+        end = position + biscuits[biscuit_type].length
+    assert end <= table.length
+    assert not any(table.is_valid(gap, weighted) for gap in range(end, table.length) for weighted in weighted_types)
+
+
+@pytest.mark.parametrize('length, density, seed', [(300, 0.2, 0), (300, 3.0, 1), (500, 1.0, 2)])
+def test_sampled_solutions_are_feasible(length, density, seed):
+    biscuits = default_biscuits()
+    table = generate_roll(length, density, seed=seed).feasibility(biscuits)
+    type_weights = {3: 4, 0: 2, 1: 2, 2: 0}
+    sampler = SolutionSampler(table, biscuits, type_weights)
+    rng = random.Random(seed)
+    for _ in range(20):
+        check_solution(table, biscuits, type_weights, sampler.sample(rng))
+    for individual in sampler.sample_population(20, np.random.default_rng(seed)):
+        check_solution(table, biscuits, type_weights, individual)
+
+
+def test_sampling_a_dough_where_nothing_fits():
+    biscuits = default_biscuits()
+    sampler = SolutionSampler(Dough(1).feasibility(biscuits), biscuits, {3: 4, 0: 2, 1: 2, 2: 1})
+    assert sampler.sample() == []
+    assert sampler.sample_population(3) == [[], [], []]
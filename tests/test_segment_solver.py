@@ -0,0 +1,33 @@
+import pytest
+from Benchmark import generate_roll
+from DPSolver import DPSolver
+from SegmentSolver import SegmentSolver
+from Solvers import default_biscuits
+from helpers import full_fitness
+
+ROLLS = [(length, density, seed) for length, density in ((300, 0.2), (300, 1.0), (500, 3.0)) for seed in range(3)]
+
+
+@pytest.mark.parametrize('length, density, seed', ROLLS)
+def test_segment_solver_matches_the_optimum(length, density, seed):
+    biscuits = default_biscuits()
+    dough = generate_roll(length, density, seed=seed)
+    optimum, _ = DPSolver(dough, biscuits).solve()
+    value, placement = SegmentSolver(dough, biscuits, min_segment_length=16).solve()
+    assert value == optimum
+    assert full_fitness(dough, biscuits, placement) == optimum
+
+
+@pytest.mark.parametrize('length, density, seed', ROLLS[-3:])
+def test_no_feasible_biscuit_crosses_a_cut(length, density, seed):
+    biscuits = default_biscuits()
+    dough = generate_roll(length, density, seed=seed)
+    solver = SegmentSolver(dough, biscuits, min_segment_length=16)
+    table = dough.feasibility(biscuits)
+    for cut in solver.cut_points().tolist():
+        for biscuit_type, biscuit in biscuits.items():
+            for position in range(max(0, cut - biscuit.length + 1), cut):
+                assert not table.is_valid(position, biscuit_type)
+    segments = solver.segments()
+    assert segments[0][0] == 0 and segments[-1][1] == length
+    assert all(end == start for (_, end), (start, _) in zip(segments, segments[1:]))
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from Selection import (elite_indices, roulette_wheel_selection, selection_weights, stochastic_universal_sampling,
+                       tournament_selection)
+
+INF = float('-inf')
+PROPORTIONAL = [roulette_wheel_selection, stochastic_universal_sampling]
+
+
+def test_weights_shift_negative_values_and_drop_invalid_ones():
+    assert selection_weights([-5, -2, INF, 1]).tolist() == [0, 3, 0, 6]
+    assert selection_weights([4, INF, 1]).tolist() == [4, 0, 1]
+    assert selection_weights([INF, INF]).tolist() == [1, 1]
+    assert selection_weights([-3, -3]).tolist() == [1, 1]
+
+
+@pytest.mark.parametrize('select', PROPORTIONAL)
+def test_proportional_selection_skips_invalid_and_lowest(select):
+    rng = np.random.default_rng(0)
+    indices = select([-7, INF, -3, -1, INF], 1000, rng=rng)
+    counts = np.bincount(indices, minlength=5)
+    assert counts[0] == counts[1] == counts[4] == 0
+    # Weights 4 and 6 after the shift
+    assert 0.5 < counts[2] / counts[3] < 0.85
+
+
+@pytest.mark.parametrize('select', PROPORTIONAL)
+def test_proportional_selection_without_valid_individuals_is_uniform(select):
+    indices = select([INF] * 4, 400, rng=np.random.default_rng(0))
+    assert set(indices.tolist()) == {0, 1, 2, 3}
+
+
+def test_stochastic_universal_sampling_stays_near_the_expected_counts():
+    fitness_values = [1, 2, 3, 4, INF]
+    counts = np.bincount(stochastic_universal_sampling(fitness_values, 20, rng=np.random.default_rng(0)), minlength=5)
+    expected = np.array([2, 4, 6, 8, 0])
+    assert (np.abs(counts - expected) <= 1).all()
+    assert stochastic_universal_sampling(fitness_values, 0).tolist() == []
+
+
+def test_tournament_never_picks_an_invalid_individual_over_a_valid_one():
+    fitness_values = np.array([INF, -10, INF, -20, INF])
+    rng = np.random.default_rng(0)
+    contestants = rng.integers(0, 5, size=(500, 3))
+    winners = tournament_selection(fitness_values, 500, 3, rng=np.random.default_rng(0))
+    valid = np.isfinite(fitness_values[contestants]).any(axis=1)
+    assert np.isfinite(fitness_values[winners[valid]]).all()
+    assert (fitness_values[winners] == fitness_values[contestants].max(axis=1)).all()
+
+
+def test_elites_are_best_first_with_ties_in_population_order():
+    assert elite_indices([-1, INF, 5, -1, 5], 4).tolist() == [2, 4, 0, 3]
+    assert elite_indices([INF, INF], 1).tolist() == [0]
@@ -0,0 +1,41 @@
+import pytest
+from Benchmark import generate_roll
+from DPSolver import DPSolver
+from Solvers import default_biscuits
+from StreamingPlacer import StreamingPlacer
+from helpers import full_fitness
+
+ROLLS = [(length, density, seed) for length, density in ((300, 0.2), (300, 1.0), (500, 3.0)) for seed in range(3)]
+
+
+def stream(placer, dough):
+    placement = []
+    for position, defect_class in sorted(dough.defects_list):
+        placement.extend(placer.add_defect(position, defect_class))
+    placement.extend(placer.close(dough.LENGTH))
+    return placement
+
+
+@pytest.mark.parametrize('length, density, seed', ROLLS)
+def test_streaming_placer_matches_the_optimum(length, density, seed):
+    biscuits = default_biscuits()
+    dough = generate_roll(length, density, seed=seed)
+    optimum, _ = DPSolver(dough, biscuits).solve()
+    placer = StreamingPlacer(biscuits)
+    placement = stream(placer, dough)
+    assert placer.forced_commits == 0
+    assert placer.total_value == optimum
+    assert full_fitness(dough, biscuits, placement) == optimum
+
+
+@pytest.mark.parametrize('length, density, seed', ROLLS[-3:])
+def test_forced_commits_keep_an_exact_score(length, density, seed):
+    biscuits = default_biscuits()
+    dough = generate_roll(length, density, seed=seed)
+    placer = StreamingPlacer(biscuits, max_lag=8)
+    placement = stream(placer, dough)
+    assert placer.forced_commits > 0
+    assert placer.total_value == full_fitness(dough, biscuits, placement)
+    assert placer.total_value <= DPSolver(dough, biscuits).solve()[0]
+    with pytest.raises(ValueError):
+        StreamingPlacer(biscuits, max_lag=7)
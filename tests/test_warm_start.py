@@ -0,0 +1,26 @@
+import pytest
+from Benchmark import generate_roll
+from Greedy import HEURISTICS, greedy_biscuit_placement
+from Solvers import SOLVERS, default_biscuits, get_solver, solve_ga
+from helpers import full_fitness
+
+
+@pytest.mark.parametrize('heuristic', HEURISTICS)
+def test_every_greedy_ordering_is_registered(heuristic):
+    biscuits = default_biscuits()
+    dough = generate_roll(300, 1.0, seed=0)
+    value, placement = get_solver(f'greedy_{heuristic}')(dough, biscuits)
+    assert (value, placement) == greedy_biscuit_placement(dough, biscuits, heuristic)
+    assert full_fitness(dough, biscuits, placement) == value
+
+
+def test_ga_seeded_with_the_greedy_orderings():
+    biscuits = default_biscuits()
+    dough = generate_roll(300, 1.0, seed=0)
+    names = [name for name in SOLVERS if name.startswith('greedy_')]
+    assert len(names) == len(HEURISTICS)
+    greedy_best = max(get_solver(name)(dough, biscuits)[0] for name in names)
+    value, placement = solve_ga(dough, biscuits, population_size=20, max_generations=3, seed_solvers=names,
+                                seed_copies=2, seed=0)
+    assert value >= greedy_best
+    assert full_fitness(dough, biscuits, placement) == value